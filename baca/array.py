@@ -2,26 +2,16 @@
 Array.
 """
 
+import bisect
 import copy
+import dataclasses
+import itertools
 import numbers
 import typing
 
 import abjad
 
 
-def _get_leaf_offsets(argment):
-    offsets = []
-    for leaf in abjad.iterate.leaves(argment):
-        start_offset = abjad.get.timespan(leaf).start_offset
-        if start_offset not in offsets:
-            offsets.append(start_offset)
-        stop_offset = abjad.get.timespan(leaf).stop_offset
-        if stop_offset not in offsets:
-            offsets.append(stop_offset)
-    offsets.sort()
-    return list(abjad.math.difference_series(offsets))
-
-
 def _make_multiplied_quarter_notes(durations):
     notes = []
     written_duration = abjad.Duration(1, 4)
@@ -547,7 +537,7 @@ class PitchArray:
         return array
 
     @classmethod
-    def from_score(class_, score, populate=True):
+    def from_score(class_, score, populate=True, *, index=None):
         r"""
         Makes pitch array from ``score``.
 
@@ -672,13 +662,19 @@ class PitchArray:
             [c'     ] [d'     ]
             [c'] [d'     ] [e'] [c'] [d'     ] [e']
 
+        Reads slices from vertical-slice ``index`` of ``score`` when ``index`` is
+        not none.
+
         Returns pitch array.
         """
-        offsets = _get_leaf_offsets(score)
-        array_width = len(offsets)
+        if index is None:
+            index = VerticalSliceIndex(score)
+        array_width = len(index)
         array_depth = len(score)
         pitch_array = class_.from_counts(array_depth, array_width)
-        items = _make_multiplied_quarter_notes(offsets)
+        items = _make_multiplied_quarter_notes(
+            [_.stop_offset - _.start_offset for _ in index]
+        )
         for leaf_iterable, pitch_array_row in zip(score, pitch_array.rows):
             durations = []
             leaves = abjad.iterate.leaves(leaf_iterable)
@@ -2750,6 +2746,124 @@ class PitchArrayRow:
         return self
 
 
+@dataclasses.dataclass(frozen=True, slots=True)
+class VerticalSlice:
+    """
+    Vertical slice.
+    """
+
+    start_offset: abjad.Offset
+    stop_offset: abjad.Offset
+    leaves: tuple[abjad.Leaf, ...]
+
+
+class VerticalSliceIndex:
+    r"""
+    Vertical-slice index.
+
+    ..  container:: example
+
+        Sweeps the sorted start and stop offsets of leaves once, adding and removing
+        each leaf once; slices run from one offset to the next and hold every leaf
+        sounding during the slice:
+
+        >>> score = abjad.Score(name="Score")
+        >>> score.append(abjad.Staff("c'8 d'8 e'8 f'8", name="Staff_1"))
+        >>> score.append(abjad.Staff("c'4 d'4", name="Staff_2"))
+        >>> score.append(abjad.Staff("r8. g'16 a'4", name="Staff_3"))
+        >>> index = baca.array.VerticalSliceIndex(score)
+        >>> for slice_ in index:
+        ...     slice_.start_offset, slice_.stop_offset, slice_.leaves
+        ...
+        (Offset((0, 1)), Offset((1, 8)), (Note("c'8"), Note("c'4"), Rest('r8.')))
+        (Offset((1, 8)), Offset((3, 16)), (Note("d'8"), Note("c'4"), Rest('r8.')))
+        (Offset((3, 16)), Offset((1, 4)), (Note("d'8"), Note("c'4"), Note("g'16")))
+        (Offset((1, 4)), Offset((3, 8)), (Note("e'8"), Note("d'4"), Note("a'4")))
+        (Offset((3, 8)), Offset((1, 2)), (Note("f'8"), Note("d'4"), Note("a'4")))
+
+        >>> index.get(abjad.Offset(5, 16)).leaves
+        (Note("e'8"), Note("d'4"), Note("a'4"))
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ("_offsets", "_slices", "_start_offsets")
+
+    ### INITIALIZER ###
+
+    def __init__(self, argument):
+        leaves = abjad.select.leaves(argument)
+        events = []
+        for i, leaf in enumerate(leaves):
+            timespan = abjad.get.timespan(leaf)
+            # starts sort before stops so that leaves of no duration are removed
+            events.append((timespan.start_offset, 0, i))
+            events.append((timespan.stop_offset, 1, i))
+        events.sort()
+        offsets: list[abjad.Offset] = []
+        slice_leaves: list[tuple] = []
+        active: dict[int, abjad.Leaf] = {}
+        for offset, group in itertools.groupby(events, key=lambda _: _[0]):
+            for _, stop, i in group:
+                if stop:
+                    del active[i]
+                else:
+                    active[i] = leaves[i]
+            offsets.append(offset)
+            slice_leaves.append(tuple(active[_] for _ in sorted(active)))
+        self._offsets = offsets
+        self._slices = [
+            VerticalSlice(offsets[i], offsets[i + 1], slice_leaves[i])
+            for i in range(len(offsets) - 1)
+        ]
+        components = abjad.select.components(argument)
+        self._start_offsets = set(
+            abjad.get.timespan(_).start_offset for _ in components
+        )
+
+    ### SPECIAL METHODS ###
+
+    def __getitem__(self, argument):
+        """
+        Gets slice or slices identified by ``argument``.
+        """
+        return self._slices.__getitem__(argument)
+
+    def __iter__(self):
+        """
+        Iterates slices.
+        """
+        return iter(self._slices)
+
+    def __len__(self):
+        """
+        Gets number of slices.
+        """
+        return len(self._slices)
+
+    ### PUBLIC METHODS ###
+
+    def get(self, offset):
+        """
+        Gets slice sounding at ``offset``; returns none when no slice sounds.
+        """
+        i = bisect.bisect_right(self._offsets, offset) - 1
+        if 0 <= i < len(self._slices):
+            return self._slices[i]
+        return None
+
+    def moments(self):
+        """
+        Iterates slices that start when some component starts.
+
+        Gives the offsets and leaves of ``abjad.iterate_vertical_moments()``.
+        """
+        for slice_ in self._slices:
+            if slice_.start_offset in self._start_offsets:
+                yield slice_
+
+
 def pitch_arrays_to_score(pitch_arrays) -> abjad.Score:
     r"""
     Makes score from pitch arrays.
@@ -2,35 +2,59 @@
 Build.
 """
 
+import asyncio
+import concurrent.futures
+import contextlib
 import dataclasses
 import functools
+import hashlib
+import json
 import os
 import pathlib
+import re
 import shutil
+import subprocess
 import sys
+import tempfile
 import time
+import traceback
 import types
 
 import abjad
 import baca
-
-
-def _call_lilypond_on_music_ly_in_section(music_ly, music_pdf_mtime):
-    music_pdf = music_ly.with_name("music.pdf")
-    with abjad.Timer() as timer:
-        run_lilypond(music_ly, pdf_mtime=music_pdf_mtime)
-        music_ly_pdf = music_ly.parent / "music.ly.pdf"
-        if music_ly_pdf.is_file():
-            shutil.move(str(music_ly_pdf), str(music_pdf))
-    _music_ly_log = "." + music_ly.name + ".log"
-    _music_ly_log = music_ly.parent / _music_ly_log
-    _remove_lilypond_warnings(
-        _music_ly_log,
-        crescendo_too_small=True,
-        decrescendo_too_small=True,
-        overwriting_glissando=True,
-    )
-    return int(timer.elapsed_time)
+import baca._version
+
+from .timing import _TIMING, Timing, phase
+
+
+def _build_part_in_worker(part_directory, debug_sections):
+    # LilyPond and TeX subprocesses write to file descriptors 1 and 2, not to
+    # sys.stdout; redirect descriptors so output of parallel parts does not interleave
+    returncode = 0
+    sys.stdout.flush()
+    sys.stderr.flush()
+    saved_descriptors = [os.dup(1), os.dup(2)]
+    with tempfile.TemporaryFile(mode="a+") as file_pointer:
+        os.dup2(file_pointer.fileno(), 1)
+        os.dup2(file_pointer.fileno(), 2)
+        stdout = open(1, "w", buffering=1, closefd=False)
+        try:
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stdout):
+                try:
+                    build_part(part_directory, debug_sections, sections_collected=True)
+                except SystemExit as e:
+                    returncode = e.code if isinstance(e.code, int) and e.code else 1
+                except Exception:
+                    traceback.print_exc()
+                    returncode = 1
+        finally:
+            stdout.flush()
+            for descriptor, saved_descriptor in zip((1, 2), saved_descriptors):
+                os.dup2(saved_descriptor, descriptor)
+                os.close(saved_descriptor)
+        file_pointer.seek(0)
+        output = file_pointer.read()
+    return returncode, output
 
 
 def _display_lilypond_log_errors(lilypond_log_file_path):
@@ -39,11 +63,7 @@ def _display_lilypond_log_errors(lilypond_log_file_path):
         lines = file_pointer.readlines()
     error = False
     for line in lines:
-        if (
-            "fatal" in line
-            or ("error" in line and "programming error" not in line)
-            or "failed" in line
-        ):
+        if _is_lilypond_error_line(line):
             print_always("ERROR IN LILYPOND LOG FILE ...")
             error = True
             break
@@ -52,17 +72,17 @@ def _display_lilypond_log_errors(lilypond_log_file_path):
             print_always(line)
 
 
-def _externalize_music_ly(music_ly):
+def _externalize_music_ly(music_ly, string=None):
     music_ily = music_ly.with_name("music.ily")
     print_file_handling(f"Externalizing {baca.path.trim(music_ly)} ...")
-    baca.path.extern(music_ly, music_ily)
+    baca.path.extern(music_ly, music_ily, text=string)
     assert music_ily.is_file()
     assert music_ily.parent.parent.name == "sections"
     for file in (music_ly, music_ily):
-        text = file.read_text()
         messages = []
+        text = baca.tags.TagPipeline.from_path(file)
         text = baca.tags.not_topmost(text, messages)
-        file.write_text(text)
+        text.run()
         if messages:
             messages = "\n".join(messages) + "\n"
             print_file_handling(
@@ -73,6 +93,26 @@ def _externalize_music_ly(music_ly):
                 pointer.write(messages)
 
 
+def _flatten_phases(phases, prefix=""):
+    result = {}
+    for phase_ in phases:
+        name = prefix + phase_["name"]
+        result[name] = result.get(name, 0) + phase_["milliseconds"]
+        result.update(_flatten_phases(phase_["phases"], prefix=name + "/"))
+    return result
+
+
+def _get_lilypond_path():
+    lilypond_path = abjad.io.configuration.get("lilypond_path")
+    if not lilypond_path:
+        lilypond_paths = abjad.io.find_executable("lilypond")
+        if lilypond_paths:
+            lilypond_path = str(lilypond_paths[0])
+        else:
+            lilypond_path = "lilypond"
+    return lilypond_path
+
+
 def _get_preamble_page_count_overview(path):
     assert path.is_file(), repr(path)
     first_page_number, page_count = 1, None
@@ -113,6 +153,197 @@ def _get_preamble_time_signatures(path):
     return None
 
 
+def _get_section_cache_directory(section_directory):
+    contents_directory = baca.path.get_contents_directory(section_directory)
+    return contents_directory / ".cache" / "sections" / section_directory.name
+
+
+def _get_section_cache_key(section_directory, arguments, *, project=None):
+    if project is None:
+        project = baca.path.get_score_project(section_directory)
+    contents_directory = project.contents_directory
+    paths = [
+        section_directory / "music.py",
+        section_directory / "layout.ly",
+        section_directory / "layout.py",
+    ]
+    previous_section = project.previous_section(section_directory)
+    if previous_section:
+        paths.append(previous_section / ".metadata")
+    paths.extend(sorted(contents_directory.glob("stylesheets/**/*")))
+    for path in sorted(contents_directory.glob("**/*.py")):
+        parts = path.relative_to(contents_directory).parts
+        if parts[0] != "sections" and not parts[0].startswith("."):
+            paths.append(path)
+    packages = (pathlib.Path(abjad.__file__).parent, pathlib.Path(baca.__file__).parent)
+    for package in packages:
+        paths.extend(sorted(package.glob("scm/**/*")))
+    hash_ = hashlib.sha256()
+    hash_.update(f"abjad {abjad.__version__}\n".encode())
+    hash_.update(f"baca {baca._version.__version__}\n".encode())
+    # versions do not change when editable installs change; hash source mtimes too
+    for package in packages:
+        for path in sorted(package.glob("**/*.py")):
+            stat = path.stat()
+            hash_.update(f"{path} {stat.st_mtime_ns} {stat.st_size}\n".encode())
+    for name in SECTION_CACHE_ARGUMENTS:
+        value = getattr(arguments, name, False)
+        hash_.update(f"{name} {value}\n".encode())
+    for path in paths:
+        if path.is_dir():
+            continue
+        hash_.update(f"{path.name}\n".encode())
+        if path.is_file():
+            hash_.update(path.read_bytes())
+    return hash_.hexdigest()
+
+
+def _get_section_collection_key(_sections_directory):
+    project = baca.path.get_score_project(_sections_directory)
+    section_directories = project.section_directories
+    metadata = baca.path.get_metadata(_sections_directory.parent)
+    dictionary = {
+        "abjad": abjad.__version__,
+        "baca": baca._version.__version__,
+        "bol_measure_numbers": metadata.get("bol_measure_numbers"),
+        "final_measure_number": metadata.get("final_measure_number"),
+        "final_section": section_directories[-1].name,
+    }
+    return json.dumps(dictionary, sort_keys=True)
+
+
+def _get_tex_input_hashes(tex, hashes=None):
+    if hashes is None:
+        hashes = {}
+    hashes[str(tex)] = _hash_file(tex)
+    if not tex.is_file():
+        return hashes
+    text = "\n".join(_.split("%")[0] for _ in tex.read_text().splitlines())
+    for match in _TEX_INPUT_REGEX.finditer(text):
+        path = tex.parent / match.group(2).strip()
+        if not path.suffix:
+            for suffix in (".tex", ".pdf", ".png", ".jpg"):
+                if path.with_suffix(suffix).is_file():
+                    path = path.with_suffix(suffix)
+                    break
+        if str(path) in hashes:
+            continue
+        if path.suffix == ".tex":
+            _get_tex_input_hashes(path, hashes)
+        else:
+            hashes[str(path)] = _hash_file(path)
+    return hashes
+
+
+def _get_timing_directory(directory, value=True):
+    if isinstance(value, str):
+        return pathlib.Path(value)
+    if os.environ.get("BACA_TIMING_DIRECTORY"):
+        return pathlib.Path(os.environ["BACA_TIMING_DIRECTORY"])
+    contents_directory = baca.path.get_contents_directory(directory)
+    return contents_directory / ".cache" / "timing"
+
+
+def _handle_build_file_tags(file, bol_measure_numbers, final_measure_number, final):
+    start = time.perf_counter()
+    match_left_broken_should_deactivate = baca.tags.all_of(
+        baca.tags.LEFT_BROKEN, baca.tags.SPANNER_START
+    ) | baca.tags.all_of(
+        baca.tags.LEFT_BROKEN, baca.tags.SPANNER_STOP, baca.tags.EXPLICIT_DYNAMIC
+    )
+    match_anchor_should_activate = baca.tags.any_of(
+        baca.tags.ANCHOR_NOTE, baca.tags.ANCHOR_SKIP
+    ) & baca.tags.any_of(
+        baca.tags.ONE_VOICE_COMMAND,
+        baca.tags.SHOW_TO_JOIN_BROKEN_SPANNERS,
+        baca.tags.SPANNER_STOP,
+    )
+    match_anchor_should_deactivate = baca.tags.any_of(
+        baca.tags.ANCHOR_NOTE, baca.tags.ANCHOR_SKIP
+    ) & (
+        baca.tags.all_of(baca.tags.SPANNER_START, baca.tags.LEFT_BROKEN)
+        | baca.tags.all_of(baca.tags.SPANNER_STOP, baca.tags.RIGHT_BROKEN)
+        | baca.tags.any_of(baca.tags.HIDE_TO_JOIN_BROKEN_SPANNERS)
+    )
+    messages = []
+    assert "sections" not in file.parts
+    assert "builds" in file.parts
+    if "-score" in str(file):
+        my_name = "SCORE"
+    else:
+        assert "-parts" in str(file)
+        my_name = "PARTS"
+    text = baca.tags.TagPipeline.from_path(file)
+    text = baca.tags.handle_edition_tags(text, messages, "_sections", my_name)
+    text = baca.tags.handle_fermata_bar_lines(
+        text, messages, bol_measure_numbers, final_measure_number
+    )
+    text = baca.tags.handle_shifted_clefs(text, messages, bol_measure_numbers)
+    text = baca.tags.handle_mol_tags(
+        text, messages, bol_measure_numbers, final_measure_number
+    )
+    build = "builds" in file.parts
+    text = baca.tags.color_persistent_indicators(text, messages, build, undo=True)
+    text = baca.tags.show_music_annotations(text, messages, undo=True)
+    text = baca.tags.join_broken_spanners(text, messages)
+    text = baca.tags.show_tag(
+        text,
+        "left-broken-should-deactivate",
+        messages,
+        match=match_left_broken_should_deactivate,
+        undo=True,
+    )
+    if not final:
+        text = baca.tags.show_tag(text, baca.tags.ANCHOR_NOTE, messages)
+        text = baca.tags.show_tag(text, baca.tags.ANCHOR_SKIP, messages)
+        text = baca.tags.show_tag(
+            text,
+            baca.tags.ANCHOR_NOTE,
+            messages,
+            prepend_empty_chord=True,
+            undo=True,
+        )
+        text = baca.tags.show_tag(
+            text,
+            baca.tags.ANCHOR_SKIP,
+            messages,
+            prepend_empty_chord=True,
+            undo=True,
+        )
+        text = baca.tags.show_tag(
+            text,
+            "anchor-should-activate",
+            messages,
+            match=match_anchor_should_activate,
+        )
+        text = baca.tags.show_tag(
+            text,
+            "anchor-should-deactivate",
+            messages,
+            match=match_anchor_should_deactivate,
+            undo=True,
+        )
+        text = baca.tags.show_tag(
+            text,
+            baca.tags.EOS_STOP_MM_SPANNER,
+            messages,
+        )
+    text = baca.tags.show_tag(
+        text,
+        baca.tags.METRIC_MODULATION_IS_STRIPPED,
+        messages,
+        undo=True,
+    )
+    text = baca.tags.show_tag(
+        text,
+        baca.tags.METRIC_MODULATION_IS_SCALED,
+        messages,
+        undo=True,
+    )
+    text.run()
+    return messages, 1000 * (time.perf_counter() - start)
+
+
 def _handle_section_tags(section_directory):
     assert section_directory.is_dir()
     print_file_handling("Writing section tag files ...")
@@ -132,7 +363,7 @@ def _handle_section_tags(section_directory):
         )
         _tags_file = music_ly.with_name(f".{name}.tags")
         messages = []
-        text = path.read_text()
+        text = baca.tags.TagPipeline.from_path(path)
         text = baca.tags.handle_edition_tags(
             text, messages, section_directory.name, "SECTION"
         )
@@ -143,7 +374,7 @@ def _handle_section_tags(section_directory):
         text = baca.tags.handle_mol_tags(
             text, messages, bol_measure_numbers, final_measure_number
         )
-        path.write_text(text)
+        text.run()
         print_file_handling(
             f"Appending {baca.path.trim(_tags_file)} ...", log_only=True
         )
@@ -152,47 +383,78 @@ def _handle_section_tags(section_directory):
             pointer.write(text)
 
 
-def _log_timing(section_directory, timing):
-    if "trevor" not in str(section_directory):
-        return
-    _timing = section_directory / ".timing"
-    parts = []
-    for part in _timing.parts:
-        if part == os.path.sep:
-            pass
-        elif part == "Scores":
-            parts.append("_timing")
-        else:
-            parts.append(part)
-    _timing_repo = "/" + os.path.sep.join(parts)
-    _timing_repo = pathlib.Path(_timing_repo)
-    if not _timing_repo.parent.is_dir():
-        _timing_repo.parent.mkdir(parents=True)
-    print_file_handling(f"Writing {baca.path.trim(_timing_repo)} ...", log_only=True)
-    with _timing_repo.open(mode="a") as pointer:
-        pointer.write("\n")
-        line = time.strftime("%Y-%m-%d %H:%M:%S") + "\n"
-        pointer.write(line)
-        python_runtime = timing.make_score + timing.postprocess_score
-        counter = abjad.string.pluralize("second", python_runtime)
-        line = f"Python runtime: {python_runtime} {counter}\n"
-        pointer.write(line)
-        counter = abjad.string.pluralize("second", timing.make_score)
-        line = f"  make_score(): {timing.make_score} {counter}\n"
-        pointer.write(line)
-        counter = abjad.string.pluralize("second", timing.postprocess_score)
-        line = f"  postprocess_score(): {timing.postprocess_score} {counter}\n"
-        pointer.write(line)
-        counter = abjad.string.pluralize("second", timing.lilypond)
-        line = f"LilyPond runtime: {timing.lilypond} {counter}\n"
-        pointer.write(line)
+def _hash_file(path):
+    if not path.is_file():
+        return None
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _is_lilypond_error_line(line):
+    if "fatal" in line:
+        return True
+    if "error" in line and "programming error" not in line:
+        return True
+    if "failed" in line:
+        return True
+    return False
+
+
+def _is_lilypond_fatal_line(line):
+    if "fatal" in line:
+        return True
+    if "GUILE signaled an error" in line:
+        return True
+    return False
+
+
+def _log_timing(section_directory, timing, directory=True):
+    timing_directory = _get_timing_directory(section_directory, directory)
+    timing_directory.mkdir(parents=True, exist_ok=True)
+    dictionary = {
+        "name": section_directory.name,
+        "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "phases": timing.to_list(),
+    }
+    path = timing_directory / f"{section_directory.name}.json"
+    print_file_handling(f"Writing {baca.path.trim(path)} ...", log_only=True)
+    baca.path.write_text(path, json.dumps(dictionary, indent=4) + "\n")
+    history = timing_directory / "history.jsonl"
+    with history.open(mode="a") as pointer:
+        pointer.write(json.dumps(dictionary) + "\n")
+
+
+def _make_part_ly(part_directory):
+    music_ly = part_directory / "music.ly"
+    text = music_ly.read_text()
+    if '"../_sections/' not in text:
+        print_error(f"No ../_sections/ includes in {baca.path.trim(music_ly)} ...")
+        sys.exit(1)
+    text = text.replace('"../_sections/', '"_sections/')
+    part_ly = part_directory / "_part.ly"
+    part_ly.write_text(text)
+    return part_ly
+
+
+def _make_part_sections_view(part_directory):
+    _sections_directory = part_directory.parent / "_sections"
+    view_directory = part_directory / "_sections"
+    if view_directory.exists():
+        shutil.rmtree(str(view_directory))
+    view_directory.mkdir()
+    for source in sorted(_sections_directory.glob("*ly")):
+        target = view_directory / source.name
+        try:
+            os.link(source, target)
+        except OSError:
+            shutil.copyfile(str(source), str(target))
+    return view_directory
 
 
 def _make_section_clicktrack(lilypond_file, mtime, section_directory):
     metadata = baca.path.get_metadata(section_directory)
     if metadata.get("first_metronome_mark") is False:
         print_main_task("Skipping clicktrack ...")
-        return
+        return None
     print_main_task("Making clicktrack ...")
     clicktrack_file_name = "clicktrack.midi"
     clicktrack_path = section_directory / clicktrack_file_name
@@ -201,15 +463,10 @@ def _make_section_clicktrack(lilypond_file, mtime, section_directory):
             f"Existing {baca.path.trim(clicktrack_path)} ...", log_only=True
         )
     global_skips = lilypond_file["Skips"]
-    time_signatures = []
-    for skip in global_skips[:-1]:
-        time_signature = abjad.get.effective(skip, abjad.TimeSignature)
-        time_signatures.append(time_signature)
     skips = abjad.select.leaves(global_skips)[:-1]
-    metronome_marks = []
-    for skip in skips:
-        metronome_mark = abjad.get.effective(skip, abjad.MetronomeMark)
-        metronome_marks.append(metronome_mark)
+    tempo_map = baca.section.TempoMap(skips)
+    time_signatures = list(tempo_map.time_signatures)
+    metronome_marks = list(tempo_map.metronome_marks)
     if metronome_marks[0] is None:
         for metronome_mark in metronome_marks:
             if metronome_mark is not None:
@@ -255,26 +512,28 @@ def _make_section_clicktrack(lilypond_file, mtime, section_directory):
         staff.append(measure)
     score_block = abjad.Block("score", [score, abjad.Block("midi")])
     lilypond_file = abjad.LilyPondFile([score_block])
-    print_file_handling(f"Writing {baca.path.trim(clicktrack_path)} ...")
-    abjad.persist.as_midi(lilypond_file, clicktrack_file_name)
     ly_path = section_directory / "clicktrack.ly"
-    if ly_path.exists():
-        ly_path.unlink()
-    if clicktrack_path.is_file():
-        mtime_ = os.path.getmtime(clicktrack_path)
-        if mtime is not None and mtime < mtime_:
-            print_success(f"Modified {baca.path.trim(clicktrack_path)} ...")
-        else:
-            print_success(f"Found {baca.path.trim(clicktrack_path)} ...")
-    else:
-        print_error(f"Can not find {baca.path.trim(clicktrack_path)} ...")
+    abjad.persist.as_ly(lilypond_file, ly_path)
+
+    def finish(result):
+        print_file_handling(f"Writing {baca.path.trim(clicktrack_path)} ...")
+        if ly_path.exists():
+            ly_path.unlink()
+        if result.log is not None and result.log.exists():
+            if result.status == "error":
+                shutil.move(result.log, section_directory / ".clicktrack.midi.log")
+            else:
+                result.log.unlink()
+        _print_artifact_status(clicktrack_path, mtime)
+
+    return ly_path, finish
 
 
 def _make_section_midi(lilypond_file, mtime, section_directory):
     metadata = baca.path.get_metadata(section_directory)
     if metadata.get("first_metronome_mark") is False:
         print_main_task("Skipping MIDI ...")
-        return
+        return None
     print_main_task("Making MIDI ...")
     music_midi = section_directory / "music.midi"
     if music_midi.exists():
@@ -282,41 +541,38 @@ def _make_section_midi(lilypond_file, mtime, section_directory):
     score = lilypond_file["Score"]
     score_block = abjad.Block("score", [score, abjad.Block("midi")])
     lilypond_file = abjad.LilyPondFile([score_block])
-    tmp_midi = section_directory / "tmp.midi"
-    print_file_handling(f"Writing {baca.path.trim(music_midi)} ...")
-    abjad.persist.as_midi(lilypond_file, tmp_midi)
-    if tmp_midi.is_file():
-        shutil.move(tmp_midi, music_midi)
-    tmp_ly = tmp_midi.with_suffix(".ly")
-    if tmp_ly.exists():
-        tmp_ly.unlink()
-    if music_midi.is_file():
-        mtime_ = os.path.getmtime(music_midi)
-        if mtime is not None and mtime < mtime_:
-            print_success(f"Modified {baca.path.trim(music_midi)} ...")
-        else:
-            print_success(f"Found {baca.path.trim(music_midi)} ...")
-    else:
-        print_error(f"Can not find {baca.path.trim(music_midi)} ...")
+    tmp_ly = section_directory / "tmp.ly"
+    abjad.persist.as_ly(lilypond_file, tmp_ly)
+
+    def finish(result):
+        print_file_handling(f"Writing {baca.path.trim(music_midi)} ...")
+        tmp_midi = tmp_ly.with_suffix(".midi")
+        if tmp_midi.is_file():
+            shutil.move(tmp_midi, music_midi)
+        if tmp_ly.exists():
+            tmp_ly.unlink()
+        if result.log is not None and result.log.exists():
+            if result.status == "error":
+                shutil.move(result.log, section_directory / ".music.midi.log")
+            else:
+                result.log.unlink()
+        _print_artifact_status(music_midi, mtime)
+
+    return tmp_ly, finish
 
 
 def _make_section_pdf(
     lilypond_file,
     music_pdf_mtime,
     section_directory,
-    timing,
     *,
     also_untagged=False,
-    log_timing=False,
-    print_timing=False,
 ):
     print_main_task("Making PDF ...")
     music_ly = section_directory / "music.ly"
     music_pdf = section_directory / "music.pdf"
-    music_ly_mtime = os.path.getmtime(music_ly) if music_ly.is_file() else 0
-    abjad.persist.as_ly(lilypond_file, music_ly, tags=True)
-    if music_ly.is_file() and music_ly_mtime < os.path.getmtime(music_ly):
-        print_file_handling(f"Writing {baca.path.trim(music_ly)} ...")
+    with phase("format_music_ly"):
+        string = abjad.lilypond(lilypond_file, tags=True) + "\n"
     print_file_handling("Removing section tag files ...")
     _layout_ly_tags = music_ly.with_name(".layout.ly.tags")
     if _layout_ly_tags.exists():
@@ -327,8 +583,10 @@ def _make_section_pdf(
     _music_ly_tags = music_ly.with_name(".music.ly.tags")
     if _music_ly_tags.exists():
         _music_ly_tags.unlink()
-    _externalize_music_ly(music_ly)
-    _handle_section_tags(section_directory)
+    print_file_handling(f"Writing {baca.path.trim(music_ly)} ...")
+    _externalize_music_ly(music_ly, string)
+    with phase("handle_section_tags"):
+        _handle_section_tags(section_directory)
     contents_directory = baca.path.get_contents_directory(section_directory)
     metadata = baca.path.get_metadata(contents_directory)
     do_not_populate_remote_repos = metadata.get("do_not_populate_remote_repos")
@@ -338,16 +596,74 @@ def _make_section_pdf(
     _remove_function_name_comments(section_directory)
     if music_pdf.is_file():
         print_file_handling(f"Existing {baca.path.trim(music_pdf)} ...", log_only=True)
-    timing.lilypond = _call_lilypond_on_music_ly_in_section(
-        music_ly,
-        music_pdf_mtime,
-    )
-    if print_timing:
-        print_all_timing(timing)
-    if log_timing:
-        _log_timing(section_directory, timing)
-    if also_untagged is True and not do_not_populate_remote_repos:
-        _populate_untagged_repository(section_directory)
+
+    def finish(result):
+        _display_lilypond_log_errors(result.log)
+        _print_artifact_status(music_pdf, music_pdf_mtime)
+        if also_untagged is True and not do_not_populate_remote_repos:
+            _populate_untagged_repository(section_directory)
+
+    return music_ly, finish
+
+
+def _parse_part_identifier(path):
+    if path.suffix == ".ly":
+        part_identifier = None
+        with path.open("r") as pointer:
+            for line in pointer.readlines():
+                if line.startswith("% part_identifier = "):
+                    line = line.strip("% part_identifier = ")
+                    part_identifier = eval(line)
+                    return part_identifier
+    elif path.name.endswith("layout.py"):
+        part_identifier = None
+        with path.open("r") as pointer:
+            for line in pointer.readlines():
+                if line.startswith("part_identifier = "):
+                    line = line.strip("part_identifier = ")
+                    part_identifier = eval(line)
+                    return part_identifier
+    else:
+        raise TypeError(path)
+
+
+def _persist_lilypond_file(arguments, section_directory, timing, lilypond_file):
+    jobs = []
+    if arguments.clicktrack:
+        path = section_directory / "clicktrack.midi"
+        mtime = os.path.getmtime(path) if path.is_file() else None
+        jobs.append(_make_section_clicktrack(lilypond_file, mtime, section_directory))
+    if arguments.midi:
+        path = section_directory / "music.midi"
+        mtime = os.path.getmtime(path) if path.is_file() else None
+        jobs.append(_make_section_midi(lilypond_file, mtime, section_directory))
+    if arguments.pdf:
+        path = section_directory / "music.pdf"
+        mtime = os.path.getmtime(path) if path.is_file() else None
+        jobs.append(
+            _make_section_pdf(
+                lilypond_file,
+                mtime,
+                section_directory,
+                also_untagged=arguments.also_untagged,
+            )
+        )
+    jobs = [_ for _ in jobs if _ is not None]
+    for ly_path, _ in jobs:
+        string = f"Calling LilyPond (with includes) on {baca.path.trim(ly_path)} ..."
+        print_file_handling(string)
+    with timing.phase("lilypond"):
+        results = run_lilypond_jobs([_[0] for _ in jobs], batch_size=1)
+        for (ly_path, _), result in zip(jobs, results):
+            timing.record(ly_path.name, 1000 * result.elapsed_time)
+    for (ly_path, finish), result in zip(jobs, results):
+        counter = abjad.string.pluralize("second", int(result.elapsed_time))
+        print_file_handling(
+            f"Rendered {baca.path.trim(ly_path)} in"
+            f" {int(result.elapsed_time)} {counter} ...",
+            log_only=True,
+        )
+        finish(result)
 
 
 def _populate_verbose_repository(section_directory):
@@ -376,6 +692,15 @@ def _populate_verbose_repository(section_directory):
         _untagged.write_text(string)
 
 
+def _populate_builds_repository(_sections_directory):
+    print_main_task("Populating _builds repository ...")
+    parts = list(_sections_directory.parts)
+    assert parts[3] == "Scores"
+    parts[3] = "_builds"
+    _builds_sections_directory = os.sep + os.sep.join(parts[1:])
+    shutil.copytree(_sections_directory, _builds_sections_directory, dirs_exist_ok=True)
+
+
 def _populate_untagged_repository(section_directory):
     if os.environ.get("GITHUB_WORKSPACE"):
         return
@@ -459,6 +784,33 @@ def _populate_untagged_repository(section_directory):
         shutil.move(safekeeping, tagged)
 
 
+def _print_artifact_status(path, mtime):
+    if path.is_file():
+        if mtime is not None and mtime < os.path.getmtime(path):
+            print_success(f"Modified {baca.path.trim(path)} ...")
+        else:
+            print_success(f"Found {baca.path.trim(path)} ...")
+    else:
+        print_error(f"Can not find {baca.path.trim(path)} ...")
+
+
+def _print_lilypond_progress(ly_path, line):
+    print_file_handling(f"{line.split('...')[0]} ...")
+
+
+def _prune_section_cache(cache_directory):
+    entries = [_ for _ in cache_directory.iterdir() if _.is_dir()]
+    entries = [_ for _ in entries if not _.name.startswith(".")]
+    entries.sort(key=lambda _: os.path.getmtime(_), reverse=True)
+    for entry in entries[SECTION_CACHE_SIZE:]:
+        shutil.rmtree(entry)
+
+
+def _read_previous_metadata_keys(section_directory):
+    metadata = baca.path.get_metadata(section_directory)
+    return {_: metadata.get(_) for _ in PREVIOUS_METADATA_KEYS}
+
+
 def _remove_function_name_comments(section_directory):
     print_file_handling("Removing function name comments ...")
     for name in ("music.ly", "music.ily", "layout.ly"):
@@ -486,23 +838,13 @@ def _remove_lilypond_warnings(
     overwriting_glissando=None,
 ):
     assert path.name.endswith(".log"), repr(path)
-    lines = []
-    skip = 0
+    keep = _LilyPondWarningFilter(
+        crescendo_too_small=bool(crescendo_too_small),
+        decrescendo_too_small=bool(decrescendo_too_small),
+        overwriting_glissando=bool(overwriting_glissando),
+    )
     with open(path) as pointer:
-        for line in pointer.readlines():
-            if 0 < skip:
-                skip -= 1
-                continue
-            if crescendo_too_small and "crescendo too small" in line:
-                skip = 2
-                continue
-            if decrescendo_too_small and "decrescendo too small" in line:
-                skip = 2
-                continue
-            if overwriting_glissando and "overwriting glissando" in line:
-                skip = 1
-                continue
-            lines.append(line)
+        lines = [_ for _ in pointer.readlines() if keep(_)]
     text = "".join(lines)
     path.write_text(text)
 
@@ -516,6 +858,167 @@ def _remove_site_comments(section_directory):
         remove_site_comments(tagged)
 
 
+def _restore_section_cache(section_directory, key):
+    cache_directory = _get_section_cache_directory(section_directory)
+    entry = cache_directory / key
+    if not entry.is_dir():
+        return False
+    print_main_task(f"Restoring {baca.path.trim(section_directory)} from cache ...")
+    for source in sorted(entry.iterdir()):
+        target = section_directory / source.name
+        print_file_handling(f"Restoring {baca.path.trim(target)} ...", log_only=True)
+        shutil.copyfile(source, target)
+    os.utime(entry)
+    return True
+
+
+async def _run_lilypond_batch(ly_paths, *, progress=None):
+    directory = ly_paths[0].parent
+    assert all(_.parent == directory for _ in ly_paths), repr(ly_paths)
+    name_to_ly_path = {_.name: _ for _ in ly_paths}
+    results = {_: LilyPondResult(ly=_) for _ in ly_paths}
+    ly_path_to_lines = {_: [] for _ in ly_paths}
+    ly_path_to_filter = {
+        _: _LilyPondWarningFilter(
+            crescendo_too_small=True,
+            decrescendo_too_small=True,
+            overwriting_glissando=True,
+        )
+        for _ in ly_paths
+    }
+    command = [_get_lilypond_path()]
+    command.extend(get_includes().split())
+    command.append("-dno-point-and-click")
+    command.append(f"--output={directory}")
+    command.extend(_.name for _ in ly_paths)
+    date = time.strftime("%c")
+    start_time = time.time()
+    state = types.SimpleNamespace(
+        aborted_ly_path=None, current_ly_path=None, previous_time=start_time
+    )
+    process = await asyncio.create_subprocess_exec(
+        *command,
+        cwd=directory,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+
+    def handle(line):
+        if line.startswith("Processing `"):
+            name = line.removeprefix("Processing `").strip().removesuffix("'")
+            ly_path = name_to_ly_path.get(pathlib.Path(name).name)
+            if ly_path is not None:
+                now = time.time()
+                if state.current_ly_path is not None:
+                    elapsed_time = now - state.previous_time
+                    results[state.current_ly_path].elapsed_time = elapsed_time
+                    state.previous_time = now
+                state.current_ly_path = ly_path
+        ly_path = state.current_ly_path or ly_paths[0]
+        if not ly_path_to_filter[ly_path](line):
+            return
+        ly_path_to_lines[ly_path].append(line)
+        if _is_lilypond_error_line(line):
+            results[ly_path].errors.append(line)
+        if _is_lilypond_fatal_line(line) and state.aborted_ly_path is None:
+            state.aborted_ly_path = ly_path
+            print_error(f"Aborting LilyPond on {baca.path.trim(ly_path)} ...")
+            print_error(line.rstrip())
+            if process.returncode is None:
+                try:
+                    process.kill()
+                except ProcessLookupError:
+                    pass
+        elif progress is not None and line.startswith(LILYPOND_PROGRESS_PREFIXES):
+            progress(ly_path, line.strip())
+
+    async def read(stream):
+        async for line in stream:
+            handle(line.decode(errors="ignore"))
+
+    await asyncio.gather(read(process.stdout), read(process.stderr))
+    await process.wait()
+    if state.current_ly_path is not None:
+        elapsed_time = time.time() - state.previous_time
+        results[state.current_ly_path].elapsed_time = elapsed_time
+    # LilyPond renders files in order; files after aborted file were never reached
+    unrendered = []
+    if state.aborted_ly_path is not None:
+        index = ly_paths.index(state.aborted_ly_path)
+        unrendered = ly_paths[index + 1 :]
+    rendered = ly_paths[: len(ly_paths) - len(unrendered)]
+    for ly_path in rendered:
+        result = results[ly_path]
+        log = directory / f".{ly_path.name}.log"
+        log.write_text(date + "\n" + "".join(ly_path_to_lines[ly_path]))
+        result.log = log
+        postscript = ly_path.with_suffix(".ps")
+        if postscript.is_file():
+            postscript.unlink()
+        pdf = ly_path.with_suffix(".pdf")
+        if pdf.is_file() and start_time <= os.path.getmtime(pdf):
+            result.pdf = pdf
+        # LilyPond exits nonzero when any file in batch fails
+        if result.errors or (len(ly_paths) == 1 and process.returncode != 0):
+            result.status = "error"
+        elif result.pdf is None:
+            result.status = "missing"
+        else:
+            result.status = "ok"
+    results_ = [results[_] for _ in rendered]
+    if unrendered:
+        results_.extend(await _run_lilypond_batch(unrendered, progress=progress))
+    return results_
+
+
+async def _run_lilypond_batches(batches, workers, progress):
+    semaphore = asyncio.Semaphore(workers)
+
+    async def run(batch):
+        async with semaphore:
+            return await _run_lilypond_batch(batch, progress=progress)
+
+    return await asyncio.gather(*[run(_) for _ in batches])
+
+
+def _run_music_py(section_directory, arguments):
+    music_py = section_directory / "music.py"
+    command = [sys.executable, str(music_py)] + list(arguments)
+    with abjad.Timer() as timer:
+        completed_process = subprocess.run(
+            command,
+            cwd=section_directory,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+        )
+    return (
+        completed_process.returncode,
+        completed_process.stdout,
+        int(timer.elapsed_time),
+    )
+
+
+def _store_section_cache(section_directory, key):
+    cache_directory = _get_section_cache_directory(section_directory)
+    entry = cache_directory / key
+    print_file_handling(
+        f"Caching {baca.path.trim(section_directory)} ...", log_only=True
+    )
+    tmp = cache_directory / f".{key}.{os.getpid()}.tmp"
+    if tmp.exists():
+        shutil.rmtree(tmp)
+    tmp.mkdir(parents=True)
+    for name in SECTION_CACHE_NAMES:
+        source = section_directory / name
+        if source.is_file():
+            shutil.copyfile(source, tmp / name)
+    if entry.exists():
+        shutil.rmtree(entry)
+    os.replace(tmp, entry)
+    _prune_section_cache(cache_directory)
+
+
 def _trim_music_ly(ly):
     assert ly.is_file()
     lines = []
@@ -548,16 +1051,54 @@ def _make_empty_mapping_proxy():
     return types.MappingProxyType({})
 
 
-@dataclasses.dataclass(slots=True, order=True, unsafe_hash=True)
-class Timing:
-    lilypond: int | None = None
-    make_score: int | None = None
-    postprocess_score: int | None = None
+@dataclasses.dataclass(slots=True)
+class LilyPondResult:
+    """
+    LilyPond result.
+
+    Status is ``"ok"``, ``"error"`` or ``"missing"``; ``"missing"`` means that LilyPond
+    reported no errors but wrote no PDF.
+    """
+
+    ly: pathlib.Path
+    elapsed_time: float = 0.0
+    errors: list[str] = dataclasses.field(default_factory=list)
+    log: pathlib.Path | None = None
+    pdf: pathlib.Path | None = None
+    status: str | None = None
+
+
+@dataclasses.dataclass(slots=True)
+class _LilyPondWarningFilter:
+    crescendo_too_small: bool = False
+    decrescendo_too_small: bool = False
+    overwriting_glissando: bool = False
+    skip: int = 0
+
+    def __call__(self, line):
+        """
+        Is true when ``line`` should be kept.
+        """
+        if 0 < self.skip:
+            self.skip -= 1
+            return False
+        if self.crescendo_too_small and "crescendo too small" in line:
+            self.skip = 2
+            return False
+        if self.decrescendo_too_small and "decrescendo too small" in line:
+            self.skip = 2
+            return False
+        if self.overwriting_glissando and "overwriting glissando" in line:
+            self.skip = 1
+            return False
+        return True
 
 
 @dataclasses.dataclass(frozen=True, slots=True, order=True, unsafe_hash=True)
 class Environment:
     arguments: tuple[str, ...] = dataclasses.field(default_factory=tuple)
+    cache_key: str | None = None
+    cached: bool = False
     first_measure_number: int = 1
     metadata: types.MappingProxyType = dataclasses.field(
         default_factory=_make_empty_mapping_proxy
@@ -568,6 +1109,7 @@ class Environment:
     previous_metadata: types.MappingProxyType = dataclasses.field(
         default_factory=_make_empty_mapping_proxy
     )
+    project: "baca.path.ScoreProject | None" = None
     section_directory: pathlib.Path | None = None
     section_not_included_in_score: bool = False
     section_number: str | None = None
@@ -583,6 +1125,44 @@ class Environment:
         return False
 
 
+LILYPOND_PROGRESS_PREFIXES = (
+    "Converting to",
+    "Drawing systems",
+    "Finding the ideal number of pages",
+    "Fitting music on",
+    "Interpreting music",
+    "Layout output to",
+    "Preprocessing graphical objects",
+)
+
+PREVIOUS_METADATA_KEYS = (
+    "final_measure_number",
+    "persistent_indicators",
+    "stop_clock_time",
+)
+
+SECTION_CACHE_ARGUMENTS = ("also_untagged", "clicktrack", "midi", "pdf")
+
+SECTION_CACHE_NAMES = (
+    ".metadata",
+    ".music.ly.log",
+    "clicktrack.midi",
+    "music.ily",
+    "music.ly",
+    "music.midi",
+    "music.pdf",
+)
+
+SECTION_CACHE_SIZE = 4
+
+_SECTION_CACHE_KEYS: dict[pathlib.Path, str] = {}
+
+TEX_PASS_LIMIT = 2
+
+_TEX_INPUT_REGEX = re.compile(
+    r"\\(includegraphics|includepdf|input|include)\s*(?:\[[^\]]*\])?\{([^}]+)\}"
+)
+
 Timer = abjad.Timer
 
 
@@ -590,6 +1170,7 @@ def arguments(arguments):
     known_arguments = (
         "--also-untagged",
         "--clicktrack",
+        "--ignore-cache",
         "--layout",
         "--log-timing",
         "--midi",
@@ -624,14 +1205,18 @@ def argv():
     return list(sys.argv)
 
 
-def build_part(part_directory, debug_sections=False):
+def build_part(part_directory, debug_sections=False, *, sections_collected=False):
     assert part_directory.parent.name.endswith("-parts"), repr(part_directory)
     part_pdf = part_directory / "part.pdf"
     print_always(f"Building {baca.path.trim(part_pdf)} ...")
     layout_py = part_directory / "layout.py"
     # TODO: consider removing or hoisting to make
     os.system(f"python {layout_py}")
-    interpret_build_music(part_directory, debug_sections=debug_sections)
+    interpret_build_music(
+        part_directory,
+        debug_sections=debug_sections,
+        sections_collected=sections_collected,
+    )
     front_cover_tex = part_directory / "front-cover.tex"
     interpret_tex_file(front_cover_tex)
     preface_tex = part_directory / "preface.tex"
@@ -642,6 +1227,56 @@ def build_part(part_directory, debug_sections=False):
     interpret_tex_file(part_tex)
 
 
+def build_parts(
+    parts_directory, *, debug_sections=False, part_identifiers=None, workers=None
+):
+    """
+    Builds parts in parts directory concurrently.
+
+    Collects _sections once; each part then handles part tags in its own view of
+    _sections. Builds only parts whose identifier is in ``part_identifiers`` when
+    ``part_identifiers`` is not none.
+
+    Returns list of part directories that failed to build.
+    """
+    assert parts_directory.name.endswith("-parts"), repr(parts_directory)
+    part_directories = []
+    for part_directory in sorted(parts_directory.iterdir()):
+        if part_directory.name.startswith(("_", ".")):
+            continue
+        music_ly = part_directory / "music.ly"
+        if not music_ly.is_file():
+            continue
+        if part_identifiers is not None:
+            if _parse_part_identifier(music_ly) not in part_identifiers:
+                continue
+        part_directories.append(part_directory)
+    if not part_directories:
+        print_error(f"No parts found in {baca.path.trim(parts_directory)} ...")
+        return []
+    _sections_directory = parts_directory / "_sections"
+    collect_section_lys(_sections_directory)
+    contents_directory = baca.path.get_contents_directory(parts_directory)
+    metadata = baca.path.get_metadata(contents_directory)
+    do_not_populate_remote_repos = metadata.get("do_not_populate_remote_repos")
+    if "trevor" in _sections_directory.parts and not do_not_populate_remote_repos:
+        _populate_builds_repository(_sections_directory)
+    unbuilt = []
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(_build_part_in_worker, _, debug_sections): _
+            for _ in part_directories
+        }
+        for future in concurrent.futures.as_completed(futures):
+            part_directory = futures[future]
+            returncode, output = future.result()
+            print(output, end="")
+            if returncode != 0:
+                print_error(f"Failed to build {baca.path.trim(part_directory)} ...")
+                unbuilt.append(part_directory)
+    return sorted(unbuilt)
+
+
 def build_score(score_directory, debug_sections=False):
     assert score_directory.name.endswith("-score"), repr(score_directory)
     assert score_directory.parent.name == "builds", repr(score_directory)
@@ -671,33 +1306,171 @@ def build_score(score_directory, debug_sections=False):
         sys.exit(1)
 
 
+def build_sections(directory, arguments=("--pdf",), *, workers=None):
+    """
+    Builds every section in score.
+
+    Runs each section's music.py in a pool of ``workers`` subprocesses. Sections start
+    speculatively from the previous section's .metadata on disk; a section is rebuilt
+    only when the previous section's rebuilt .metadata differs in one of the keys
+    given in ``PREVIOUS_METADATA_KEYS``.
+
+    Returns list of section directories that did not build.
+    """
+    project = baca.path.get_score_project(directory)
+    sections_directory = project.sections_directory
+    section_directories = baca.path._get_music_section_directories(sections_directory)
+    count = len(section_directories)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    runs = [[] for _ in section_directories]
+    settled = [False for _ in section_directories]
+    failed = []
+    queue = list(range(count))
+    running = {}
+    clock = 0
+
+    def evaluate(i):
+        if not runs[i]:
+            return
+        run = runs[i][-1]
+        if run.stop is None or settled[i] or i in failed:
+            return
+        section_directory = section_directories[i]
+        if 0 < i:
+            if not settled[i - 1]:
+                return
+            previous_runs = runs[i - 1]
+            written = previous_runs[-1].written
+            overlapping = [
+                _ for _ in previous_runs if _.start < run.stop and run.start < _.stop
+            ]
+            if run.seen != written or any(_.written != written for _ in overlapping):
+                name = section_directories[i - 1].name
+                print_main_task(
+                    f"Rebuilding {baca.path.trim(section_directory)}"
+                    f" (section {name} metadata changed) ..."
+                )
+                queue.append(i)
+                queue.sort()
+                return
+        if run.returncode != 0:
+            print_error(f"Can not build {baca.path.trim(section_directory)} ...")
+            print_always(run.output)
+            failed.append(i)
+            return
+        settled[i] = True
+        counter = abjad.string.pluralize("second", run.seconds)
+        print_success(
+            f"Built {baca.path.trim(section_directory)} in {run.seconds} {counter} ..."
+        )
+        if i + 1 < count:
+            evaluate(i + 1)
+
+    print_main_task(f"Building {count} sections with {workers} workers ...")
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        while queue or running:
+            while queue and len(running) < workers:
+                i = queue.pop(0)
+                clock += 1
+                seen = None
+                if 0 < i:
+                    seen = _read_previous_metadata_keys(section_directories[i - 1])
+                run = types.SimpleNamespace(start=clock, stop=None, seen=seen)
+                runs[i].append(run)
+                future = executor.submit(
+                    _run_music_py, section_directories[i], arguments
+                )
+                running[future] = i
+            done, _ = concurrent.futures.wait(
+                running, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in sorted(done, key=lambda _: running[_]):
+                i = running.pop(future)
+                clock += 1
+                run = runs[i][-1]
+                run.stop = clock
+                run.returncode, run.output, run.seconds = future.result()
+                run.written = None
+                if i + 1 < count:
+                    run.written = _read_previous_metadata_keys(section_directories[i])
+                evaluate(i)
+    unbuilt = [_ for i, _ in enumerate(section_directories) if not settled[i]]
+    for section_directory in unbuilt:
+        print_error(f"Did not build {baca.path.trim(section_directory)} ...")
+    return unbuilt
+
+
 def collect_section_lys(_sections_directory):
-    contents_directory = baca.path.get_contents_directory(_sections_directory)
-    sections_directory = contents_directory / "sections"
-    section_lys = sorted(sections_directory.glob("**/music.ly"))
+    """
+    Collects section music.ly and music.ily files into ``_sections_directory``.
+
+    Collects incrementally: trims and tags only files whose source, build
+    bol_measure_numbers or build final_measure_number changed since last
+    collection, or whose collected file changed; removes files of deleted sections.
+    """
+    project = baca.path.get_score_project(_sections_directory)
+    section_lys = sorted(project.sections_directory.glob("**/music.ly"))
     if not section_lys:
         print_file_handling("Missing section lys ...")
         sys.exit(1)
-    if _sections_directory.exists():
-        print_file_remove(f"Removing {baca.path.trim(_sections_directory)} ...")
-        shutil.rmtree(str(_sections_directory))
-    _sections_directory.mkdir()
-    targets = []
+    _sections_directory.mkdir(exist_ok=True)
+    hashes_path = _sections_directory / ".hashes.json"
+    previous_hashes = {}
+    if hashes_path.is_file():
+        previous_hashes = json.loads(hashes_path.read_text())
+        # invalidate until tagging finishes so that interrupted collection repeats
+        hashes_path.unlink()
+    key = _get_section_collection_key(_sections_directory)
+    hashes, changed = {}, []
     for source_ly in section_lys:
-        text = _trim_music_ly(source_ly)
         section_number = source_ly.parent.name
         target_ly = _sections_directory / f"{section_number}.ly"
-        targets.append(f"{target_ly.name}")
-        target_ly.write_text(text)
         name = source_ly.name.removesuffix(".ly")
         name += ".ily"
         source_ily = source_ly.parent / name
+        target_ily = target_ly.with_suffix(".ily")
+        pairs = [(source_ly, target_ly)]
         if source_ily.is_file():
-            target_ily = target_ly.with_suffix(".ily")
-            targets.append(f"{target_ily.name}")
-            shutil.copyfile(str(source_ily), str(target_ily))
+            pairs.append((source_ily, target_ily))
+        for source, target in pairs:
+            hash_ = hashlib.sha256()
+            hash_.update(f"{key}\n{target.name}\n".encode())
+            hash_.update(source.read_bytes())
+            hashes[target.name] = {"source": hash_.hexdigest()}
+            # target hash catches hand edits of _sections files between builds
+            previous = previous_hashes.get(target.name)
+            if (
+                target.is_file()
+                and isinstance(previous, dict)
+                and previous["source"] == hashes[target.name]["source"]
+                and previous.get("target") == _hash_file(target)
+            ):
+                continue
+            if target.suffix == ".ly":
+                target.write_text(_trim_music_ly(source))
+            else:
+                shutil.copyfile(str(source), str(target))
+            _tags = _sections_directory / f".{target.name}.tags"
+            if _tags.exists():
+                _tags.unlink()
+            changed.append(target.name)
+    for path in sorted(_sections_directory.glob("*ly")):
+        if path.name not in hashes:
+            print_file_remove(f"Removing {baca.path.trim(path)} ...")
+            path.unlink()
+            _tags = _sections_directory / f".{path.name}.tags"
+            if _tags.exists():
+                _tags.unlink()
+    count = len(hashes) - len(changed)
+    counter = abjad.string.pluralize("file", count)
+    print_file_handling(f"Keeping {count} unchanged section {counter} ...")
     print_file_handling(f"Populating {baca.path.trim(_sections_directory)} ...")
-    handle_build_tags(_sections_directory)
+    if changed:
+        handle_build_tags(_sections_directory, names=changed, project=project)
+    for name, dictionary in hashes.items():
+        dictionary["target"] = _hash_file(_sections_directory / name)
+    hashes_path.write_text(json.dumps(hashes, indent=4, sort_keys=True) + "\n")
 
 
 def color_persistent_indicators(file, *, undo=False):
@@ -706,7 +1479,7 @@ def color_persistent_indicators(file, *, undo=False):
         print_always("Must call on file in section directory ...")
         sys.exit(1)
     messages = []
-    text = file.read_text()
+    text = baca.tags.TagPipeline.from_path(file)
     build = "builds" in file.parts
     text = baca.tags.color_clefs(text, messages, build, undo=undo)
     text = baca.tags.color_dynamics(text, messages, undo=undo)
@@ -716,7 +1489,7 @@ def color_persistent_indicators(file, *, undo=False):
     text = baca.tags.color_persistent_indicators(text, messages, build, undo=undo)
     text = baca.tags.color_staff_lines(text, messages, build, undo=undo)
     text = baca.tags.color_time_signatures(text, messages, build, undo=undo)
-    file.write_text(text)
+    text.run()
     return messages
 
 
@@ -730,133 +1503,53 @@ def get_includes():
     return string
 
 
-def handle_build_tags(_sections_directory):
+def handle_build_tags(_sections_directory, *, names=None, project=None, workers=None):
+    """
+    Handles build tags in ``_sections_directory``.
+
+    Handles only files in ``names`` when ``names`` is not none. Handles files in a
+    pool of ``workers`` processes; writes .tags files in file order.
+    """
     print_file_handling("Writing build tag files ...")
-    contents_directory = baca.path.get_contents_directory(_sections_directory)
-    sections_directory = contents_directory / "sections"
-    paths = sorted(sections_directory.glob("*"))
-    section_directories = [_ for _ in paths if _.is_dir()]
-    final_section_directory_name = section_directories[-1].name
+    if project is None:
+        project = baca.path.get_score_project(_sections_directory)
+    final_section_directory_name = project.section_directories[-1].name
     final_ily_name = f"{final_section_directory_name}.ily"
-
-    def match_left_broken_should_deactivate(tags):
-        if baca.tags.LEFT_BROKEN in tags and baca.tags.SPANNER_START in tags:
-            return True
-        if (
-            baca.tags.LEFT_BROKEN in tags
-            and baca.tags.SPANNER_STOP in tags
-            and baca.tags.EXPLICIT_DYNAMIC in tags
-        ):
-            return True
-        return False
-
-    def match_anchor_should_activate(tags):
-        if baca.tags.ANCHOR_NOTE not in tags and baca.tags.ANCHOR_SKIP not in tags:
-            return False
-        if baca.tags.ONE_VOICE_COMMAND in tags:
-            return True
-        if baca.tags.SHOW_TO_JOIN_BROKEN_SPANNERS in tags:
-            return True
-        if baca.tags.SPANNER_STOP in tags:
-            return True
-        return False
-
-    def match_anchor_should_deactivate(tags):
-        if baca.tags.ANCHOR_NOTE not in tags and baca.tags.ANCHOR_SKIP not in tags:
-            return False
-        if baca.tags.SPANNER_START in tags and baca.tags.LEFT_BROKEN in tags:
-            return True
-        if baca.tags.SPANNER_STOP in tags and baca.tags.RIGHT_BROKEN in tags:
-            return True
-        if baca.tags.HIDE_TO_JOIN_BROKEN_SPANNERS in tags:
-            return True
-        return False
-
     build_directory = _sections_directory.parent
     assert build_directory.parent.name == "builds", repr(build_directory)
+    metadata = baca.path.get_metadata(build_directory)
+    bol_measure_numbers = metadata.get("bol_measure_numbers")
+    final_measure_number = metadata.get("final_measure_number")
+    files = []
     for file in sorted(_sections_directory.glob("*ly")):
-        bol_measure_numbers = baca.path.get_metadata(build_directory).get(
-            "bol_measure_numbers"
-        )
-        final_measure_number = baca.path.get_metadata(build_directory).get(
-            "final_measure_number"
-        )
-        messages = []
-        assert "sections" not in file.parts
-        assert "builds" in file.parts
-        if "-score" in str(file):
-            my_name = "SCORE"
+        if names is not None and file.name not in names:
+            continue
+        files.append(file)
+    if not files:
+        return
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(files)))
+    arguments = (
+        files,
+        [bol_measure_numbers] * len(files),
+        [final_measure_number] * len(files),
+        [_.name == final_ily_name for _ in files],
+    )
+    with phase("handle_build_tags"):
+        if workers == 1:
+            results = list(map(_handle_build_file_tags, *arguments))
         else:
-            assert "-parts" in str(file)
-            my_name = "PARTS"
-        text = file.read_text()
-        text = baca.tags.handle_edition_tags(text, messages, "_sections", my_name)
-        text = baca.tags.handle_fermata_bar_lines(
-            text, messages, bol_measure_numbers, final_measure_number
-        )
-        text = baca.tags.handle_shifted_clefs(text, messages, bol_measure_numbers)
-        text = baca.tags.handle_mol_tags(
-            text, messages, bol_measure_numbers, final_measure_number
-        )
-        build = "builds" in file.parts
-        text = baca.tags.color_persistent_indicators(text, messages, build, undo=True)
-        text = baca.tags.show_music_annotations(text, messages, undo=True)
-        text = baca.tags.join_broken_spanners(text, messages)
-        text = baca.tags.show_tag(
-            text,
-            "left-broken-should-deactivate",
-            messages,
-            match=match_left_broken_should_deactivate,
-            undo=True,
-        )
-        if file.name != final_ily_name:
-            text = baca.tags.show_tag(text, baca.tags.ANCHOR_NOTE, messages)
-            text = baca.tags.show_tag(text, baca.tags.ANCHOR_SKIP, messages)
-            text = baca.tags.show_tag(
-                text,
-                baca.tags.ANCHOR_NOTE,
-                messages,
-                prepend_empty_chord=True,
-                undo=True,
-            )
-            text = baca.tags.show_tag(
-                text,
-                baca.tags.ANCHOR_SKIP,
-                messages,
-                prepend_empty_chord=True,
-                undo=True,
-            )
-            text = baca.tags.show_tag(
-                text,
-                "anchor-should-activate",
-                messages,
-                match=match_anchor_should_activate,
-            )
-            text = baca.tags.show_tag(
-                text,
-                "anchor-should-deactivate",
-                messages,
-                match=match_anchor_should_deactivate,
-                undo=True,
-            )
-            text = baca.tags.show_tag(
-                text,
-                baca.tags.EOS_STOP_MM_SPANNER,
-                messages,
-            )
-        text = baca.tags.show_tag(
-            text,
-            baca.tags.METRIC_MODULATION_IS_STRIPPED,
-            messages,
-            undo=True,
-        )
-        text = baca.tags.show_tag(
-            text,
-            baca.tags.METRIC_MODULATION_IS_SCALED,
-            messages,
-            undo=True,
-        )
-        file.write_text(text)
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=workers
+            ) as executor:
+                results = list(executor.map(_handle_build_file_tags, *arguments))
+        # no profile is active in workers; workers return elapsed time of each file
+        timing = _TIMING.get()
+        if timing is not None:
+            for file, (_, milliseconds) in zip(files, results):
+                timing.record(f"handle_build_tags:{file.name}", milliseconds)
+    for file, (messages, _) in zip(files, results):
         _tags = _sections_directory / f".{file.name}.tags"
         print_file_handling(f"Writing {baca.path.trim(_tags)} ...", log_only=True)
         text = "\n".join(messages) + "\n"
@@ -870,6 +1563,8 @@ def handle_part_tags(directory):
         print_always("Must call script in part directory ...")
         sys.exit(1)
     parts_directory = directory.parent
+    # tags are handled in part directory only (including part's _sections view)
+    # so that parts may build concurrently
 
     def _activate(
         path,
@@ -908,37 +1603,17 @@ def handle_part_tags(directory):
             deactivate=True,
         )
 
-    def _parse_part_identifier(path):
-        if path.suffix == ".ly":
-            part_identifier = None
-            with path.open("r") as pointer:
-                for line in pointer.readlines():
-                    if line.startswith("% part_identifier = "):
-                        line = line.strip("% part_identifier = ")
-                        part_identifier = eval(line)
-                        return part_identifier
-        elif path.name.endswith("layout.py"):
-            part_identifier = None
-            with path.open("r") as pointer:
-                for line in pointer.readlines():
-                    if line.startswith("part_identifier = "):
-                        line = line.strip("part_identifier = ")
-                        part_identifier = eval(line)
-                        return part_identifier
-        else:
-            raise TypeError(path)
-
     music_ly = list(directory.glob("*music.ly"))[0]
     _activate(
-        parts_directory,
+        directory,
         "+PARTS",
     )
     _deactivate(
-        parts_directory,
+        directory,
         "-PARTS",
     )
     _deactivate(
-        parts_directory,
+        directory,
         "HIDE_IN_PARTS",
     )
     part_identifier = _parse_part_identifier(music_ly)
@@ -949,49 +1624,49 @@ def handle_part_tags(directory):
     parts_directory_name = abjad.string.to_shout_case(parts_directory.name)
     name = f"{parts_directory_name}_{part_identifier}"
     _activate(
-        parts_directory,
+        directory,
         f"+{name}",
     )
     _deactivate(
-        parts_directory,
+        directory,
         f"-{name}",
     )
     _deactivate(
-        parts_directory,
+        directory,
         str(baca.tags.METRIC_MODULATION_IS_SCALED),
     )
     _deactivate(
-        parts_directory,
+        directory,
         str(baca.tags.METRIC_MODULATION_IS_NOT_SCALED),
     )
     _activate(
-        parts_directory,
+        directory,
         str(baca.tags.METRIC_MODULATION_IS_STRIPPED),
     )
     # HACK TO HIDE ALL POST-FERMATA-MEASURE TRANSPARENT BAR LINES;
     # this only works if parts contain no EOL fermata measure:
     _deactivate(
-        parts_directory,
+        directory,
         str(baca.tags.FERMATA_MEASURE),
     )
     _activate(
-        parts_directory,
+        directory,
         str(baca.tags.NOT_TOPMOST),
     )
     _deactivate(
-        parts_directory,
+        directory,
         str(baca.tags.FERMATA_MEASURE_EMPTY_BAR_EXTENT),
     )
     _deactivate(
-        parts_directory,
+        directory,
         str(baca.tags.FERMATA_MEASURE_NEXT_BAR_EXTENT),
     )
     _deactivate(
-        parts_directory,
+        directory,
         str(baca.tags.FERMATA_MEASURE_RESUME_BAR_EXTENT),
     )
     _deactivate(
-        parts_directory,
+        directory,
         str(baca.tags.EXPLICIT_BAR_EXTENT),
     )
 
@@ -1000,12 +1675,17 @@ def interpret_build_music(
     build_directory,
     *,
     debug_sections=False,
+    sections_collected=False,
     skip_section_collection=False,
 ):
     """
     Interprets music.ly file in build directory.
 
     Collects sections and handles tags.
+
+    Part builds handle part tags in a hard-linked view of _sections in the part
+    directory; the shared _sections directory is never modified by part tags. Set
+    ``sections_collected=True`` when the caller has already collected _sections.
     """
     build_type = None
     if build_directory.name.endswith("-score"):
@@ -1025,35 +1705,55 @@ def interpret_build_music(
         _sections_directory = build_directory.parent / "_sections"
     if skip_section_collection:
         print_file_handling("Skipping section collection ...")
-    else:
+    elif not sections_collected:
         collect_section_lys(_sections_directory)
-    if build_directory.parent.name.endswith("-parts"):
+    ly_file_path, view_directory = music_ly, None
+    if build_type == "part":
         if skip_section_collection:
             print_tags("Skipping tag handling ...")
         else:
+            view_directory = _make_part_sections_view(build_directory)
             handle_part_tags(build_directory)
+            ly_file_path = _make_part_ly(build_directory)
     contents_directory = baca.path.get_contents_directory(build_directory)
     metadata = baca.path.get_metadata(contents_directory)
     do_not_populate_remote_repos = metadata.get("do_not_populate_remote_repos")
-    if "trevor" in _sections_directory.parts and not do_not_populate_remote_repos:
-        print_main_task("Populating _builds repository ...")
-        parts = list(_sections_directory.parts)
-        assert parts[3] == "Scores"
-        parts[3] = "_builds"
-        _builds_sections_directory = os.sep + os.sep.join(parts[1:])
-        shutil.copytree(
-            _sections_directory, _builds_sections_directory, dirs_exist_ok=True
-        )
+    if (
+        "trevor" in _sections_directory.parts
+        and not do_not_populate_remote_repos
+        and not sections_collected
+    ):
+        _populate_builds_repository(_sections_directory)
+    # _sections is kept so that next collection is incremental
     remove = None
-    if _sections_directory.is_dir() and not debug_sections:
-        remove = _sections_directory
+    if view_directory is not None and not debug_sections:
+        remove = view_directory
     music_pdf = music_ly.with_name("music.pdf")
     if music_pdf.is_file():
         print_file_handling(f"Existing {baca.path.trim(music_pdf)} ...", log_only=True)
-    run_lilypond(music_ly, remove=remove)
+    if ly_file_path == music_ly:
+        run_lilypond(music_ly, remove=remove)
+        return
+    part_pdf = ly_file_path.with_suffix(".pdf")
+    if part_pdf.exists():
+        part_pdf.unlink()
+    run_lilypond(ly_file_path, remove=remove)
+    if part_pdf.is_file():
+        os.replace(part_pdf, music_pdf)
+    ly_file_path.with_name(f".{ly_file_path.name}.log").replace(
+        music_ly.with_name(f".{music_ly.name}.log")
+    )
+    if not debug_sections:
+        ly_file_path.unlink()
 
 
-def interpret_tex_file(tex):
+def interpret_tex_file(tex, *, force=False):
+    """
+    Interprets ``tex`` with xelatex (or pdflatex).
+
+    Skips interpretation when PDF exists and ``tex`` and its inputs are unchanged
+    since last interpretation; stops after one pass once .aux file converges.
+    """
     if not tex.is_file():
         print_error(f"Can not find {baca.path.trim(tex)} ...")
         return
@@ -1063,22 +1763,46 @@ def interpret_tex_file(tex):
         executable_name = "pdflatex"
     else:
         executable_name = "xelatex"
+    pdf = tex.with_suffix(".pdf")
+    dependencies_path = tex.parent / f".{tex.stem}.tex.dependencies"
+    dependencies = {
+        "executable": executable_name,
+        "inputs": _get_tex_input_hashes(tex),
+    }
+    if not force and pdf.is_file() and dependencies_path.is_file():
+        if json.loads(dependencies_path.read_text()) == dependencies:
+            print_file_handling(f"Skipping unchanged {baca.path.trim(tex)} ...")
+            print_success(f"Found {baca.path.trim(pdf)} ...")
+            return
     print_file_handling(f"Calling {executable_name} on {baca.path.trim(tex)} ...")
     command = f" {executable_name} -halt-on-error"
     command += " -interaction=nonstopmode"
     command += f" --jobname={tex.stem}"
     command += f" -output-directory={tex.parent} {tex}"
     command += f" 1>{tex.stem}.log 2>&1"
-    command_called_twice = f"{command}; {command}"
+    aux = tex.with_suffix(".aux")
+    # keep .aux between builds so that unchanged cross-references converge in one pass
+    hidden_aux = tex.parent / f".{tex.stem}.aux.previous"
     with abjad.TemporaryDirectoryChange(directory=tex.parent):
-        abjad.io.spawn_subprocess(command_called_twice)
+        if hidden_aux.is_file():
+            shutil.move(str(hidden_aux), str(aux))
+        for _ in range(TEX_PASS_LIMIT):
+            previous_aux_hash = _hash_file(aux)
+            exit_code = abjad.io.spawn_subprocess(command)
+            if exit_code != 0 or _hash_file(aux) == previous_aux_hash:
+                break
         source = tex.with_suffix(".log")
         name = "." + tex.stem + ".tex.log"
         target = tex.parent / name
         shutil.move(str(source), str(target))
+        if aux.is_file():
+            shutil.move(str(aux), str(hidden_aux))
         for path in sorted(tex.parent.glob("*.aux")):
             path.unlink()
-    pdf = tex.with_suffix(".pdf")
+    if pdf.is_file() and exit_code == 0:
+        dependencies_path.write_text(json.dumps(dependencies, indent=4) + "\n")
+    elif dependencies_path.is_file():
+        dependencies_path.unlink()
     if pdf.is_file():
         print_success(f"Found {baca.path.trim(pdf)} ...")
     else:
@@ -1089,6 +1813,7 @@ def interpret_tex_file(tex):
 def persist_as_ly(argument, ly_file_path):
     print_file_handling(f"Writing {baca.path.trim(ly_file_path)} ...")
     abjad.persist.as_ly(argument, ly_file_path)
+    baca.tags.write_tag_index(ly_file_path)
 
 
 def persist_lilypond_file(
@@ -1097,7 +1822,16 @@ def persist_lilypond_file(
     timing: Timing,
     lilypond_file: abjad.LilyPondFile,
     metadata: types.MappingProxyType,
+    *,
+    cache_key: str | None = None,
 ):
+    """
+    Persists ``lilypond_file`` and ``metadata`` in ``section_directory``.
+
+    Caches section build under ``cache_key``; defaults to the key that
+    ``read_environment()`` computed for ``section_directory`` before the build
+    started, so that metadata rewritten during the build never keys the cache entry.
+    """
     print_main_task("Persisting LilyPond file ...")
     assert isinstance(arguments, types.SimpleNamespace), repr(arguments)
     assert isinstance(section_directory, pathlib.PosixPath), repr(section_directory)
@@ -1109,34 +1843,26 @@ def persist_lilypond_file(
     metadata = types.MappingProxyType(dictionary)
     metadata_file = section_directory / ".metadata"
     print_file_handling(f"Writing {baca.path.trim(metadata_file)} ...")
-    baca.path.write_metadata_py(section_directory, metadata)
-    if arguments.clicktrack:
-        path = section_directory / "clicktrack.midi"
-        mtime = os.path.getmtime(path) if path.is_file() else None
-        _make_section_clicktrack(lilypond_file, mtime, section_directory)
-    if arguments.midi:
-        path = section_directory / "music.midi"
-        mtime = os.path.getmtime(path) if path.is_file() else None
-        _make_section_midi(lilypond_file, mtime, section_directory)
-    if arguments.pdf:
-        path = section_directory / "music.pdf"
-        mtime = os.path.getmtime(path) if path.is_file() else None
-        _make_section_pdf(
-            lilypond_file,
-            mtime,
-            section_directory,
-            timing,
-            also_untagged=arguments.also_untagged,
-            log_timing=arguments.log_timing,
-            print_timing=arguments.print_timing,
-        )
+    with timing.phase("persist_lilypond_file"):
+        with timing.phase("write_metadata"):
+            baca.path.write_metadata_py(section_directory, metadata)
+        _persist_lilypond_file(arguments, section_directory, timing, lilypond_file)
+    if arguments.print_timing:
+        print_all_timing(timing)
+    if arguments.log_timing:
+        _log_timing(section_directory, timing, arguments.log_timing)
+    if cache_key is None:
+        cache_key = _SECTION_CACHE_KEYS.get(section_directory)
+    if cache_key is not None and not arguments.ignore_cache:
+        _store_section_cache(section_directory, cache_key)
 
 
 def print_all_timing(timing):
-    if hasattr(timing, "make_score"):
-        python_runtime = timing.make_score + timing.postprocess_score
+    if timing.make_score is not None or timing.postprocess_score is not None:
+        python_runtime = (timing.make_score or 0) + (timing.postprocess_score or 0)
         print_timing("Python runtime", python_runtime)
-    print_timing("LilyPond runtime", int(timing.lilypond))
+    if timing.lilypond is not None:
+        print_timing("LilyPond runtime", timing.lilypond)
 
 
 def print_always(string=""):
@@ -1185,11 +1911,38 @@ def print_timing(title, timer):
 def read_environment(
     music_py_path_name, sys_argv, *, section_not_included_in_score=False
 ) -> Environment:
+    """
+    Reads environment of section ``music_py_path_name``.
+
+    Computes section cache key once, before build starts. Restores cached section
+    build when cache holds entry for key and then returns environment with
+    ``cached`` set to true; music.py should then stop without building.
+    """
     arguments_ = arguments(sys_argv)
     section_directory = pathlib.Path(music_py_path_name).parent
-    metadata = baca.path.get_metadata(section_directory)
-    persist = baca.path.get_metadata(section_directory)
-    previous_metadata = baca.path.previous_metadata(pathlib.Path(music_py_path_name))
+    project = baca.path.get_score_project(section_directory)
+    cache_key = None
+    if not arguments_.ignore_cache and not arguments_.layout:
+        cache_key = _get_section_cache_key(
+            section_directory, arguments_, project=project
+        )
+        _SECTION_CACHE_KEYS[section_directory] = cache_key
+        if _restore_section_cache(section_directory, cache_key):
+            return Environment(
+                arguments=arguments_,
+                cache_key=cache_key,
+                cached=True,
+                project=project,
+                section_directory=section_directory,
+                section_number=section_directory.name,
+            )
+    timing = Timing()
+    with timing.phase("read_metadata"):
+        metadata = baca.path.get_metadata(section_directory)
+        persist = baca.path.get_metadata(section_directory)
+        previous_metadata = baca.path.previous_metadata(
+            pathlib.Path(music_py_path_name), project=project
+        )
     if previous_metadata and not section_not_included_in_score:
         string = "final_measure_number"
         if string in previous_metadata:
@@ -1200,14 +1953,16 @@ def read_environment(
         first_measure_number = 1
     environment = Environment(
         arguments=arguments_,
+        cache_key=cache_key,
         first_measure_number=first_measure_number,
         metadata=metadata,
         persist=persist,
         previous_metadata=previous_metadata,
+        project=project,
         section_directory=section_directory,
         section_not_included_in_score=section_not_included_in_score,
         section_number=section_directory.name,
-        timing=Timing(),
+        timing=timing,
     )
     return environment
 
@@ -1220,6 +1975,44 @@ def remove_site_comments(path: pathlib.Path) -> None:
     path.write_text(string)
 
 
+def run_lilypond_jobs(ly_paths, *, batch_size=None, progress=None, workers=None):
+    """
+    Runs LilyPond on ``ly_paths``.
+
+    LilyPond writes the output of one invocation to one directory, so files are
+    grouped into batches by directory; each batch is rendered in a single LilyPond
+    invocation, which pays Guile startup and stylesheet loading once. Batches hold at
+    most ``batch_size`` files and at most ``workers`` batches run at once.
+
+    Reads LilyPond output as LilyPond produces it: drops the warnings removed by
+    ``_remove_lilypond_warnings()``, collects errors, kills LilyPond on the first
+    fatal error (and reruns the files of the batch that LilyPond did not reach) and
+    calls ``progress(ly_path, line)`` on each progress line.
+
+    Writes ``.<name>.log`` next to each file.
+
+    Returns one ``LilyPondResult`` per file, in the order of ``ly_paths``.
+    """
+    ly_paths = [pathlib.Path(_).resolve() for _ in ly_paths]
+    assert all(_.is_file() for _ in ly_paths), repr(ly_paths)
+    directory_to_ly_paths: dict[pathlib.Path, list[pathlib.Path]] = {}
+    for ly_path in dict.fromkeys(ly_paths):
+        directory_to_ly_paths.setdefault(ly_path.parent, []).append(ly_path)
+    batches = []
+    for ly_paths_ in directory_to_ly_paths.values():
+        size = batch_size or len(ly_paths_)
+        for i in range(0, len(ly_paths_), size):
+            batches.append(ly_paths_[i : i + size])
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(batches)))
+    ly_path_to_result = {}
+    for results in asyncio.run(_run_lilypond_batches(batches, workers, progress)):
+        for result in results:
+            ly_path_to_result[result.ly] = result
+    return [ly_path_to_result[_] for _ in ly_paths]
+
+
 def run_lilypond(ly_file_path, *, pdf_mtime=None, remove=None):
     assert ly_file_path.exists(), repr(ly_file_path)
     string = f"Calling LilyPond (with includes) on {baca.path.trim(ly_file_path)} ..."
@@ -1229,18 +2022,7 @@ def run_lilypond(ly_file_path, *, pdf_mtime=None, remove=None):
     lilypond_log_file_name = "." + ly_file_path.name + ".log"
     lilypond_log_file_path = directory / lilypond_log_file_name
     with abjad.TemporaryDirectoryChange(directory=directory):
-        flags = get_includes()
-        abjad.io.run_lilypond(
-            str(ly_file_path),
-            flags=flags,
-            lilypond_log_file_path=(lilypond_log_file_path),
-        )
-        _remove_lilypond_warnings(
-            lilypond_log_file_path,
-            crescendo_too_small=True,
-            decrescendo_too_small=True,
-            overwriting_glissando=True,
-        )
+        run_lilypond_jobs([ly_file_path], progress=_print_lilypond_progress)
         _display_lilypond_log_errors(lilypond_log_file_path)
         if remove is not None:
             print_file_remove(f"Removing {baca.path.trim(remove)} ...")
@@ -1264,16 +2046,13 @@ def show_annotations(file, *, undo=False):
         sys.exit(1)
     messages = []
 
-    def _annotation_spanners(tags):
-        tags_ = (
-            baca.tags.MATERIAL_ANNOTATION_SPANNER,
-            baca.tags.MOMENT_ANNOTATION_SPANNER,
-            baca.tags.PITCH_ANNOTATION_SPANNER,
-            baca.tags.RHYTHM_ANNOTATION_SPANNER,
-        )
-        return bool(set(tags) & set(tags_))
-
-    text = file.read_text()
+    _annotation_spanners = baca.tags.any_of(
+        baca.tags.MATERIAL_ANNOTATION_SPANNER,
+        baca.tags.MOMENT_ANNOTATION_SPANNER,
+        baca.tags.PITCH_ANNOTATION_SPANNER,
+        baca.tags.RHYTHM_ANNOTATION_SPANNER,
+    )
+    text = baca.tags.TagPipeline.from_path(file)
     text = baca.tags.show_tag(
         text,
         "annotation spanners",
@@ -1282,13 +2061,7 @@ def show_annotations(file, *, undo=False):
         undo=undo,
     )
 
-    def _spacing(tags):
-        tags_ = (
-            baca.tags.SPACING,
-            baca.tags.SPACING_OVERRIDE,
-        )
-        return bool(set(tags) & set(tags_))
-
+    _spacing = baca.tags.any_of(baca.tags.SPACING, baca.tags.SPACING_OVERRIDE)
     text = baca.tags.show_tag(text, baca.tags.CLOCK_TIME, messages, undo=undo)
     text = baca.tags.show_tag(text, baca.tags.FIGURE_LABEL, messages, undo=undo)
     text = baca.tags.show_tag(
@@ -1300,7 +2073,7 @@ def show_annotations(file, *, undo=False):
     text = baca.tags.show_tag(text, baca.tags.LOCAL_MEASURE_NUMBER, messages, undo=undo)
     text = baca.tags.show_tag(text, baca.tags.MEASURE_NUMBER, messages, undo=undo)
     text = baca.tags.show_tag(text, baca.tags.MOCK_COLORING, messages, undo=undo)
-    text = text = baca.tags.show_music_annotations(text, messages, undo=undo)
+    text = baca.tags.show_music_annotations(text, messages, undo=undo)
     text = baca.tags.show_tag(
         text, baca.tags.NOT_YET_PITCHED_COLORING, messages, undo=undo
     )
@@ -1309,11 +2082,48 @@ def show_annotations(file, *, undo=False):
     )
     text = baca.tags.show_tag(text, "spacing", messages, match=_spacing, undo=undo)
     text = baca.tags.show_tag(text, baca.tags.STAGE_NUMBER, messages, undo=undo)
-    file.write_text(text)
+    text.run()
     return messages
 
 
+def summarize_timing(directory, *, threshold=0.1, minimum=10):
+    """
+    Compares last two runs of each name in timing history in ``directory``.
+
+    Returns list of (name, phase, previous milliseconds, milliseconds) regressions:
+    phases slower by more than ``threshold`` (fraction) and ``minimum``
+    milliseconds.
+    """
+    history = pathlib.Path(directory) / "history.jsonl"
+    name_to_runs = {}
+    if history.is_file():
+        for line in history.read_text().splitlines():
+            if line.strip():
+                dictionary = json.loads(line)
+                name_to_runs.setdefault(dictionary["name"], []).append(dictionary)
+    regressions = []
+    for name, runs in sorted(name_to_runs.items()):
+        if len(runs) < 2:
+            continue
+        previous = _flatten_phases(runs[-2]["phases"])
+        current = _flatten_phases(runs[-1]["phases"])
+        for phase_, milliseconds in current.items():
+            if phase_ not in previous:
+                continue
+            difference = milliseconds - previous[phase_]
+            if minimum < difference and threshold * previous[phase_] < difference:
+                regressions.append((name, phase_, previous[phase_], milliseconds))
+    return regressions
+
+
 def timed(timing_attribute):
+    """
+    Records decorated function as ``timing_attribute`` phase of build profile.
+
+    Finds profile in ``environment`` or ``timing`` keywords, in last positional
+    argument, or in positional environment.
+    """
+
     def decorator(function):
         @functools.wraps(function)
         def wrapper(*arguments, **keywords):
@@ -1322,18 +2132,17 @@ def timed(timing_attribute):
                 timing = keywords["environment"].timing
             elif "timing" in keywords:
                 timing = keywords.pop("timing")
-            elif isinstance(arguments[-1], Timing):
+            elif arguments and isinstance(arguments[-1], Timing):
                 timing = arguments[-1]
                 arguments = arguments[:-1]
             else:
                 for argument in arguments:
                     if isinstance(argument, Environment):
                         timing = argument.timing
-            with abjad.Timer() as timer:
-                result = function(*arguments, **keywords)
-            if timing is not None:
-                setattr(timing, timing_attribute, int(timer.elapsed_time))
-            return result
+            if timing is None:
+                return function(*arguments, **keywords)
+            with timing.phase(timing_attribute):
+                return function(*arguments, **keywords)
 
         return wrapper
 
@@ -2,36 +2,381 @@
 Path.
 """
 
+import contextlib
+import dataclasses
 import importlib
+import io
+import json
 import os
 import pathlib
+import sys
 import types
+import typing
 from inspect import currentframe as _frame
 
-import black
-
 import abjad
 
 from . import helpers as _helpers
+from . import memento as _memento
 from . import tags as _tags
 
-
-def _get_previous_section(path: pathlib.Path):
-    assert isinstance(path, pathlib.Path), repr(path)
-    music_py = pathlib.Path(path)
-    section = pathlib.Path(music_py).parent
-    assert section.parent.name == "sections", repr(section)
-    sections = section.parent
-    assert sections.name == "sections", repr(sections)
-    paths = list(sorted(sections.glob("*")))
+_METADATA_CACHE: dict[pathlib.Path, tuple[int, int, dict]] = {}
+
+_SCORE_PROJECTS: dict[pathlib.Path, "ScoreProject"] = {}
+
+_SECTION_DIRECTORIES: dict[pathlib.Path, tuple[int, list[pathlib.Path]]] = {}
+
+_WRAPPER_DIRECTORIES: dict[str, pathlib.Path] = {}
+
+_MANIFEST_KEYS = (
+    "duration",
+    "fermata_measure_numbers",
+    "final_measure_number",
+    "first_measure_number",
+    "start_clock_time",
+    "stop_clock_time",
+    "time_signatures",
+)
+
+_METADATA_SCHEMA = {
+    "alive_during_section": list,
+    "bol_measure_numbers": list,
+    "container_to_part_assignment": dict,
+    "fermata_measure_numbers": list,
+    "final_measure_is_fermata": bool,
+    "final_measure_number": int,
+    "first_appearance_short_instrument_names": dict,
+    "first_measure_number": int,
+    "first_metronome_mark": bool,
+    "has_anchor_skip": bool,
+    "persistent_indicators": dict,
+    "section_not_included_in_score": bool,
+    "start_clock_time": str,
+    "stop_clock_time": str,
+    "time_signatures": list,
+    "voice_name_to_parameter_to_state": dict,
+}
+
+
+def _copy_metadatum(value):
+    if isinstance(value, list):
+        return [_copy_metadatum(_) for _ in value]
+    if isinstance(value, dict):
+        return {k: _copy_metadatum(v) for k, v in value.items()}
+    return value
+
+
+def _decode_metadatum(dictionary):
+    if len(dictionary) != 1:
+        return dictionary
+    key, value = next(iter(dictionary.items()))
+    if key == "$dict":
+        return dict((k, v) for k, v in value)
+    if key == "$memento":
+        return _memento.Memento(**value)
+    if key == "$repr":
+        return _eval_metadata(value)
+    if key == "$tag":
+        return abjad.Tag(value)
+    if key == "$tuple":
+        return tuple(value)
+    return dictionary
+
+
+def _encode_metadatum(value):
+    if value is None or isinstance(value, bool | int | float | str):
+        return value
+    if isinstance(value, list):
+        return [_encode_metadatum(_) for _ in value]
+    if isinstance(value, tuple) and type(value) is tuple:
+        return {"$tuple": [_encode_metadatum(_) for _ in value]}
+    if isinstance(value, dict):
+        if all(isinstance(_, str) and not _.startswith("$") for _ in value):
+            return {k: _encode_metadatum(v) for k, v in value.items()}
+        pairs = [[_encode_metadatum(k), _encode_metadatum(v)] for k, v in value.items()]
+        return {"$dict": pairs}
+    if isinstance(value, abjad.Tag):
+        return {"$tag": value.string}
+    if isinstance(value, _memento.Memento):
+        dictionary = {}
+        for name in ("context", "edition", "manifest", "prototype", "value"):
+            dictionary[name] = _encode_metadatum(getattr(value, name))
+        dictionary["synthetic_offset"] = _encode_metadatum(value.synthetic_offset)
+        return {"$memento": dictionary}
+    return {"$repr": repr(value)}
+
+
+def _eval_metadata(string):
+    baca = importlib.import_module("baca")
+    namespace = {"abjad": abjad, "baca": baca}
+    namespace.update(abjad.__dict__)
+    namespace.update(baca.__dict__)
+    return eval(string, namespace)
+
+
+def _get_extern_variable_lines(name, variable_lines, tag):
+    lines = []
+    first_line = variable_lines[0]
+    count = len(first_line) - len(first_line.lstrip())
+    first_line = first_line[count:]
+    first_line = f"{name} = {first_line}"
+    words = first_line.split()
+    index = words.index("%*%")
+    first_line = " ".join(words[:index])
+    first_lines = abjad.tag.double_tag([first_line], tag)
+    first_lines = [_ + "\n" for _ in first_lines]
+    lines.extend(first_lines)
+    for variable_line in variable_lines[1:]:
+        assert variable_line[:count].isspace(), repr(variable_line)
+        variable_line = variable_line[count:]
+        if variable_line == "":
+            variable_line = "\n"
+        assert variable_line.endswith("\n"), repr(variable_line)
+        lines.append(variable_line)
+    not_topmost_index = None
+    for j, line in enumerate(reversed(lines)):
+        if line.strip() == f"%! {_tags.NOT_TOPMOST.string}":
+            not_topmost_index = j
+            break
+        if line.isspace():
+            break
+    if not_topmost_index is not None:
+        assert 0 < not_topmost_index
+        index = -(not_topmost_index + 1)
+        del lines[index]
+    last_line = lines[-1]
+    assert last_line.startswith("} ") or last_line.startswith(">> ")
+    words = last_line.split()
+    index = words.index("%*%")
+    last_line = " ".join(words[:index])
+    last_lines = abjad.tag.double_tag([last_line], tag)
+    last_lines = [_ + "\n" for _ in last_lines]
+    lines[-1:] = last_lines
+    return lines
+
+
+def _get_manifest_entry(section_directory, entry):
+    metadata_py_path = section_directory / ".metadata"
+    if metadata_py_path.is_file():
+        stat = metadata_py_path.stat()
+        stamp = [stat.st_mtime_ns, stat.st_size]
+    else:
+        stamp = [0, 0]
+    if entry is not None and entry.get("stamp") == stamp:
+        return entry
+    entry = entry or {}
+    entry = {_: entry[_] for _ in ("first_page_number", "page_count") if _ in entry}
+    metadata = get_metadata(section_directory)
+    for key in _MANIFEST_KEYS:
+        if key in metadata:
+            entry[key] = metadata[key]
+    entry["stamp"] = stamp
+    return entry
+
+
+def _get_manifest_path(sections_directory):
+    return sections_directory.parent / ".cache" / "manifest.json"
+
+
+def _get_music_section_directories(sections_directory):
+    paths = _get_section_directories(sections_directory)
+    return [_ for _ in paths if (_ / "music.py").is_file()]
+
+
+def _get_section_directories(sections_directory):
+    # adding or removing section directory changes mtime of sections directory
+    mtime_ns = sections_directory.stat().st_mtime_ns
+    cached = _SECTION_DIRECTORIES.get(sections_directory)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    paths = list(sorted(sections_directory.glob("*")))
     paths = [_ for _ in paths if not _.name.startswith(".")]
     paths = [_ for _ in paths if _.is_dir()]
-    index = paths.index(section)
-    if index == 0:
+    _SECTION_DIRECTORIES[sections_directory] = (mtime_ns, paths)
+    return paths
+
+
+@contextlib.contextmanager
+def _lock_manifest(sections_directory):
+    manifest_path = _get_manifest_path(sections_directory)
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    lock_path = manifest_path.with_name(f"{manifest_path.name}.lock")
+    with lock_path.open("a") as pointer:
+        if sys.platform == "win32":
+            # fcntl is POSIX-only; Windows builds write manifest without lock
+            yield manifest_path
+            return
+        import fcntl
+
+        fcntl.flock(pointer, fcntl.LOCK_EX)
+        try:
+            yield manifest_path
+        finally:
+            fcntl.flock(pointer, fcntl.LOCK_UN)
+
+
+def _read_manifest(manifest_path):
+    try:
+        return json.loads(manifest_path.read_text())
+    except (FileNotFoundError, ValueError):
         return {}
-    previous_index = index - 1
-    previous_section = paths[previous_index]
-    return previous_section
+
+
+def _write_extern_preamble(pointer, preamble_lines, include_lines):
+    last_include = 0
+    for i, line in enumerate(preamble_lines):
+        if line.startswith(r"\include"):
+            last_include = i
+    preamble_lines[last_include + 1 : last_include + 1] = include_lines
+    if preamble_lines[-2] == "\n":
+        del preamble_lines[-2]
+    pointer.writelines(preamble_lines)
+
+
+def _write_manifest(sections_directory, entries, *, names=None):
+    # entries are made before locking: making entry may write .metadata
+    with _lock_manifest(sections_directory) as manifest_path:
+        manifest = _read_manifest(manifest_path)
+        manifest.update(entries)
+        if names is not None:
+            manifest = {k: v for k, v in manifest.items() if k in names}
+        manifest = dict(sorted(manifest.items()))
+        write_text(manifest_path, json.dumps(manifest, indent=4) + "\n")
+
+
+@dataclasses.dataclass(slots=True)
+class ScoreProject:
+    """
+    Score project.
+
+    Resolves directories of score once per process; get with
+    ``baca.path.get_score_project()``.
+    """
+
+    wrapper_directory: pathlib.Path
+
+    @property
+    def builds_directory(self) -> pathlib.Path:
+        """
+        Gets builds directory.
+        """
+        return self.contents_directory / "builds"
+
+    @property
+    def contents_directory(self) -> pathlib.Path:
+        """
+        Gets contents directory.
+        """
+        return self.wrapper_directory / self.wrapper_directory.name
+
+    @property
+    def parts_directories(self) -> list[pathlib.Path]:
+        """
+        Gets parts directories.
+        """
+        if not self.builds_directory.is_dir():
+            return []
+        paths = sorted(self.builds_directory.glob("*-parts"))
+        return [_ for _ in paths if _.is_dir()]
+
+    @property
+    def section_directories(self) -> list[pathlib.Path]:
+        """
+        Gets section directories in order.
+
+        Rereads sections directory only when sections are added or removed.
+        """
+        if not self.sections_directory.is_dir():
+            return []
+        return list(_get_section_directories(self.sections_directory))
+
+    @property
+    def sections_directory(self) -> pathlib.Path:
+        """
+        Gets sections directory.
+        """
+        return self.contents_directory / "sections"
+
+    def next_section(self, section_directory: pathlib.Path) -> pathlib.Path | None:
+        """
+        Gets section directory after ``section_directory``.
+
+        Skips section directories without music.py.
+        """
+        paths = _get_music_section_directories(self.sections_directory)
+        index = paths.index(section_directory)
+        if index == len(paths) - 1:
+            return None
+        return paths[index + 1]
+
+    def previous_section(self, section_directory: pathlib.Path) -> pathlib.Path | None:
+        """
+        Gets section directory before ``section_directory``.
+
+        Skips section directories without music.py.
+        """
+        paths = _get_music_section_directories(self.sections_directory)
+        index = paths.index(section_directory)
+        if index == 0:
+            return None
+        return paths[index - 1]
+
+
+def activate(
+    path: pathlib.Path,
+    tag: abjad.Tag | typing.Callable,
+    *,
+    name: str | None = None,
+    undo: bool = False,
+) -> tuple[int, int, list[str]]:
+    """
+    Activates ``tag`` in ``path``.
+
+    Activates in every .ly and .ily file when ``path`` is a directory.
+
+    Rewrites only files that change, and rewrites them with ``write_text()``; files
+    hard-linked into other directories are never modified in place.
+
+    Uses tag index of each file to skip files without matching lines and to visit
+    only matching lines; updates index in place.
+
+    Returns (count, skipped, messages) triple.
+    """
+    assert isinstance(path, pathlib.Path), repr(path)
+    assert isinstance(tag, abjad.Tag) or callable(tag), repr(tag)
+    if name is None:
+        if isinstance(tag, abjad.Tag):
+            name = tag.string
+        else:
+            name = getattr(tag, "__name__", "matching")
+    if path.is_file():
+        files = [path]
+    else:
+        files = sorted(_ for _ in path.glob("**/*") if _.suffix in (".ily", ".ly"))
+    count, skipped = 0, 0
+    for file in files:
+        index = _tags.get_tag_index(file)
+        lines = index.find(tag)
+        if lines == []:
+            continue
+        text = file.read_text()
+        if lines is None:
+            if undo:
+                text_, count_, skipped_ = abjad.deactivate(text, tag)
+            else:
+                text_, count_, skipped_ = abjad.activate(text, tag)
+        else:
+            text_, count_, skipped_ = _tags._apply_tag_index(
+                text, index, lines, tag, prepend_empty_chord=False, undo=undo
+            )
+        if text_ != text:
+            write_text(file, text_)
+            # index is remade from file when lines were not visited through index
+            _tags.write_tag_index(file, None if lines is None else index, text=text_)
+        count += count_
+        skipped += skipped_
+    messages = _tags._get_activation_messages(name, count, skipped, undo=undo)
+    return count, skipped, messages
 
 
 def add_metadatum(path: pathlib.Path, name: str, value) -> None:
@@ -44,9 +389,25 @@ def add_metadatum(path: pathlib.Path, name: str, value) -> None:
     write_metadata_py(path, metadata)
 
 
+def deactivate(
+    path: pathlib.Path,
+    tag: abjad.Tag | typing.Callable,
+    *,
+    name: str | None = None,
+) -> tuple[int, int, list[str]]:
+    """
+    Deactivates ``tag`` in ``path``.
+
+    Returns (count, skipped, messages) triple.
+    """
+    return activate(path, tag, name=name, undo=True)
+
+
 def extern(
     path: pathlib.Path,
     include_path: pathlib.Path,
+    *,
+    text: str | None = None,
 ):
     """
     Externalizes LilyPond file parsable chunks.
@@ -56,148 +417,156 @@ def extern(
     Overwrites ``path`` with skeleton ``.ly``.
 
     Writes ``.ily`` to ``include_path``.
+
+    Reads ``text`` instead of ``path`` when ``text`` is not none. Streams input once;
+    writes both outputs to temporary files and then renames temporary files.
     """
     assert isinstance(path, pathlib.Path), repr(path)
     assert isinstance(include_path, pathlib.Path), repr(include_path)
     tag = _helpers.function_name(_frame())
     assert isinstance(include_path, type(path)), repr(include_path)
-    preamble_lines: list[str] = []
-    score_lines: list[str] = []
+    if include_path.parent == path.parent:
+        include_name = include_path.name
+    else:
+        include_name = str(include_path)
+    include_line = f'\\include "{include_name}"'
+    include_lines = abjad.tag.double_tag([include_line], tag)
+    include_lines = [_ + "\n" for _ in include_lines]
+    preamble_lines: list[str] | None = []
     stack: dict[str, list[str]] = {}
-    finished_variables = {}
     found_score = False
-    with open(path) as pointer:
-        readlines = pointer.readlines()
-    for line in readlines:
-        if (
-            line.startswith(r"\score")
-            or line.startswith(r"\context Score")
-            or line.startswith("{")
-        ):
-            found_score = True
-        if not found_score:
-            preamble_lines.append(line)
-        elif " %*% " in line:
-            words = line.split()
-            index = words.index("%*%")
-            name = words[index + 1]
-            # first line in expression:
-            if name not in stack:
-                stack[name] = []
-                stack[name].append(line)
-            # last line in expression
-            else:
-                stack[name].append(line)
-                finished_variables[name] = stack[name]
-                del stack[name]
+    found_variable = False
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_include_path = include_path.with_name(f".{include_path.name}.{os.getpid()}.tmp")
+    with contextlib.ExitStack() as exit_stack:
+        source: typing.TextIO
+        if text is None:
+            source = exit_stack.enter_context(path.open())
+        else:
+            source = io.StringIO(text)
+        ly_pointer = exit_stack.enter_context(tmp_path.open("w"))
+        ily_pointer = exit_stack.enter_context(tmp_include_path.open("w"))
+        for line in source:
+            if not found_score and (
+                line.startswith(r"\score")
+                or line.startswith(r"\context Score")
+                or line.startswith("{")
+            ):
+                found_score = True
+                assert preamble_lines is not None
+                _write_extern_preamble(ly_pointer, preamble_lines, include_lines)
+                preamble_lines = None
+            if not found_score:
+                assert preamble_lines is not None
+                preamble_lines.append(line)
+            elif " %*% " in line:
+                words = line.split()
+                index = words.index("%*%")
+                name = words[index + 1]
+                # first line in expression:
+                if name not in stack:
+                    stack[name] = [line]
+                    continue
+                # last line in expression
+                variable_lines = stack.pop(name)
+                variable_lines.append(line)
+                if found_variable:
+                    ily_pointer.write("\n\n")
+                found_variable = True
+                ily_pointer.writelines(
+                    _get_extern_variable_lines(name, variable_lines, tag)
+                )
                 count = len(line) - len(line.lstrip())
                 indent = count * " "
                 dereference_string = indent + rf"{{ \{name} }}"
-                first_line = finished_variables[name][0]
                 result = abjad.tag.double_tag([dereference_string], tag)
                 dereference = []
                 for tag_line in result[:1]:
                     dereference.append(indent + tag_line)
                 dereference.append(result[-1])
                 dereference = [_ + "\n" for _ in dereference]
-                if bool(stack):
-                    items = list(stack.items())
-                    items[-1][-1].extend(dereference)
+                if stack:
+                    next(reversed(stack.values())).extend(dereference)
                 else:
-                    score_lines.extend(dereference)
-        elif bool(stack):
-            items = list(stack.items())
-            items[-1][-1].append(line)
-        else:
-            score_lines.append(line)
-    lines = []
-    if include_path.parent == path.parent:
-        include_name = include_path.name
-    else:
-        include_name = str(include_path)
-    include_line = f'\\include "{include_name}"'
-    include_lines = abjad.tag.double_tag([include_line], tag)
-    include_lines = [_ + "\n" for _ in include_lines]
-    last_include = 0
-    for i, line in enumerate(preamble_lines):
-        if line.startswith(r"\include"):
-            last_include = i
-    preamble_lines[last_include + 1 : last_include + 1] = include_lines
-    if preamble_lines[-2] == "\n":
-        del preamble_lines[-2]
-    lines.extend(preamble_lines)
-    lines.extend(score_lines)
-    lines_ = []
-    for line in lines:
-        lines_.append(line)
-    text = "".join(lines_)
-    path.write_text(text)
-    lines = []
-    items = list(finished_variables.items())
-    total = len(items)
-    for i, item in enumerate(items):
-        name, variable_lines = item
-        first_line = variable_lines[0]
-        count = len(first_line) - len(first_line.lstrip())
-        first_line = first_line[count:]
-        first_line = f"{name} = {first_line}"
-        words = first_line.split()
-        index = words.index("%*%")
-        first_line = " ".join(words[:index])
-        first_lines = abjad.tag.double_tag([first_line], tag)
-        first_lines = [_ + "\n" for _ in first_lines]
-        lines.extend(first_lines)
-        for variable_line in variable_lines[1:]:
-            assert variable_line[:count].isspace(), repr(line)
-            variable_line = variable_line[count:]
-            if variable_line == "":
-                variable_line = "\n"
-            assert variable_line.endswith("\n"), repr(variable_line)
-            lines.append(variable_line)
-        not_topmost_index = None
-        for j, line in enumerate(reversed(lines)):
-            if line.strip() == f"%! {_tags.NOT_TOPMOST.string}":
-                not_topmost_index = j
-                break
-            if line.isspace():
-                break
-        if not_topmost_index is not None:
-            assert 0 < not_topmost_index
-            index = -(not_topmost_index + 1)
-            del lines[index]
-        last_line = lines[-1]
-        assert last_line.startswith("} ") or last_line.startswith(">> ")
-        words = last_line.split()
-        index = words.index("%*%")
-        last_line = " ".join(words[:index])
-        last_lines = abjad.tag.double_tag([last_line], tag)
-        last_lines = [_ + "\n" for _ in last_lines]
-        lines[-1:] = last_lines
-        if i < total - 1:
-            lines.append("\n")
-            lines.append("\n")
-    text = "".join(lines)
-    include_path.write_text(text)
+                    ly_pointer.writelines(dereference)
+            elif stack:
+                next(reversed(stack.values())).append(line)
+            else:
+                ly_pointer.write(line)
+        if preamble_lines is not None:
+            _write_extern_preamble(ly_pointer, preamble_lines, include_lines)
+    os.replace(tmp_path, path)
+    os.replace(tmp_include_path, include_path)
 
 
 def get_contents_directory(path: pathlib.Path):
+    assert isinstance(path, pathlib.Path), repr(path)
+    return get_score_project(path).contents_directory
+
+
+def get_score_project(path: pathlib.Path) -> ScoreProject:
+    """
+    Gets (cached) score project of score containing ``path``.
+    """
     assert isinstance(path, pathlib.Path), repr(path)
     wrapper_directory = get_wrapper_directory(path)
-    contents_directory = wrapper_directory / wrapper_directory.name
-    return contents_directory
+    project = _SCORE_PROJECTS.get(wrapper_directory)
+    if project is None:
+        project = _SCORE_PROJECTS[wrapper_directory] = ScoreProject(wrapper_directory)
+    return project
 
 
 def get_wrapper_directory(path: pathlib.Path):
+    """
+    Gets wrapper directory of ``path``.
+
+    Caches wrapper directory of each directory probed for .git.
+    """
     assert isinstance(path, pathlib.Path), repr(path)
     parts = str(path).split(os.sep)
+    probed = []
     while parts:
         string = os.sep.join(parts)
+        wrapper_directory = _WRAPPER_DIRECTORIES.get(string)
+        if wrapper_directory is not None:
+            break
+        probed.append(string)
         candidate = pathlib.Path(string)
         _git = candidate / ".git"
         if _git.is_dir():
-            return candidate
+            wrapper_directory = candidate
+            break
         parts.pop()
-    raise Exception(path)
+    else:
+        raise Exception(path)
+    for string in probed:
+        _WRAPPER_DIRECTORIES[string] = wrapper_directory
+    return wrapper_directory
+
+
+def get_manifest(path: pathlib.Path) -> dict[str, dict]:
+    """
+    Gets score manifest of score containing ``path``.
+
+    Maps section names to measure range, time signatures, fermata measure numbers,
+    clock times and page numbers of each section. Reads manifest from
+    .cache/manifest.json in contents directory; refreshes entries of sections whose
+    .metadata changed since manifest was written.
+    """
+    assert isinstance(path, pathlib.Path), repr(path)
+    project = get_score_project(path)
+    sections_directory = project.sections_directory
+    manifest = _read_manifest(_get_manifest_path(sections_directory))
+    result, refreshed = {}, {}
+    for section_directory in project.section_directories:
+        name = section_directory.name
+        entry = manifest.get(name)
+        result[name] = _get_manifest_entry(section_directory, entry)
+        if result[name] is not entry:
+            refreshed[name] = result[name]
+    if refreshed or manifest.keys() != result.keys():
+        _write_manifest(sections_directory, refreshed, names=set(result))
+    return result
 
 
 def get_measure_profile_metadata(path: pathlib.Path) -> tuple[int, int, list]:
@@ -228,43 +597,59 @@ def get_measure_profile_metadata(path: pathlib.Path) -> tuple[int, int, list]:
         first_measure_number = 1
         measure_count = 0
         fermata_measure_numbers = []
-        contents_directory = get_contents_directory(path)
-        sections_directory = contents_directory / "sections"
-        section_directories = list(sorted(sections_directory.glob("*")))
-        for section_directory in section_directories:
-            if not section_directory.is_dir():
-                continue
-            time_signatures = get_metadata(section_directory).get("time_signatures")
+        for entry in get_manifest(path).values():
+            time_signatures = entry.get("time_signatures")
             assert isinstance(time_signatures, list)
             measure_count += len(time_signatures)
-            fermata_measure_numbers_ = get_metadata(section_directory).get(
-                "fermata_measure_numbers",
-                [],
-            )
-            fermata_measure_numbers.extend(fermata_measure_numbers_)
+            fermata_measure_numbers.extend(entry.get("fermata_measure_numbers", []))
     assert isinstance(fermata_measure_numbers, list), repr(fermata_measure_numbers)
     return (first_measure_number, measure_count, fermata_measure_numbers)
 
 
 def get_metadata(directory: pathlib.Path) -> types.MappingProxyType:
+    """
+    Gets metadata of ``directory``.
+
+    Caches metadata by path, modification time and size of .metadata; repeated reads
+    of unchanged .metadata do not reread file. Rewrites .metadata written as Python
+    (instead of JSON) as JSON.
+    """
     assert isinstance(directory, pathlib.Path), repr(directory)
     assert directory.is_dir(), repr(directory)
     metadata_py_path = directory / ".metadata"
-    dictionary = {}
-    if metadata_py_path.is_file():
-        file_contents_string = metadata_py_path.read_text()
-        baca = importlib.import_module("baca")
-        namespace = {"abjad": abjad, "baca": baca}
-        namespace.update(abjad.__dict__)
-        namespace.update(baca.__dict__)
-        dictionary = eval(file_contents_string, namespace)
-    metadata = types.MappingProxyType(dictionary)
+    try:
+        stat = metadata_py_path.stat()
+    except FileNotFoundError:
+        return types.MappingProxyType({})
+    key = metadata_py_path.resolve()
+    cached = _METADATA_CACHE.get(key)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        dictionary = cached[2]
+    else:
+        string = metadata_py_path.read_text()
+        try:
+            dictionary = json.loads(string, object_hook=_decode_metadatum)
+        except ValueError:
+            dictionary = None
+        if dictionary is not None:
+            _METADATA_CACHE[key] = (stat.st_mtime_ns, stat.st_size, dictionary)
+        else:
+            dictionary = dict(_eval_metadata(string))
+            write_metadata_py(directory, types.MappingProxyType(dictionary))
+            dictionary = _METADATA_CACHE[key][2]
+    metadata = types.MappingProxyType(_copy_metadatum(dictionary))
     return metadata
 
 
-def previous_metadata(path: pathlib.Path) -> types.MappingProxyType:
+def previous_metadata(
+    path: pathlib.Path, *, project: ScoreProject | None = None
+) -> types.MappingProxyType:
     assert isinstance(path, pathlib.Path), repr(path)
-    previous_section = _get_previous_section(path)
+    section = path.parent
+    assert section.parent.name == "sections", repr(section)
+    if project is None:
+        project = get_score_project(section)
+    previous_section = project.previous_section(section)
     if previous_section:
         previous_metadata = get_metadata(previous_section)
     else:
@@ -295,11 +680,74 @@ def trim(path: pathlib.Path):
     return str(path)
 
 
-def write_metadata_py(path: pathlib.Path, metadata: types.MappingProxyType):
+def update_manifest(
+    section_directory: pathlib.Path,
+    *,
+    first_page_number: int | None = None,
+    page_count: int | None = None,
+) -> dict:
+    """
+    Updates score manifest entry of ``section_directory`` from section's .metadata.
+
+    Sets first page number and page count of section when not none.
+    """
+    assert isinstance(section_directory, pathlib.Path), repr(section_directory)
+    assert section_directory.parent.name == "sections", repr(section_directory)
+    sections_directory = section_directory.parent
+    manifest = _read_manifest(_get_manifest_path(sections_directory))
+    entry = manifest.get(section_directory.name)
+    entry = dict(_get_manifest_entry(section_directory, entry))
+    if first_page_number is not None:
+        entry["first_page_number"] = first_page_number
+    if page_count is not None:
+        entry["page_count"] = page_count
+    _write_manifest(sections_directory, {section_directory.name: entry})
+    return entry
+
+
+def write_text(path: pathlib.Path, text: str) -> None:
+    """
+    Writes ``text`` to temporary file and then renames temporary file to ``path``.
+
+    Readers never see partially written files; hard links to ``path`` keep their
+    previous contents.
+    """
+    assert isinstance(path, pathlib.Path), repr(path)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(text)
+    os.replace(tmp_path, path)
+
+
+def write_metadata_py(
+    path: pathlib.Path,
+    metadata: types.MappingProxyType,
+    *,
+    indent: int | None = 4,
+) -> None:
+    """
+    Writes ``metadata`` to .metadata in ``path`` as JSON.
+
+    Checks types of known keys; writes tuples as lists for keys of list type.
+    Encodes tuples, tags and mementos as typed JSON objects and other non-JSON values
+    as reprs. Writes one line when ``indent`` is none.
+    """
     assert isinstance(path, pathlib.Path), repr(path)
     assert isinstance(metadata, types.MappingProxyType), repr(metadata)
-    metadata = types.MappingProxyType(dict(sorted(metadata.items())))
-    string = str(metadata)
-    string = black.format_str(string, mode=black.mode.Mode())
+    dictionary = {}
+    for key, value in sorted(metadata.items()):
+        prototype = _METADATA_SCHEMA.get(key)
+        if prototype is list and isinstance(value, tuple):
+            value = list(value)
+        if prototype is not None and not isinstance(value, prototype):
+            name = prototype.__name__
+            raise TypeError(f"{key} must be {name} (not {value!r}).")
+        dictionary[key] = value
+    string = json.dumps(_encode_metadatum(dictionary), indent=indent) + "\n"
     metadata_py_path = path / ".metadata"
-    metadata_py_path.write_text(string)
+    write_text(metadata_py_path, string)
+    stat = metadata_py_path.stat()
+    dictionary = json.loads(string, object_hook=_decode_metadatum)
+    key = metadata_py_path.resolve()
+    _METADATA_CACHE[key] = (stat.st_mtime_ns, stat.st_size, dictionary)
+    if path.parent.name == "sections":
+        update_manifest(path)
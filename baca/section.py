@@ -2,6 +2,7 @@
 Interpret.
 """
 
+import bisect
 import copy
 import dataclasses
 import importlib
@@ -15,6 +16,7 @@ from inspect import currentframe as _frame
 
 import abjad
 
+from . import array as _array
 from . import build as _build
 from . import classes as _classes
 from . import docs as _docs
@@ -25,14 +27,15 @@ from . import memento as _memento
 from . import override as _override
 from . import parts as _parts
 from . import path as _path
-from . import pcollections as _pcollections
 from . import pitchtools as _pitchtools
 from . import select as _select
 from . import tags as _tags
+from . import timing as _timing
 from . import treat as _treat
 from .enums import enums as _enums
 
 
+@_timing.profiled
 def _add_container_identifiers(score, section_number):
     if section_number is not None:
         assert section_number, repr(section_number)
@@ -105,6 +108,13 @@ def _add_container_identifiers(score, section_number):
     return container_to_part_assignment
 
 
+def _add_stage(score, stages, stage):
+    if stages is None:
+        _run_stages(score, [stage])
+    else:
+        stages.append(stage)
+
+
 def _analyze_memento(contexts, dictionary, memento):
     previous_indicator = _memento_to_indicator(dictionary, memento)
     if previous_indicator is None:
@@ -174,11 +184,12 @@ def _assert_nonoverlapping_rhythms(rhythms, voice):
 # LilyPond doesn't understand repeat-tied notes to be tied;
 # because of this LilyPond incorrectly prints accidentals in front of some
 # repeat-tied notes; this function works around LilyPond's behavior
-def _attach_shadow_tie_indicators(score):
+def _attach_shadow_tie_indicators(score, *, stages=None):
     tag = _helpers.function_name(_frame())
-    for plt in _select.plts(score):
+
+    def handler(plt):
         if len(plt) == 1:
-            continue
+            return
         for pleaf in plt[:-1]:
             if abjad.get.has_indicator(pleaf, abjad.Tie):
                 continue
@@ -186,6 +197,9 @@ def _attach_shadow_tie_indicators(score):
             bundle = abjad.bundle(tie, r"- \tweak stencil ##f")
             abjad.attach(bundle, pleaf, tag=tag)
 
+    stage = _Stage("_attach_shadow_tie_indicators", "plts", handler)
+    _add_stage(score, stages, stage)
+
 
 def _attach_sounds_during(score):
     for voice in abjad.iterate.components(score, abjad.Voice):
@@ -286,11 +300,22 @@ def _calculate_clock_times(
     assert (len(skips) == len(rests)) or (len(skips) == len(rests) + 1)
     start_clock_time = previous_stop_clock_time
     start_clock_time = start_clock_time or "0'00''"
-    start_offset = abjad.Duration.from_clock_string(start_clock_time)
     if clock_time_override:
         metronome_mark = clock_time_override
         abjad.attach(metronome_mark, skips[0])
-    if abjad.get.effective(skips[0], abjad.MetronomeMark) is None:
+    fermata_durations = {}
+    for local_measure_index, rest in enumerate(rests):
+        measure_number = first_measure_number + local_measure_index
+        if measure_number in fermata_measure_numbers:
+            fermata_duration = abjad.get.annotation(rest, _enums.FERMATA_DURATION)
+            fermata_durations[measure_number] = fermata_duration
+    tempo_map = TempoMap(
+        skips,
+        fermata_durations=fermata_durations,
+        first_measure_number=first_measure_number,
+        start_clock_time=start_clock_time,
+    )
+    if tempo_map.get_metronome_mark(first_measure_number) is None:
         return types.SimpleNamespace(
             duration_clock_string=None,
             clock_times=None,
@@ -298,20 +323,13 @@ def _calculate_clock_times(
             stop_clock_time=None,
         )
     clock_times = []
-    for local_measure_index, skip in enumerate(skips):
-        if abjad.get.has_indicator(skip, _enums.CLOCK_TIME_RESTART):
-            start_offset = abjad.Duration(0)
+    for local_measure_index in range(len(skips)):
         measure_number = first_measure_number + local_measure_index
-        if measure_number not in fermata_measure_numbers:
-            clock_times.append(start_offset)
-            duration = abjad.get.duration(skip, in_seconds=True)
+        if measure_number in fermata_durations:
+            clock_times.append(tempo_map.get_duration(measure_number))
         else:
-            rest = rests[local_measure_index]
-            fermata_duration = abjad.get.annotation(rest, _enums.FERMATA_DURATION)
-            duration = abjad.Duration(fermata_duration)
-            clock_times.append(duration)
-        start_offset += duration
-    clock_times.append(start_offset)
+            clock_times.append(tempo_map.measure_seconds(measure_number))
+    clock_times.append(tempo_map.total_seconds())
     assert len(skips) == len(clock_times) - 1
     if clock_time_override:
         metronome_mark = clock_time_override
@@ -347,6 +365,7 @@ def _check_all_music_in_part_containers(score):
             raise Exception(message)
 
 
+@_timing.profiled
 def _check_anchors_are_final(score):
     anchor_count, violators = 0, []
     for leaf in abjad.iterate.leaves(score):
@@ -361,8 +380,8 @@ def _check_anchors_are_final(score):
         raise Exception(message)
 
 
-def _check_doubled_dynamics(score):
-    for leaf in abjad.iterate.leaves(score):
+def _check_doubled_dynamics(score, *, stages=None):
+    def handler(leaf):
         dynamics = abjad.get.indicators(leaf, abjad.Dynamic)
         if 1 < len(dynamics):
             voice = abjad.get.parentage(leaf).get(abjad.Voice)
@@ -372,6 +391,9 @@ def _check_doubled_dynamics(score):
                 message += f"\n   {dynamic!s}"
             raise Exception(message)
 
+    stage = _Stage("_check_doubled_dynamics", "leaves", handler)
+    _add_stage(score, stages, stage)
+
 
 def _check_duplicate_part_assignments(dictionary, part_manifest):
     if not dictionary:
@@ -397,55 +419,151 @@ def _check_duplicate_part_assignments(dictionary, part_manifest):
         raise Exception(message)
 
 
-def _check_persistent_indicators(do_not_require_short_instrument_names, score):
-    indicator = _enums.SOUNDS_DURING_SECTION
-    for voice in abjad.iterate.components(score, abjad.Voice):
-        if not abjad.get.has_indicator(voice, indicator):
+def _check_notes_on_wrong_clef(score, table):
+    violators, total = [], set()
+    for leaf in abjad.iterate.leaves(score):
+        total.add(leaf)
+        instrument = table.get(leaf, abjad.Instrument)
+        if instrument is None:
             continue
-        for i, leaf in enumerate(abjad.iterate.leaves(voice)):
-            _check_persistent_indicators_for_leaf(
-                do_not_require_short_instrument_names, leaf, i, voice.name
-            )
+        effective_clef = table.get(leaf, abjad.Clef)
+        if effective_clef is None:
+            continue
+        clefs = []
+        for clef in instrument.clefs:
+            if isinstance(clef, str):
+                clef = abjad.Clef(clef)
+            assert isinstance(clef, abjad.Clef), repr(clef)
+            clefs.append(clef)
+        clefs.append(abjad.Clef("percussion"))
+        if effective_clef not in clefs:
+            violators.append(leaf)
+    return violators, len(total)
+
+
+def _check_out_of_range_pitches(score, table):
+    violators, total = [], set()
+    allow_indicators = (_enums.ALLOW_OUT_OF_RANGE, _enums.HIDDEN)
+    unpitched = "unpitched" in abjad.get.indicators(score, str)
+    for pleaf in abjad.iterate.leaves(score, pitched=True):
+        total.add(pleaf)
+        if any(abjad.get.has_indicator(pleaf, _) for _ in allow_indicators):
+            continue
+        if unpitched:
+            continue
+        instrument = table.get(pleaf, abjad.Instrument)
+        if instrument is None:
+            continue
+        if not _sounding_pitches_are_in_range(pleaf, instrument):
+            violators.append(pleaf)
+    return violators, len(total)
+
+
+def _check_persistent_indicators(
+    do_not_require_short_instrument_names, score, *, stages=None, table=None
+):
+    indicator = _enums.SOUNDS_DURING_SECTION
+    if table is None:
+        table = _StateTable(score)
+
+    def handler(voice, i, leaf):
+        if not voice._has_indicator(indicator):
+            return
+        _check_persistent_indicators_for_leaf(
+            do_not_require_short_instrument_names, leaf, i, voice.name, table
+        )
+
+    stage = _Stage("_check_persistent_indicators", "voice_leaves", handler)
+    _add_stage(score, stages, stage)
 
 
 def _check_persistent_indicators_for_leaf(
-    do_not_require_short_instrument_names, leaf, i, voice_name
+    do_not_require_short_instrument_names, leaf, i, voice_name, table
 ):
     prototype = (
         _classes.Accelerando,
         abjad.MetronomeMark,
         _classes.Ritardando,
     )
-    mark = abjad.get.effective(leaf, prototype)
+    mark = table.get(leaf, prototype)
     if mark is None:
         message = f"{voice_name} leaf {i} ({leaf!s}) missing metronome mark."
         raise Exception(message)
-    instrument = abjad.get.effective(leaf, abjad.Instrument)
+    instrument = table.get(leaf, abjad.Instrument)
     if instrument is None:
         message = f"{voice_name} leaf {i} ({leaf!s}) missing instrument."
         raise Exception(message)
     if not do_not_require_short_instrument_names:
-        name = abjad.get.effective(leaf, abjad.ShortInstrumentName)
+        name = table.get(leaf, abjad.ShortInstrumentName)
         if name is None:
             message = f"{voice_name} leaf {i} ({leaf!s}) missing short instrument name."
             raise Exception(message)
-    clef = abjad.get.effective(leaf, abjad.Clef)
+    clef = table.get(leaf, abjad.Clef)
     if clef is None:
         raise Exception(f"{voice_name} leaf {i} ({leaf!s}) missing clef.")
 
 
-def _clean_up_laissez_vibrer_tie_direction(score):
+def _check_wellformedness(score):
+    """
+    Checks wellformedness exactly as abjad.wf.tabulate_wellformedness() and
+    abjad.wf.check_out_of_range_pitches() do.
+
+    Clef and range checks read instruments and clefs from a state table; abjad
+    makes one effective-indicator lookup per leaf instead.
+    """
+    table = _StateTable(score)
+    strings, count = [], 0
+    for name in (
+        "check_beamed_lone_notes",
+        "check_beamed_long_notes",
+        "check_duplicate_ids",
+        "check_empty_containers",
+        "check_missing_parents",
+        "check_notes_on_wrong_clef",
+        "check_overlapping_beams",
+        "check_overlapping_text_spanners",
+        "check_unmatched_stop_text_spans",
+        "check_unterminated_hairpins",
+        "check_unterminated_text_spanners",
+    ):
+        if name == "check_notes_on_wrong_clef":
+            violators, total = _check_notes_on_wrong_clef(score, table)
+        else:
+            violators, total = getattr(abjad.wf, name)(score)
+        name = name.removeprefix("check_").replace("_", " ")
+        strings.append(f"{len(violators)} /    {total} {name}")
+        count += len(violators)
+    if count:
+        raise Exception("\n" + "\n".join(strings))
+    violators, total = _check_out_of_range_pitches(score, table)
+    if violators:
+        raise Exception(f"{len(violators)} /    {total} out of range pitches")
+
+
+def _clean_up_laissez_vibrer_tie_direction(score, *, stages=None, table=None):
     default = abjad.Clef("treble")
-    for note in abjad.iterate.leaves(score, abjad.Note):
+    if table is None:
+        table = _StateTable(score)
+
+    def handler(note):
         if note.written_duration < 1:
-            continue
+            return
         if not abjad.get.has_indicator(note, abjad.LaissezVibrer):
-            continue
-        clef = abjad.get.effective(note, abjad.Clef, default=default)
+            return
+        clef = table.get(note, abjad.Clef, default=default)
         staff_position = clef.to_staff_position(note.written_pitch)
         if staff_position == abjad.StaffPosition(0):
             abjad.override(note).LaissezVibrerTie.direction = abjad.UP
 
+    stage = _Stage(
+        "_clean_up_laissez_vibrer_tie_direction",
+        "leaves",
+        handler,
+        after=("_set_not_yet_pitched_to_staff_position_zero",),
+        prototype=abjad.Note,
+    )
+    _add_stage(score, stages, stage)
+
 
 def _clean_up_obgcs(score):
     for obgc in abjad.select.components(score, abjad.OnBeatGraceContainer):
@@ -454,14 +572,17 @@ def _clean_up_obgcs(score):
         obgc.attach_lilypond_one_voice()
 
 
-def _clean_up_repeat_tie_direction(score):
+def _clean_up_repeat_tie_direction(score, *, stages=None, table=None):
     default = abjad.Clef("treble")
-    for leaf in abjad.iterate.leaves(score, pitched=True):
+    if table is None:
+        table = _StateTable(score)
+
+    def handler(leaf):
         if leaf.written_duration < 1:
-            continue
+            return
         if not abjad.get.has_indicator(leaf, abjad.RepeatTie):
-            continue
-        clef = abjad.get.effective(leaf, abjad.Clef, default=default)
+            return
+        clef = table.get(leaf, abjad.Clef, default=default)
         if hasattr(leaf, "written_pitch"):
             note_heads = [leaf.note_head]
         else:
@@ -475,6 +596,15 @@ def _clean_up_repeat_tie_direction(score):
                 abjad.attach(bundle, leaf, tag=wrapper.tag)
                 break
 
+    stage = _Stage(
+        "_clean_up_repeat_tie_direction",
+        "leaves",
+        handler,
+        after=("_set_not_yet_pitched_to_staff_position_zero",),
+        prototype=(abjad.Chord, abjad.Note),
+    )
+    _add_stage(score, stages, stage)
+
 
 def _clone_section_initial_short_instrument_name(score):
     prototype = abjad.ShortInstrumentName
@@ -581,6 +711,7 @@ def _collect_metadata(
     return new_metadata_proxy, new_persist_proxy
 
 
+@_timing.profiled
 def _collect_persistent_indicators(
     manifests,
     previous_persistent_indicators,
@@ -696,28 +827,35 @@ def _collect_persistent_indicators(
     return result
 
 
-def _color_mock_pitch(score):
+def _color_mock_pitch(score, *, stages=None):
     indicator = _enums.MOCK
     tag = _helpers.function_name(_frame())
     tag = tag.append(_tags.MOCK_COLORING)
-    leaves = []
-    for pleaf in abjad.iterate.leaves(score, pitched=True):
+
+    def handler(pleaf):
         if not abjad.get.has_indicator(pleaf, indicator):
-            continue
+            return
         string = r"\baca-mock-coloring"
         literal = abjad.LilyPondLiteral(string, site="before")
         abjad.attach(literal, pleaf, tag=tag)
-        leaves.append(pleaf)
+
+    stage = _Stage(
+        "_color_mock_pitch",
+        "leaves",
+        handler,
+        prototype=(abjad.Chord, abjad.Note),
+    )
+    _add_stage(score, stages, stage)
 
 
-def _color_not_yet_pitched(score):
+def _color_not_yet_pitched(score, *, stages=None):
     indicator = _enums.NOT_YET_PITCHED
     tag = _helpers.function_name(_frame())
     tag = tag.append(_tags.NOT_YET_PITCHED_COLORING)
-    leaves = []
-    for pleaf in abjad.iterate.leaves(score, pitched=True):
+
+    def handler(pleaf):
         if not abjad.get.has_indicator(pleaf, indicator):
-            continue
+            return
         string = r"\baca-not-yet-pitched-coloring"
         literal = abjad.LilyPondLiteral(string, site="before")
         tag_ = tag
@@ -726,21 +864,39 @@ def _color_not_yet_pitched(score):
         if abjad.get.has_indicator(pleaf, _enums.NOTE):
             tag_ = tag_.append(_tags.NOTE)
         abjad.attach(literal, pleaf, tag=tag_)
-        leaves.append(pleaf)
+
+    stage = _Stage(
+        "_color_not_yet_pitched",
+        "leaves",
+        handler,
+        after=("_set_intermittent_to_staff_position_zero",),
+        prototype=(abjad.Chord, abjad.Note),
+    )
+    _add_stage(score, stages, stage)
 
 
-def _color_not_yet_registered(score):
+def _color_not_yet_registered(score, *, stages=None):
     indicator = _enums.NOT_YET_REGISTERED
     tag = _helpers.function_name(_frame())
     tag = tag.append(_tags.NOT_YET_REGISTERED_COLORING)
-    for pleaf in abjad.iterate.leaves(score, pitched=True):
+
+    def handler(pleaf):
         if not abjad.get.has_indicator(pleaf, indicator):
-            continue
+            return
         string = r"\baca-not-yet-registered-coloring"
         literal = abjad.LilyPondLiteral(string, site="before")
         abjad.attach(literal, pleaf, tag=tag)
 
+    stage = _Stage(
+        "_color_not_yet_registered",
+        "leaves",
+        handler,
+        prototype=(abjad.Chord, abjad.Note),
+    )
+    _add_stage(score, stages, stage)
+
 
+@_timing.profiled
 def _comment_measure_numbers(first_measure_number, offset_to_measure_number, score):
     for leaf in abjad.iterate.leaves(score):
         offset = abjad.get.timespan(leaf).start_offset
@@ -760,17 +916,28 @@ def _comment_measure_numbers(first_measure_number, offset_to_measure_number, sco
         abjad.attach(literal, leaf, tag=_helpers.function_name(_frame()))
 
 
-def _error_on_not_yet_pitched(score):
+def _error_on_not_yet_pitched(score, *, stages=None):
     violators = []
-    for voice in abjad.iterate.components(score, abjad.Voice):
-        for leaf in abjad.iterate.leaves(voice):
-            if abjad.get.has_indicator(leaf, _enums.NOT_YET_PITCHED):
-                violators.append((voice.name, leaf))
-    if violators:
-        strings = [f"{len(violators)} leaves not yet pitched ..."]
-        strings.extend([f"    {_[0]} {repr(_[1])}" for _ in violators])
-        message = "\n".join(strings)
-        raise Exception(message)
+
+    def handler(voice, i, leaf):
+        if abjad.get.has_indicator(leaf, _enums.NOT_YET_PITCHED):
+            violators.append((voice.name, leaf))
+
+    def finish():
+        if violators:
+            strings = [f"{len(violators)} leaves not yet pitched ..."]
+            strings.extend([f"    {_[0]} {repr(_[1])}" for _ in violators])
+            message = "\n".join(strings)
+            raise Exception(message)
+
+    stage = _Stage(
+        "_error_on_not_yet_pitched",
+        "voice_leaves",
+        handler,
+        after=("_set_not_yet_pitched_to_staff_position_zero",),
+        finish=finish,
+    )
+    _add_stage(score, stages, stage)
 
 
 def _extend_beam(leaf):
@@ -815,8 +982,43 @@ def _find_first_measure_number(previous_metadata):
     return first_measure_number
 
 
-def _find_repeat_pitch_classes(argument):
+def _find_octaves(score, index=None):
+    """
+    Finds pitched leaves of vertical moments that sound the same pitch class twice.
+    """
+    if index is None:
+        index = _array.VerticalSliceIndex(score)
+    candidates = set()
+    for pleaf in abjad.iterate.leaves(score, pitched=True):
+        if abjad.get.has_indicator(pleaf, _enums.HIDDEN):
+            continue
+        if abjad.get.has_indicator(pleaf, _enums.STAFF_POSITION):
+            continue
+        candidates.add(pleaf)
     violators = []
+    for moment in index.moments():
+        pleaves = [_ for _ in moment.leaves if _ in candidates]
+        pitch_classes, octave = set(), False
+        for pleaf in pleaves:
+            if isinstance(pleaf, abjad.Note):
+                pitches = [pleaf.written_pitch]
+            else:
+                pitches = pleaf.written_pitches
+            for pitch in pitches:
+                pitch_class = pitch.pitch_class
+                if pitch_class in pitch_classes:
+                    octave = True
+                pitch_classes.add(pitch_class)
+        if not octave:
+            continue
+        if any(abjad.get.has_indicator(_, _enums.ALLOW_OCTAVE) for _ in pleaves):
+            continue
+        violators.append(pleaves)
+    return violators
+
+
+def _find_repeat_pitch_classes(argument):
+    violators, known_violators = [], set()
     for voice in abjad.iterate.components(argument, abjad.Voice):
         if abjad.get.has_indicator(voice, _enums.INTERMITTENT):
             continue
@@ -836,18 +1038,21 @@ def _find_repeat_pitch_classes(argument):
             ) or abjad.get.has_indicator(lt.head, _enums.ALLOW_REPEAT_PITCH):
                 pass
             elif pcs & previous_pcs:
-                if previous_lt not in violators:
+                if previous_lt.items not in known_violators:
                     violators.append(previous_lt)
-                if lt not in violators:
+                    known_violators.add(previous_lt.items)
+                if lt.items not in known_violators:
                     violators.append(lt)
+                    known_violators.add(lt.items)
             previous_lt = lt
             previous_pcs = pcs
     return violators
 
 
-def _force_nonnatural_accidentals(score):
+def _force_nonnatural_accidentals(score, *, stages=None):
     natural = abjad.Accidental("natural")
-    for plt in _select.plts(score):
+
+    def handler(plt):
         if isinstance(plt[0], abjad.Note):
             note_heads = [plt[0].note_head]
         else:
@@ -856,6 +1061,9 @@ def _force_nonnatural_accidentals(score):
             if note_head.written_pitch.accidental != natural:
                 note_head.is_forced = True
 
+    stage = _Stage("_force_nonnatural_accidentals", "plts", handler)
+    _add_stage(score, stages, stage)
+
 
 def _get_fermata_measure_numbers(first_measure_number, score):
     fermata_start_offsets, fermata_measure_numbers = [], []
@@ -889,6 +1097,14 @@ def _get_measure_number_tag(leaf, offset_to_measure_number):
         return abjad.Tag(f"MEASURE_{measure_number}")
 
 
+def _get_measure_offset_index(score, measure_count):
+    skips = _select.skips(score["Skips"])
+    timespans = [abjad.get.timespan(skips[_]) for _ in range(measure_count)]
+    start_offsets = [_.start_offset for _ in timespans]
+    stop_offsets = [_.stop_offset for _ in timespans]
+    return start_offsets, stop_offsets
+
+
 def _get_measure_offsets(score, start_measure, stop_measure):
     skips = _select.skips(score["Skips"])
     start_skip = skips[start_measure - 1]
@@ -909,6 +1125,47 @@ def _get_measure_timespan(measure_number, score):
     return abjad.Timespan(start_offset, stop_offset)
 
 
+def _group_stages(stages):
+    groups, name_to_stage, name_to_index = [], {}, {}
+    for stage in stages:
+        floor = 0
+        for name in stage.after:
+            if name not in name_to_stage:
+                continue
+            index = name_to_index[name]
+            dependency = name_to_stage[name]
+            if dependency.finish is not None or dependency.kind != stage.kind:
+                index += 1
+            floor = max(floor, index)
+        for index in range(floor, len(groups)):
+            if groups[index][0].kind == stage.kind:
+                groups[index].append(stage)
+                break
+        else:
+            index = len(groups)
+            groups.append([stage])
+        name_to_stage[stage.name] = stage
+        name_to_index[stage.name] = index
+    return groups
+
+
+def _index_leaves_by_measure(leaves, measure_offsets, voice_name_to_leaves_by_measure):
+    start_offsets, stop_offsets = measure_offsets
+    for leaf in leaves:
+        parentage = abjad.get.parentage(leaf)
+        context = parentage.get(abjad.Context)
+        measure_number_to_leaves = voice_name_to_leaves_by_measure.setdefault(
+            context.name, {}
+        )
+        start_offset = abjad.get.timespan(leaf).start_offset
+        measure_index = bisect.bisect_right(start_offsets, start_offset) - 1
+        if measure_index < 0 or stop_offsets[measure_index] <= start_offset:
+            continue
+        cached_leaves = measure_number_to_leaves.setdefault(measure_index + 1, [])
+        cached_leaves.append(leaf)
+
+
+@_timing.profiled
 def _label_clock_time(
     clock_time_override,
     fermata_measure_numbers,
@@ -1008,33 +1265,36 @@ def _label_clock_time(
     )
 
 
-def _label_duration_multipliers(score):
+def _label_duration_multipliers(score, *, stages=None):
     tag = _helpers.function_name(_frame())
     tag = tag.append(_tags.DURATION_MULTIPLIER)
     already_labeled = set()
-    for voice in abjad.iterate.components(score, abjad.Voice):
-        for leaf in abjad.iterate.leaves(voice):
-            if isinstance(leaf, abjad.Skip):
-                continue
-            if leaf.multiplier is None:
-                continue
-            if leaf in already_labeled:
-                continue
-            n, d = leaf.multiplier
-            string = r"\baca-duration-multiplier-markup"
-            string += f' #"{n}" #"{d}"'
-            markup = abjad.Markup(string)
-            tag_ = tag
-            if abjad.get.has_indicator(leaf, _enums.HIDDEN):
-                tag_ = tag_.append(_tags.HIDDEN)
-            if abjad.get.has_indicator(leaf, _enums.MULTIMEASURE_REST):
-                tag_ = tag_.append(_tags.MULTIMEASURE_REST)
-            if abjad.get.has_indicator(leaf, _enums.NOTE):
-                tag_ = tag_.append(_tags.NOTE)
-            if abjad.get.has_indicator(leaf, _enums.REST_VOICE):
-                tag_ = tag_.append(_tags.REST_VOICE)
-            abjad.attach(markup, leaf, deactivate=True, direction=abjad.UP, tag=tag_)
-            already_labeled.add(leaf)
+
+    def handler(voice, i, leaf):
+        if isinstance(leaf, abjad.Skip):
+            return
+        if leaf.multiplier is None:
+            return
+        if leaf in already_labeled:
+            return
+        n, d = leaf.multiplier
+        string = r"\baca-duration-multiplier-markup"
+        string += f' #"{n}" #"{d}"'
+        markup = abjad.Markup(string)
+        tag_ = tag
+        if abjad.get.has_indicator(leaf, _enums.HIDDEN):
+            tag_ = tag_.append(_tags.HIDDEN)
+        if abjad.get.has_indicator(leaf, _enums.MULTIMEASURE_REST):
+            tag_ = tag_.append(_tags.MULTIMEASURE_REST)
+        if abjad.get.has_indicator(leaf, _enums.NOTE):
+            tag_ = tag_.append(_tags.NOTE)
+        if abjad.get.has_indicator(leaf, _enums.REST_VOICE):
+            tag_ = tag_.append(_tags.REST_VOICE)
+        abjad.attach(markup, leaf, deactivate=True, direction=abjad.UP, tag=tag_)
+        already_labeled.add(leaf)
+
+    stage = _Stage("_label_duration_multipliers", "voice_leaves", handler)
+    _add_stage(score, stages, stage)
 
 
 def _label_measure_numbers(first_measure_number, global_skips):
@@ -1207,6 +1467,7 @@ def _memento_to_indicator(dictionary, memento):
     return indicator
 
 
+@_timing.profiled
 def _move_global_rests(
     global_rests_in_every_staff,
     global_rests_in_topmost_staff,
@@ -1337,6 +1598,7 @@ def _reapply_persistent_indicators(
             _treat.treat_persistent_wrapper(manifests, wrapper, result.status)
 
 
+@_timing.profiled
 def _reanalyze_reapplied_synthetic_wrappers(score):
     function_name = _helpers.function_name(_frame())
     for leaf in abjad.iterate.leaves(score):
@@ -1362,6 +1624,7 @@ def _reanalyze_reapplied_synthetic_wrappers(score):
                 wrapper._synthetic_offset = None
 
 
+@_timing.profiled
 def _reanalyze_trending_dynamics(manifests, score):
     for leaf in abjad.iterate.leaves(score):
         for wrapper in abjad.get.wrappers(leaf):
@@ -1383,35 +1646,77 @@ def _remove_layout_tags(score):
                     break
 
 
-def _set_intermittent_to_staff_position_zero(score):
+def _run_stages(score, stages):
+    names = [_.name for _ in stages]
+    done, errors = set(), {}
+    for group in _group_stages(stages):
+        with _timing.phase("+".join(_.name for _ in group)):
+            _traverse_stages(score, group, errors)
+        done.update(_.name for _ in group)
+        if errors:
+            name = min(errors, key=names.index)
+            if set(names[: names.index(name)]) <= done:
+                raise errors[name]
+
+
+def _set_intermittent_to_staff_position_zero(score, *, stages=None):
     pleaves = []
-    for voice in abjad.iterate.components(score, abjad.Voice):
+
+    def handler(voice, i, pleaf):
         if voice._has_indicator(_enums.INTERMITTENT):
-            for pleaf in abjad.iterate.leaves(voice, pitched=True):
-                if abjad.get.has_indicator(pleaf, _enums.NOT_YET_PITCHED):
-                    pleaves.append(pleaf)
-    _pitchtools.staff_position(
-        pleaves,
-        0,
-        allow_hidden=True,
-        set_chord_pitches_equal=True,
+            if abjad.get.has_indicator(pleaf, _enums.NOT_YET_PITCHED):
+                pleaves.append(pleaf)
+
+    def finish():
+        _pitchtools.staff_position(
+            pleaves,
+            0,
+            allow_hidden=True,
+            set_chord_pitches_equal=True,
+        )
+
+    stage = _Stage(
+        "_set_intermittent_to_staff_position_zero",
+        "voice_leaves",
+        handler,
+        finish=finish,
+        prototype=(abjad.Chord, abjad.Note),
     )
+    _add_stage(score, stages, stage)
 
 
-def _set_not_yet_pitched_to_staff_position_zero(score):
+def _set_not_yet_pitched_to_staff_position_zero(score, *, stages=None):
     pleaves = []
-    for pleaf in abjad.iterate.leaves(score, pitched=True):
-        if not abjad.get.has_indicator(pleaf, _enums.NOT_YET_PITCHED):
-            continue
-        pleaves.append(pleaf)
-    _pitchtools.staff_position(
-        pleaves,
-        0,
-        allow_hidden=True,
-        set_chord_pitches_equal=True,
+
+    def handler(pleaf):
+        if abjad.get.has_indicator(pleaf, _enums.NOT_YET_PITCHED):
+            pleaves.append(pleaf)
+
+    def finish():
+        _pitchtools.staff_position(
+            pleaves,
+            0,
+            allow_hidden=True,
+            set_chord_pitches_equal=True,
+        )
+
+    # collects in the same traversal as _color_not_yet_pitched()
+    # but repitches only once that traversal is done
+    stage = _Stage(
+        "_set_not_yet_pitched_to_staff_position_zero",
+        "leaves",
+        handler,
+        after=(
+            "_set_intermittent_to_staff_position_zero",
+            "_color_not_yet_pitched",
+        ),
+        finish=finish,
+        prototype=(abjad.Chord, abjad.Note),
     )
+    _add_stage(score, stages, stage)
 
 
+@_timing.profiled
 def _shift_measure_initial_clefs(
     first_measure_number,
     offset_to_measure_number,
@@ -1432,6 +1737,20 @@ def _shift_measure_initial_clefs(
             _override.clef_shift(leaf, clef, first_measure_number)
 
 
+def _sounding_pitches_are_in_range(pleaf, instrument):
+    if isinstance(pleaf, abjad.Note):
+        written_pitches = [pleaf.written_pitch]
+    else:
+        written_pitches = pleaf.written_pitches
+    if "sounding pitch" in abjad.get.indicators(pleaf, str):
+        sounding_pitches = written_pitches
+    else:
+        interval = abjad.NamedPitch("C4") - instrument.middle_c_sounding_pitch
+        sounding_pitches = [interval.transpose(_) for _ in written_pitches]
+    return all(_ in instrument.pitch_range for _ in sounding_pitches)
+
+
+@_timing.profiled
 def _style_anchor_notes(score):
     for note in abjad.select.components(score, abjad.Note):
         if not abjad.get.has_indicator(note, _enums.ANCHOR_NOTE):
@@ -1440,6 +1759,7 @@ def _style_anchor_notes(score):
         _append_tag_to_wrappers(note, _tags.ANCHOR_NOTE)
 
 
+@_timing.profiled
 def _style_fermata_measures(
     fermata_extra_offset_y,
     fermata_measure_empty_overrides,
@@ -1603,6 +1923,60 @@ def _style_first_measure(global_skips, section_number):
     )
 
 
+def _transpose_from_sounding_pitch(pleaf, instrument):
+    # same as abjad.iterpitches.transpose_from_sounding_pitch() on one leaf,
+    # but with instrument looked up by caller
+    interval = abjad.NamedPitch("C4") - instrument.middle_c_sounding_pitch
+    interval *= -1
+    if isinstance(pleaf, abjad.Note):
+        pleaf.written_pitch = interval.transpose(pleaf.written_pitch)
+    else:
+        pleaf.written_pitches = [interval.transpose(_) for _ in pleaf.written_pitches]
+    wrapper = abjad.get.indicator(pleaf, abjad.StartTrillSpan, unwrap=False)
+    if wrapper is not None:
+        start_trill_span = wrapper.unbundle_indicator()
+        pitch = interval.transpose(start_trill_span.pitch)
+        start_trill_span = dataclasses.replace(start_trill_span, pitch=pitch)
+        abjad.detach(wrapper, pleaf)
+        if wrapper.bundled():
+            bundle = dataclasses.replace(wrapper.get_item(), indicator=start_trill_span)
+            abjad.attach(bundle, pleaf, tag=wrapper.tag)
+        else:
+            abjad.attach(start_trill_span, pleaf, tag=wrapper.tag)
+
+
+def _traverse_stages(score, group, errors):
+    kind = group[0].kind
+    if kind == "leaves":
+        items = ((_,) for _ in abjad.iterate.leaves(score))
+    elif kind == "plts":
+        items = ((_,) for _ in _select.plts(score))
+    else:
+        assert kind == "voice_leaves", repr(kind)
+        items = (
+            (voice, i, leaf)
+            for voice in abjad.iterate.components(score, abjad.Voice)
+            for i, leaf in enumerate(abjad.iterate.leaves(voice))
+        )
+    stages = group
+    for item in items:
+        for stage in stages:
+            if stage.prototype is not None:
+                if not isinstance(item[-1], stage.prototype):
+                    continue
+            try:
+                stage.handler(*item)
+            except Exception as exception:
+                errors[stage.name] = exception
+                stages = [_ for _ in stages if _ is not stage]
+    for stage in stages:
+        if stage.finish is not None:
+            try:
+                stage.finish()
+            except Exception as exception:
+                errors[stage.name] = exception
+
+
 def _update_score_one_time(score):
     is_forbidden_to_update = score._is_forbidden_to_update
     score._is_forbidden_to_update = False
@@ -1610,6 +1984,7 @@ def _update_score_one_time(score):
     score._is_forbidden_to_update = is_forbidden_to_update
 
 
+@_timing.profiled
 def _whitespace_leaves(score):
     for leaf in abjad.iterate.leaves(score):
         literal = abjad.LilyPondLiteral("", site="absolute_before")
@@ -1625,6 +2000,118 @@ def _whitespace_leaves(score):
         abjad.attach(literal, container, tag=None)
 
 
+@dataclasses.dataclass(frozen=True, slots=True)
+class _Stage:
+    """
+    Postprocessing stage.
+
+    Calls ``handler`` on every leaf, pitched logical tie or (voice, index, leaf)
+    triple of score, as ``kind`` is ``"leaves"``, ``"plts"`` or ``"voice_leaves"``;
+    then calls ``finish``. Stages run after the stages named in ``after``; stages
+    of the same kind otherwise share one traversal.
+    """
+
+    name: str
+    kind: str
+    handler: typing.Callable
+    after: tuple[str, ...] = ()
+    finish: typing.Callable | None = None
+    prototype: typing.Any = None
+
+
+class _StateTable:
+    """
+    Effective-indicator state table.
+
+    Sweeps the leaves of ``argument`` once per prototype and then answers
+    ``abjad.get.effective()`` lookups from a dictionary. Rebuild the table after
+    attaching or detaching indicators of the prototypes it has swept.
+    """
+
+    def __init__(self, argument):
+        self._argument = argument
+        self._prototype_to_leaf_to_indicator = {}
+
+    @staticmethod
+    def _get_candidates(component, prototype):
+        wrappers = []
+        for wrapper in component._wrappers:
+            if wrapper.annotation:
+                continue
+            if isinstance(wrapper.unbundle_indicator(), prototype):
+                wrappers.append(wrapper)
+        # active indicator takes precendence over inactive indicator, as in abjad
+        if any(_.deactivate is True for _ in wrappers) and not all(
+            _.deactivate is True for _ in wrappers
+        ):
+            wrappers = [_ for _ in wrappers if _.deactivate is not True]
+        if isinstance(component, abjad.Context):
+            for wrapper in component._dependent_wrappers:
+                if wrapper.annotation:
+                    continue
+                if isinstance(wrapper.unbundle_indicator(), prototype):
+                    wrappers.append(wrapper)
+        offset_to_wrapper = {}
+        for wrapper in wrappers:
+            offset_to_wrapper.setdefault(wrapper.start_offset, wrapper)
+        offsets = sorted(offset_to_wrapper)
+        return offsets, [offset_to_wrapper[_] for _ in offsets]
+
+    def _sweep(self, prototype):
+        leaves = abjad.select.leaves(self._argument)
+        if leaves:
+            # abjad.get.effective() updates indicator offsets of whole score
+            abjad.get.effective(leaves[0], prototype)
+        component_to_candidates = {}
+        leaf_to_indicator = {}
+        for leaf in leaves:
+            start_offset = abjad.get.timespan(leaf).start_offset
+            best_offset, best_wrapper = None, None
+            enclosing_voice_name = None
+            for component in abjad.get.parentage(leaf):
+                if isinstance(component, abjad.Voice):
+                    if (
+                        enclosing_voice_name is not None
+                        and component.name != enclosing_voice_name
+                    ):
+                        continue
+                    enclosing_voice_name = component.name or id(component)
+                if component is leaf:
+                    candidates = self._get_candidates(leaf, prototype)
+                elif id(component) in component_to_candidates:
+                    candidates = component_to_candidates[id(component)]
+                else:
+                    candidates = self._get_candidates(component, prototype)
+                    component_to_candidates[id(component)] = candidates
+                offsets, wrappers = candidates
+                index = bisect.bisect(offsets, start_offset) - 1
+                if index < 0:
+                    continue
+                if best_offset is None or best_offset < offsets[index]:
+                    best_offset, best_wrapper = offsets[index], wrappers[index]
+            if best_wrapper is not None:
+                leaf_to_indicator[leaf] = best_wrapper.unbundle_indicator()
+            else:
+                leaf_to_indicator[leaf] = None
+        return leaf_to_indicator
+
+    def get(self, leaf, prototype, default=None):
+        """
+        Gets effective indicator of ``prototype`` attached to ``leaf``.
+        """
+        leaf_to_indicator = self._prototype_to_leaf_to_indicator.get(prototype)
+        if leaf_to_indicator is None:
+            leaf_to_indicator = self._sweep(prototype)
+            self._prototype_to_leaf_to_indicator[prototype] = leaf_to_indicator
+        if leaf in leaf_to_indicator:
+            indicator = leaf_to_indicator[leaf]
+        else:
+            indicator = abjad.get.effective(leaf, prototype)
+        if indicator is None:
+            return default
+        return indicator
+
+
 @dataclasses.dataclass
 class Analysis:
     leaf: abjad.Leaf
@@ -1694,11 +2181,29 @@ class CacheGetItemWrapper:
                     result.append(result_)
         return result
 
-    def rebuild(self):
-        cache = cache_leaves(
-            self._score, self._measure_count, self._voice_abbreviations
-        )
-        self.voice_name_to_leaves_by_measure = cache.voice_name_to_leaves_by_measure
+    def rebuild(self, *voice_names):
+        """
+        Rebuilds cache; rebuilds only ``voice_names`` when ``voice_names`` is not
+        empty.
+        """
+        if not voice_names:
+            cache = cache_leaves(
+                self._score, self._measure_count, self._voice_abbreviations
+            )
+            self.voice_name_to_leaves_by_measure = cache.voice_name_to_leaves_by_measure
+            self._measure_offsets = cache._measure_offsets
+            return
+        for voice_name in voice_names:
+            voice_name = self.abbreviation_to_voice_name.get(voice_name, voice_name)
+            voice = self._score[voice_name]
+            names = [_.name for _ in abjad.select.components(voice, abjad.Context)]
+            for name in names:
+                self.voice_name_to_leaves_by_measure.pop(name, None)
+            _index_leaves_by_measure(
+                abjad.select.leaves(voice),
+                self._measure_offsets,
+                self.voice_name_to_leaves_by_measure,
+            )
 
 
 class DictionaryGetItemWrapper:
@@ -1735,6 +2240,136 @@ class DictionaryGetItemWrapper:
         return result
 
 
+class TempoMap:
+    """
+    Tempo map of global ``skips``.
+
+    Reads metronome mark and time signature in effect at each measure once; keeps
+    duration of each measure in seconds and clock time at start of each measure.
+    Clock time restarts at zero at ``CLOCK_TIME_RESTART``; fermata measures last
+    the number of seconds given in ``fermata_durations``, keyed by measure number.
+
+    Measures without precise metronome mark have no duration; clock times of
+    those measures and of every later measure are unknown, even after restarts.
+    Queries of unknown durations or clock times raise
+    ``abjad.MissingMetronomeMarkError``.
+    """
+
+    def __init__(
+        self,
+        skips,
+        *,
+        fermata_durations=None,
+        first_measure_number=1,
+        start_clock_time=None,
+    ):
+        fermata_durations = fermata_durations or {}
+        table = _StateTable(skips)
+        self.first_measure_number = first_measure_number
+        self.metronome_marks = [table.get(_, abjad.MetronomeMark) for _ in skips]
+        self.time_signatures = [table.get(_, abjad.TimeSignature) for _ in skips]
+        self.start_offsets = [abjad.get.timespan(_).start_offset for _ in skips]
+        if skips:
+            self.stop_offset = abjad.get.timespan(skips[-1]).stop_offset
+        else:
+            self.stop_offset = abjad.Offset(0)
+        start_clock_time = start_clock_time or "0'00''"
+        seconds = abjad.Duration.from_clock_string(start_clock_time)
+        self.durations, self.start_seconds = [], []
+        for measure_index, skip in enumerate(skips):
+            # restart does not make clock time known after missing metronome mark
+            restart = abjad.get.has_indicator(skip, _enums.CLOCK_TIME_RESTART)
+            if restart and seconds is not None:
+                seconds = abjad.Duration(0)
+            measure_number = first_measure_number + measure_index
+            metronome_mark = self.metronome_marks[measure_index]
+            if measure_number in fermata_durations:
+                duration = abjad.Duration(fermata_durations[measure_number])
+            elif metronome_mark is None or metronome_mark.is_imprecise:
+                duration = None
+            else:
+                duration = (
+                    abjad.get.duration(skip)
+                    / metronome_mark.reference_duration
+                    / metronome_mark.units_per_minute
+                    * 60
+                )
+                duration = abjad.Duration(duration)
+            self.durations.append(duration)
+            self.start_seconds.append(seconds)
+            if seconds is not None and duration is not None:
+                seconds += duration
+            else:
+                seconds = None
+        self.stop_seconds = seconds
+
+    def _measure_index(self, measure_number):
+        measure_index = measure_number - self.first_measure_number
+        if not 0 <= measure_index < len(self.start_offsets):
+            raise IndexError(f"no measure {measure_number}.")
+        return measure_index
+
+    def get_duration(self, measure_number):
+        """
+        Gets duration of measure ``measure_number`` in seconds.
+        """
+        duration = self.durations[self._measure_index(measure_number)]
+        if duration is None:
+            raise abjad.MissingMetronomeMarkError
+        return duration
+
+    def get_metronome_mark(self, measure_number):
+        """
+        Gets metronome mark in effect at measure ``measure_number``.
+        """
+        return self.metronome_marks[self._measure_index(measure_number)]
+
+    def get_time_signature(self, measure_number):
+        """
+        Gets time signature in effect at measure ``measure_number``.
+        """
+        return self.time_signatures[self._measure_index(measure_number)]
+
+    def measure_seconds(self, measure_number):
+        """
+        Gets clock time at start of measure ``measure_number`` in seconds.
+        """
+        seconds = self.start_seconds[self._measure_index(measure_number)]
+        if seconds is None:
+            raise abjad.MissingMetronomeMarkError
+        return seconds
+
+    def offset_seconds(self, offset):
+        """
+        Gets clock time at ``offset`` in seconds.
+
+        Interpolates linearly within measure.
+        """
+        if offset == self.stop_offset:
+            return self.total_seconds()
+        measure_index = bisect.bisect_right(self.start_offsets, offset) - 1
+        if measure_index < 0 or self.stop_offset < offset:
+            raise IndexError(f"offset {offset!s} outside tempo map.")
+        measure_number = self.first_measure_number + measure_index
+        seconds = self.measure_seconds(measure_number)
+        duration = self.get_duration(measure_number)
+        start_offset = self.start_offsets[measure_index]
+        if measure_index + 1 < len(self.start_offsets):
+            stop_offset = self.start_offsets[measure_index + 1]
+        else:
+            stop_offset = self.stop_offset
+        fraction = (offset - start_offset) / (stop_offset - start_offset)
+        return seconds + abjad.Duration(fraction * duration)
+
+    def total_seconds(self):
+        """
+        Gets clock time at end of final measure in seconds.
+        """
+        if self.stop_seconds is None:
+            raise abjad.MissingMetronomeMarkError
+        return self.stop_seconds
+
+
 @dataclasses.dataclass(frozen=True, order=True, slots=True, unsafe_hash=True)
 class TimeSignatureServer:
     time_signatures: list[abjad.TimeSignature]
@@ -1860,34 +2495,18 @@ def apply_breaks(score: abjad.Score, breaks: _layout.BreakMeasureMap) -> None:
 
 
 def cache_leaves(score, measure_count, voice_abbreviations=None):
-    measure_timespans = []
-    for measure_index in range(measure_count):
-        measure_number = measure_index + 1
-        measure_timespan = _get_measure_timespan(measure_number, score)
-        measure_timespans.append(measure_timespan)
+    measure_offsets = _get_measure_offset_index(score, measure_count)
     voice_name_to_leaves_by_measure = {}
-    for leaf in abjad.select.leaves(score):
-        parentage = abjad.get.parentage(leaf)
-        context = parentage.get(abjad.Context)
-        measure_number_to_leaves = voice_name_to_leaves_by_measure.setdefault(
-            context.name, {}
-        )
-        leaf_timespan = abjad.get.timespan(leaf)
-        # TODO: replace loop with bisection:
-        for i, measure_timespan in enumerate(measure_timespans):
-            measure_number = i + 1
-            if (
-                measure_timespan.start_offset <= leaf_timespan.start_offset
-                and leaf_timespan.start_offset < measure_timespan.stop_offset
-            ):
-                cached_leaves = measure_number_to_leaves.setdefault(measure_number, [])
-                cached_leaves.append(leaf)
+    _index_leaves_by_measure(
+        abjad.select.leaves(score), measure_offsets, voice_name_to_leaves_by_measure
+    )
     if voice_abbreviations:
         voice_name_to_leaves_by_measure = CacheGetItemWrapper(
             voice_name_to_leaves_by_measure, voice_abbreviations
         )
         voice_name_to_leaves_by_measure._score = score
         voice_name_to_leaves_by_measure._measure_count = measure_count
+        voice_name_to_leaves_by_measure._measure_offsets = measure_offsets
         voice_name_to_leaves_by_measure._voice_abbreviations = voice_abbreviations
     return voice_name_to_leaves_by_measure
 
@@ -1908,66 +2527,57 @@ def cache_voices(score, voice_abbreviations=None):
     return VoiceCache(score, voice_abbreviations)
 
 
-def color_octaves(score):
-    vertical_moments = abjad.iterate_vertical_moments(score)
+@_timing.profiled
+def color_octaves(score, *, index=None):
     markup = abjad.Markup(r"\markup OCTAVE")
     bundle = abjad.bundle(markup, r"- \tweak color #red")
     tag = _helpers.function_name(_frame())
     tag = tag.append(_tags.OCTAVE_COLORING)
-    for vertical_moment in vertical_moments:
-        pleaves, pitches = [], []
-        for leaf in vertical_moment.leaves:
-            if abjad.get.has_indicator(leaf, _enums.HIDDEN):
-                continue
-            if abjad.get.has_indicator(leaf, _enums.STAFF_POSITION):
-                continue
-            if isinstance(leaf, abjad.Note):
-                pleaves.append(leaf)
-                pitches.append(leaf.written_pitch)
-            elif isinstance(leaf, abjad.Chord):
-                pleaves.append(leaf)
-                pitches.extend(leaf.written_pitches)
-        if not pitches:
-            continue
-        pitch_classes = [_.pitch_class for _ in pitches]
-        if _pcollections.has_duplicates([pitch_classes]):
-            color = True
-            for pleaf in pleaves:
-                if abjad.get.has_indicator(pleaf, _enums.ALLOW_OCTAVE):
-                    color = False
-            if not color:
-                continue
-            for pleaf in pleaves:
-                abjad.attach(bundle, pleaf, direction=abjad.UP, tag=tag)
-                string = r"\baca-octave-coloring"
-                literal = abjad.LilyPondLiteral(string, site="before")
-                abjad.attach(literal, pleaf, tag=tag)
+    for pleaves in _find_octaves(score, index):
+        for pleaf in pleaves:
+            abjad.attach(bundle, pleaf, direction=abjad.UP, tag=tag)
+            string = r"\baca-octave-coloring"
+            literal = abjad.LilyPondLiteral(string, site="before")
+            abjad.attach(literal, pleaf, tag=tag)
 
 
 _color_octaves_alias = color_octaves
 
 
-def color_out_of_range_pitches(score):
+def color_out_of_range_pitches(score, *, stages=None, table=None):
     indicator = _enums.ALLOW_OUT_OF_RANGE
+    if table is None:
+        table = _StateTable(score)
     tag = _helpers.function_name(_frame())
     tag = tag.append(_tags.OUT_OF_RANGE_COLORING)
-    for voice in abjad.iterate.components(score, abjad.Voice):
-        for pleaf in abjad.iterate.leaves(voice, pitched=True):
-            if abjad.get.has_indicator(pleaf, _enums.HIDDEN):
-                continue
-            if abjad.get.has_indicator(pleaf, indicator):
-                continue
-            instrument = abjad.get.effective(pleaf, abjad.Instrument)
-            if instrument is None:
-                continue
-            if not abjad.iterpitches.sounding_pitches_are_in_range(
-                pleaf, instrument.pitch_range
-            ):
-                string = r"\baca-out-of-range-coloring"
-                literal = abjad.LilyPondLiteral(string, site="before")
-                abjad.attach(literal, pleaf, tag=tag)
 
+    def handler(voice, i, pleaf):
+        if abjad.get.has_indicator(pleaf, _enums.HIDDEN):
+            return
+        if abjad.get.has_indicator(pleaf, indicator):
+            return
+        instrument = table.get(pleaf, abjad.Instrument)
+        if instrument is None:
+            return
+        if not _sounding_pitches_are_in_range(pleaf, instrument):
+            string = r"\baca-out-of-range-coloring"
+            literal = abjad.LilyPondLiteral(string, site="before")
+            abjad.attach(literal, pleaf, tag=tag)
+
+    stage = _Stage(
+        "color_out_of_range_pitches",
+        "voice_leaves",
+        handler,
+        after=(
+            "_color_not_yet_pitched",
+            "_set_not_yet_pitched_to_staff_position_zero",
+        ),
+        prototype=(abjad.Chord, abjad.Note),
+    )
+    _add_stage(score, stages, stage)
 
+
+@_timing.profiled
 def color_repeat_pitch_classes(score):
     tag = _helpers.function_name(_frame())
     tag = tag.append(_tags.REPEAT_PITCH_CLASS_COLORING)
@@ -1979,6 +2589,7 @@ def color_repeat_pitch_classes(score):
             abjad.attach(literal, leaf, tag=tag)
 
 
+@_timing.profiled
 def extend_beams(score):
     for leaf in abjad.iterate.leaves(score):
         if abjad.get.indicator(leaf, _enums.RIGHT_BROKEN_BEAM):
@@ -2160,15 +2771,8 @@ def make_layout_ly(
     else:
         first_measure_number = 1
         time_signatures = []
-        contents_directory = _path.get_contents_directory(layout_directory)
-        sections_directory = contents_directory / "sections"
-        for section_directory in sorted(sections_directory.glob("*")):
-            if not section_directory.is_dir():
-                continue
-            time_signatures_ = _path.get_metadata(section_directory).get(
-                "time_signatures",
-            )
-            time_signatures.extend(time_signatures_)
+        for entry in _path.get_manifest(layout_directory).values():
+            time_signatures.extend(entry["time_signatures"])
     if first_measure_number is False:
         raise Exception("first_measure_number should not be false")
         _build.print_file_handling(f"Skipping {_path.trim(layout_py)} ...")
@@ -2221,6 +2825,7 @@ def make_layout_ly(
     layout_ly = layout_directory / file_name
     lines = []
     # TODO: remove first_page_number embedding
+    first_page_number = None
     if layout_directory.parent.name == "sections":
         if layout_directory.name != "01":
             previous_section_number = str(int(layout_directory.name) - 1).zfill(2)
@@ -2228,13 +2833,16 @@ def make_layout_ly(
                 layout_directory.parent / previous_section_number
             )
             previous_layout_ly = previous_section_directory / "layout.ly"
-            if previous_layout_ly.is_file():
+            entry = _path.get_manifest(layout_directory).get(previous_section_number)
+            result = None
+            if entry is not None and isinstance(entry.get("page_count"), int):
+                result = entry.get("first_page_number", 1), entry["page_count"]
+            elif previous_layout_ly.is_file():
                 result = _build._get_preamble_page_count_overview(previous_layout_ly)
-                if result is not None:
-                    _, _, final_page_number = result
-                    first_page_number = final_page_number + 1
-                    line = f"% first_page_number = {first_page_number}"
-                    lines.append(line)
+            if result is not None:
+                first_page_number = result[0] + result[1]
+                line = f"% first_page_number = {first_page_number}"
+                lines.append(line)
     page_count = spacing.breaks.page_count
     lines.append(f"% page_count = {page_count}")
     time_signatures = [str(_) for _ in time_signatures]
@@ -2252,6 +2860,12 @@ def make_layout_ly(
     lines.extend(lines_)
     header = "\n".join(lines) + "\n\n"
     layout_ly.write_text(header + text + "\n")
+    if layout_directory.parent.name == "sections":
+        _path.update_manifest(
+            layout_directory,
+            first_page_number=first_page_number or 1,
+            page_count=page_count,
+        )
     counter = abjad.string.pluralize("measure", measure_count)
     message = f"Writing {measure_count} + 1 {counter} to"
     message += f" {_path.trim(layout_ly)} ..."
@@ -2352,9 +2966,10 @@ def postprocess_score(
         skips = _select.skips(score["Skips"])
         if abjad.get.has_indicator(skips[-1], _enums.ANCHOR_SKIP):
             skips = skips[:-1]
+        table = _StateTable(skips)
         time_signatures = []
         for skip in skips:
-            time_signature = abjad.get.effective(skip, abjad.TimeSignature)
+            time_signature = table.get(skip, abjad.TimeSignature)
             time_signatures.append(time_signature)
         measure_count = len(time_signatures)
     if parts_metric_modulation_multiplier is not None:
@@ -2392,32 +3007,40 @@ def postprocess_score(
         _reanalyze_reapplied_synthetic_wrappers(score)
         if not do_not_transpose_score:
             transpose_score(score)
+        stages: list[_Stage] = []
+        table = _StateTable(score)
         if not do_not_color_not_yet_registered:
-            _color_not_yet_registered(score)
-        _color_mock_pitch(score)
-        _set_intermittent_to_staff_position_zero(score)
+            _color_not_yet_registered(score, stages=stages)
+        _color_mock_pitch(score, stages=stages)
+        _set_intermittent_to_staff_position_zero(score, stages=stages)
         if not do_not_color_not_yet_pitched:
-            _color_not_yet_pitched(score)
-        _set_not_yet_pitched_to_staff_position_zero(score)
-        _clean_up_repeat_tie_direction(score)
-        _clean_up_laissez_vibrer_tie_direction(score)
+            _color_not_yet_pitched(score, stages=stages)
+        _set_not_yet_pitched_to_staff_position_zero(score, stages=stages)
+        _clean_up_repeat_tie_direction(score, stages=stages, table=table)
+        _clean_up_laissez_vibrer_tie_direction(score, stages=stages, table=table)
         if error_on_not_yet_pitched:
-            _error_on_not_yet_pitched(score)
-        _check_doubled_dynamics(score)
-        color_out_of_range_pitches(score)
+            _error_on_not_yet_pitched(score, stages=stages)
+        _check_doubled_dynamics(score, stages=stages)
+        color_out_of_range_pitches(score, stages=stages, table=table)
         if not doctest:
             _check_persistent_indicators(
                 do_not_require_short_instrument_names,
                 score,
+                stages=stages,
+                table=table,
             )
+        _run_stages(score, stages)
         if not do_not_color_repeat_pitch_classes:
             color_repeat_pitch_classes(score)
         if color_octaves:
-            _color_octaves_alias(score)
-        _attach_shadow_tie_indicators(score)
+            index = _array.VerticalSliceIndex(score)
+            _color_octaves_alias(score, index=index)
+        stages = []
+        _attach_shadow_tie_indicators(score, stages=stages)
         if not do_not_force_nonnatural_accidentals:
-            _force_nonnatural_accidentals(score)
-        _label_duration_multipliers(score)
+            _force_nonnatural_accidentals(score, stages=stages)
+        _label_duration_multipliers(score, stages=stages)
+        _run_stages(score, stages)
         _magnify_staves(magnify_staves, score)
         if not doctest:
             _whitespace_leaves(score)
@@ -2461,17 +3084,8 @@ def postprocess_score(
     )
     _clean_up_obgcs(score)
     if not do_not_check_wellformedness:
-        count, message = abjad.wf.tabulate_wellformedness(
-            score,
-            check_out_of_range_pitches=False,
-        )
-        if count:
-            raise Exception("\n" + message)
-        violators, total = abjad.wf.check_out_of_range_pitches(
-            score, allow_indicators=(_enums.ALLOW_OUT_OF_RANGE, _enums.HIDDEN)
-        )
-        if violators:
-            raise Exception(f"{len(violators)} /    {total} out of range pitches")
+        with _timing.phase("check_wellformedness"):
+            _check_wellformedness(score)
     if not doctest:
         previous_stop_clock_time: typing.Optional[str]
         if environment.section_not_included_in_score:
@@ -2604,6 +3218,7 @@ def sort_dictionary(dictionary):
         dictionary[key] = value
 
 
+@_timing.profiled
 def span_metronome_marks(global_skips, *, parts_metric_modulation_multiplier=None):
     indicator_count = 0
     skips = _select.skips(global_skips)
@@ -2970,15 +3585,20 @@ def style_anchor_skip(score):
     )
 
 
+@_timing.profiled
 def transpose_score(score):
+    table = _StateTable(score)
     for pleaf in _select.pleaves(score):
         if abjad.get.has_indicator(pleaf, _enums.DO_NOT_TRANSPOSE):
             continue
         if abjad.get.has_indicator(pleaf, _enums.STAFF_POSITION):
             continue
-        abjad.iterpitches.transpose_from_sounding_pitch(pleaf)
+        instrument = table.get(pleaf, abjad.Instrument)
+        if instrument is not None:
+            _transpose_from_sounding_pitch(pleaf, instrument)
 
 
+@_timing.profiled
 def treat_untreated_persistent_wrappers(score, *, manifests=None):
     manifests = manifests or {}
     dynamic_prototype = (abjad.Dynamic, abjad.StartHairpin)
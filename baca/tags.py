@@ -2,10 +2,18 @@
 Tags.
 """
 
+import dataclasses
+import hashlib
+import json
+import os
+import pathlib
+import time
 import typing
 
 import abjad
 
+from . import timing as _timing
+
 # BAR EXTENT
 
 EXPLICIT_BAR_EXTENT = abjad.Tag("EXPLICIT_BAR_EXTENT")
@@ -859,11 +867,592 @@ def wrappers(wrappers: list[abjad.Wrapper], *tags: abjad.Tag):
             wrapper.tag = wrapper.tag.append(tag)
 
 
+# TAG QUERIES
+
+_TAG_BITS: dict[str, int] = {}
+
+_PREFIX_MASKS: dict[str, int] = {}
+
+
+def _get_tag_bit(string):
+    bit = _TAG_BITS.get(string)
+    if bit is None:
+        bit = _TAG_BITS[string] = 1 << len(_TAG_BITS)
+        for prefix_, mask in _PREFIX_MASKS.items():
+            if string.startswith(prefix_):
+                _PREFIX_MASKS[prefix_] = mask | bit
+    return bit
+
+
+def _get_prefix_mask(string):
+    mask = _PREFIX_MASKS.get(string)
+    if mask is None:
+        mask = 0
+        for string_, bit in _TAG_BITS.items():
+            if string_.startswith(string):
+                mask |= bit
+        _PREFIX_MASKS[string] = mask
+    return mask
+
+
+def _get_strings(tags):
+    strings = []
+    for tag in tags:
+        if isinstance(tag, abjad.Tag):
+            strings.append(tag.string)
+        else:
+            assert isinstance(tag, str), repr(tag)
+            strings.append(tag)
+    return strings
+
+
+class _TagList(list):
+    """
+    List of tags with interned tag mask.
+    """
+
+    __slots__ = ("mask",)
+
+    def __init__(self):
+        super().__init__()
+        self.mask = 0
+
+    def append(self, tag):
+        super().append(tag)
+        self.mask |= _get_tag_bit(tag.string)
+
+
+def get_tag_mask(tags) -> int:
+    """
+    Gets interned tag mask of ``tags``.
+    """
+    if isinstance(tags, _TagList):
+        return tags.mask
+    mask = 0
+    for tag in tags:
+        mask |= _get_tag_bit(tag.string)
+    return mask
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class TagQuery:
+    """
+    Tag query.
+
+    Compiles to integer tests against interned tag masks; calls with list of tags,
+    like the match functions passed to ``abjad.activate()``:
+
+    ..  container:: example
+
+        >>> query = baca.tags.any_of("+SCORE", "+PARTS") & ~baca.tags.prefix("-")
+        >>> query([abjad.Tag("+SCORE"), abjad.Tag("MEASURE_1")])
+        True
+
+        >>> query([abjad.Tag("+SCORE"), abjad.Tag("-PARTS")])
+        False
+
+        >>> query([])
+        False
+
+    """
+
+    test: typing.Callable[[int], bool]
+
+    def __and__(self, argument):
+        left, right = self.test, argument.test
+        return TagQuery(lambda _: left(_) and right(_))
+
+    def __call__(self, tags) -> bool:
+        return self.test(get_tag_mask(tags))
+
+    def __invert__(self):
+        test = self.test
+        return TagQuery(lambda _: not test(_))
+
+    def __or__(self, argument):
+        left, right = self.test, argument.test
+        return TagQuery(lambda _: left(_) or right(_))
+
+
+def all_of(*tags: abjad.Tag | str) -> TagQuery:
+    """
+    Makes query true when all of ``tags`` tag line.
+    """
+    mask = get_tag_mask(abjad.Tag(_) for _ in _get_strings(tags))
+    return TagQuery(lambda _: _ & mask == mask)
+
+
+def any_of(*tags: abjad.Tag | str) -> TagQuery:
+    """
+    Makes query true when any of ``tags`` tags line.
+    """
+    mask = get_tag_mask(abjad.Tag(_) for _ in _get_strings(tags))
+    return TagQuery(lambda _: bool(_ & mask))
+
+
+def none_of(*tags: abjad.Tag | str) -> TagQuery:
+    """
+    Makes query true when none of ``tags`` tags line.
+    """
+    mask = get_tag_mask(abjad.Tag(_) for _ in _get_strings(tags))
+    return TagQuery(lambda _: not _ & mask)
+
+
+def prefix(string: str) -> TagQuery:
+    """
+    Makes query true when any tag of line starts with ``string``.
+    """
+    _get_prefix_mask(string)
+    masks = _PREFIX_MASKS
+    return TagQuery(lambda _: bool(_ & masks[string]))
+
+
+# TAG PIPELINE
+
+
+@dataclasses.dataclass(slots=True)
+class _TagRule:
+    match: typing.Callable
+    name: str
+    prepend_empty_chord: bool = False
+    undo: bool = False
+    count: int = 0
+    skipped: int = 0
+    # state of one abjad.activate() / abjad.deactivate() scan:
+    treated_last_line: bool = False
+    found_on_last_line: bool = False
+    previous_line_was_tweak: bool = False
+
+    def apply(self, line, current_tags):
+        matched = self.match in current_tags
+        if not matched and callable(self.match):
+            matched = self.match(current_tags)
+        if not matched:
+            self.treated_last_line = False
+            self.found_on_last_line = False
+            return line
+        if self.undo:
+            line = self._deactivate(line)
+            self.previous_line_was_tweak = "tweak" in line
+        else:
+            line = self._activate(line)
+        return line
+
+    def _activate(self, line):
+        index = len(line) - len(line.lstrip())
+        if line[index : index + 4] in ("%%% ", "%@% "):
+            if "%@% " in line:
+                line = line.replace("%@% ", "")
+                suffix = " %@%"
+            else:
+                line = line.replace("%%%", "   ")
+                suffix = None
+            assert line.endswith("\n"), repr(line)
+            if suffix:
+                line = line.strip("\n") + suffix + "\n"
+            if not self.treated_last_line:
+                self.count += 1
+            self.treated_last_line = True
+            self.found_on_last_line = False
+        else:
+            if not self.found_on_last_line:
+                self.skipped += 1
+            self.found_on_last_line = True
+            self.treated_last_line = False
+        return line
+
+    def _deactivate(self, line):
+        start_column = len(line) - len(line.lstrip())
+        if line[start_column] != "%":
+            if " %@%" in line:
+                prefix = "    " + "%@% "
+                line = line.replace(" %@%", "")
+            else:
+                prefix = "%%% "
+            if self.prepend_empty_chord and not self.previous_line_was_tweak:
+                prefix += "<> "
+            target = line[start_column - 4 : start_column]
+            assert target == "    ", repr((line, target, start_column, self.match))
+            characters = list(line)
+            characters[start_column - 4 : start_column] = list(prefix)
+            line = "".join(characters)
+            if not self.treated_last_line:
+                self.count += 1
+            self.treated_last_line = True
+            self.found_on_last_line = False
+        else:
+            if not self.found_on_last_line:
+                self.skipped += 1
+            self.found_on_last_line = True
+            self.treated_last_line = False
+        return line
+
+
+@dataclasses.dataclass(slots=True)
+class TagPipeline:
+    r"""
+    Tag pipeline.
+
+    Collects the activations and deactivations of the tag functions in this module
+    and applies them all in one scan of the lines of ``text``:
+
+    ..  container:: example
+
+        >>> text = "    %! RED\n    c'4\n    %! BLUE\n%%% d'4\n"
+        >>> messages = []
+        >>> pipeline = baca.tags.TagPipeline(text)
+        >>> pipeline = baca.tags.show_tag(pipeline, abjad.Tag("RED"), messages, undo=True)
+        >>> pipeline = baca.tags.show_tag(pipeline, abjad.Tag("BLUE"), messages)
+        >>> print(pipeline.run(), end="")
+            %! RED
+        %%% c'4
+            %! BLUE
+            d'4
+
+        >>> for message in messages:
+        ...     message
+        'Hiding RED tags ...'
+        'Found 1 RED tag ...'
+        'Deactivating 1 RED tag ...'
+        ''
+        'Showing BLUE tags ...'
+        'Found 1 BLUE tag ...'
+        'Activating 1 BLUE tag ...'
+        ''
+
+    Text and messages equal those of running each function on text in turn.
+    """
+
+    text: str
+    path: pathlib.Path | None = None
+    rules: list[_TagRule] = dataclasses.field(default_factory=list)
+    _messages: list[list] = dataclasses.field(default_factory=list, repr=False)
+
+    @staticmethod
+    def from_path(path: pathlib.Path) -> "TagPipeline":
+        """
+        Makes pipeline that streams ``path``.
+
+        ``run()`` reads ``path`` line by line, writes lines to temporary file and
+        then renames temporary file to ``path``; memory does not grow with file
+        size, and readers never see partially written files.
+        """
+        assert isinstance(path, pathlib.Path), repr(path)
+        return TagPipeline("", path=path)
+
+    def add(self, match, name, messages, *, prepend_empty_chord=False, undo=False):
+        """
+        Adds activation (or deactivation) of ``match`` to pipeline.
+
+        Appends placeholder to ``messages``; ``run()`` replaces placeholder with
+        messages.
+        """
+        rule = _TagRule(match, name, prepend_empty_chord=prepend_empty_chord, undo=undo)
+        self.rules.append(rule)
+        if messages is not None:
+            messages.append(rule)
+            if not any(_ is messages for _ in self._messages):
+                self._messages.append(messages)
+        return self
+
+    @_timing.profiled
+    def run(self) -> str | None:
+        """
+        Applies rules to text (or path); resolves messages.
+
+        Returns text; returns none when pipeline streams path.
+        """
+        if self.path is not None:
+            text = None
+            if not _stream_tag_rules(self.path, self.rules):
+                for rule in self.rules:
+                    rule.count, rule.skipped = 0, 0
+                    rule.treated_last_line = False
+                    rule.found_on_last_line = False
+                    rule.previous_line_was_tweak = False
+                    if not _stream_tag_rules(self.path, [rule]):
+                        raise Exception(f"can not stream {rule.name} tags.")
+        elif (text := _apply_tag_rules(self.text, self.rules)) is None:
+            text = self.text
+            for rule in self.rules:
+                if rule.undo:
+                    text, rule.count, rule.skipped = abjad.deactivate(
+                        text, rule.match, prepend_empty_chord=rule.prepend_empty_chord
+                    )
+                else:
+                    text, rule.count, rule.skipped = abjad.activate(text, rule.match)
+        for messages in self._messages:
+            resolved = []
+            for message in messages:
+                if isinstance(message, _TagRule):
+                    resolved.extend(
+                        _get_activation_messages(
+                            message.name,
+                            message.count,
+                            message.skipped,
+                            undo=message.undo,
+                        )
+                    )
+                else:
+                    resolved.append(message)
+            messages[:] = resolved
+        self.text, self.rules, self._messages = text or "", [], []
+        return text
+
+
+_Text = typing.TypeVar("_Text", str, TagPipeline)
+
+
+def _apply_tag_rules(text, rules):
+    text_lines = text.split("\n")
+    text_lines = [_ + "\n" for _ in text_lines[:-1]] + text_lines[-1:]
+    lines = []
+    for line in _iterate_tag_rules(text_lines, rules):
+        if line is None:
+            return None
+        lines.append(line)
+    return "".join(lines)
+
+
+def _iterate_lines(pointer):
+    # yields lines like text.split("\n") with newlines kept: "" after final newline
+    line = None
+    for line in pointer:
+        yield line
+    if line is None or line.endswith("\n"):
+        yield ""
+
+
+def _iterate_tag_rules(lines, rules):
+    current_tags = _TagList()
+    for line in lines:
+        if line.lstrip().startswith("%! "):
+            yield line
+            current_tags.append(abjad.Tag(line.strip()[3:]))
+            continue
+        for rule in rules:
+            line = rule.apply(line, current_tags)
+            if rule is not rules[-1] and line.lstrip().startswith("%! "):
+                # rule turned line into tag line; later rules must see tag line
+                yield None
+                return
+        yield line
+        if current_tags:
+            current_tags = _TagList()
+
+
+def _stream_tag_rules(path, rules):
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with path.open() as source, tmp_path.open("w") as target:
+            for line in _iterate_tag_rules(_iterate_lines(source), rules):
+                if line is None:
+                    return False
+                target.write(line)
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    return True
+
+
+# TAG INDEX
+
+_TAG_INDEX_RACY_NANOSECONDS = 2_000_000_000
+
+
+@dataclasses.dataclass(slots=True)
+class TagIndex:
+    r"""
+    Tag-line index of LilyPond file.
+
+    Maps each tag string to the numbers of the (nontag) lines it tags; records the
+    first tag line above each tagged line and whether each tagged line is active:
+
+    ..  container:: example
+
+        >>> text = "    c'4\n    %! RED\n    %! BLUE\n%%% d'4\n"
+        >>> index = baca.tags.TagIndex.from_text(text)
+        >>> index.tags
+        {'RED': [3], 'BLUE': [3]}
+
+        >>> index.block_starts, index.active
+        ({3: 1}, {3: False})
+
+    """
+
+    active: dict[int, bool] = dataclasses.field(default_factory=dict)
+    block_starts: dict[int, int] = dataclasses.field(default_factory=dict)
+    digest: str = ""
+    mtime_ns: int = 0
+    size: int = 0
+    tags: dict[str, list[int]] = dataclasses.field(default_factory=dict)
+
+    @staticmethod
+    def from_text(text: str) -> "TagIndex":
+        """
+        Makes index from ``text``.
+        """
+        index = TagIndex()
+        block_start: int | None = None
+        block: list[str] = []
+        for i, line in enumerate(text.split("\n")):
+            stripped = line.lstrip()
+            if stripped.startswith("%! "):
+                if block_start is None:
+                    block_start = i
+                block.append(line.strip()[3:])
+                continue
+            if block:
+                assert block_start is not None
+                index.active[i] = not stripped.startswith(("%%% ", "%@% "))
+                index.block_starts[i] = block_start
+                for string in block:
+                    lines = index.tags.setdefault(string, [])
+                    if not lines or lines[-1] != i:
+                        lines.append(i)
+            block_start, block = None, []
+        return index
+
+    def find(self, match: abjad.Tag | typing.Callable) -> list[int] | None:
+        """
+        Finds numbers of lines matching ``match``.
+
+        Calls ``match`` once per distinct tag block. Returns none when ``match``
+        matches untagged lines, because untagged lines are not indexed.
+        """
+        if isinstance(match, abjad.Tag):
+            return list(self.tags.get(match.string, []))
+        if match([]):
+            return None
+        line_to_strings: dict[int, list[str]] = {}
+        for string, lines in self.tags.items():
+            for line in lines:
+                line_to_strings.setdefault(line, []).append(string)
+        block_to_result: dict[tuple[str, ...], bool] = {}
+        result = []
+        for line in sorted(line_to_strings):
+            block = tuple(sorted(line_to_strings[line]))
+            if block not in block_to_result:
+                tags = [abjad.Tag(_) for _ in block]
+                block_to_result[block] = bool(match(tags))
+            if block_to_result[block]:
+                result.append(line)
+        return result
+
+    def is_fresh(self, path) -> bool:
+        """
+        Is true when index was made from current contents of ``path``.
+
+        Compares modification time and size without reading ``path``; reads and
+        hashes ``path`` only when index was stamped with content hash.
+        """
+        stat = path.stat()
+        if (stat.st_mtime_ns, stat.st_size) != (self.mtime_ns, self.size):
+            return False
+        if self.digest:
+            return hashlib.sha256(path.read_bytes()).hexdigest() == self.digest
+        return True
+
+    def stamp(self, path, text: str | None = None) -> None:
+        """
+        Stamps index with modification time and size of ``path``.
+
+        Activation and deactivation preserve file size, so a rewrite within
+        timestamp granularity of ``path`` leaves modification time and size
+        unchanged; when ``path`` changed that recently, also stamps index with
+        content hash of ``text`` (or of ``path`` when ``text`` is none).
+        """
+        stat = path.stat()
+        self.mtime_ns, self.size = stat.st_mtime_ns, stat.st_size
+        self.digest = ""
+        if time.time_ns() - stat.st_mtime_ns < _TAG_INDEX_RACY_NANOSECONDS:
+            if text is None:
+                data = path.read_bytes()
+            else:
+                data = text.encode()
+            self.digest = hashlib.sha256(data).hexdigest()
+
+
+def _get_tag_index_path(path):
+    return path.with_name(f".{path.name}.tagindex")
+
+
+def _apply_tag_index(text, index, lines, match, *, prepend_empty_chord, undo):
+    text_lines = text.split("\n")
+    text_lines = [_ + "\n" for _ in text_lines[:-1]] + text_lines[-1:]
+    rule = _TagRule(match, "", prepend_empty_chord=prepend_empty_chord, undo=undo)
+    previous = None
+    for i in lines:
+        # lines between matches reset the scan state unless they are all tag lines
+        if previous is None or index.block_starts[i] != previous + 1:
+            rule.treated_last_line = False
+            rule.found_on_last_line = False
+        if undo:
+            line = rule._deactivate(text_lines[i])
+            rule.previous_line_was_tweak = "tweak" in line
+        else:
+            line = rule._activate(text_lines[i])
+        text_lines[i] = line
+        index.active[i] = not line.lstrip().startswith(("%%% ", "%@% "))
+        previous = i
+    return "".join(text_lines), rule.count, rule.skipped
+
+
+def get_tag_index(path) -> TagIndex:
+    """
+    Gets tag index of ``path``.
+
+    Reads .<name>.tagindex next to ``path``; remakes and rewrites index when index
+    is missing or stale against ``path``.
+    """
+    index_path = _get_tag_index_path(path)
+    if index_path.is_file():
+        try:
+            dictionary = json.loads(index_path.read_text())
+        except ValueError:
+            dictionary = None
+        if dictionary is not None:
+            index = TagIndex(
+                active={int(k): v for k, v in dictionary["active"].items()},
+                block_starts={int(k): v for k, v in dictionary["block_starts"].items()},
+                digest=dictionary.get("digest", ""),
+                mtime_ns=dictionary.get("mtime_ns", 0),
+                size=dictionary.get("size", 0),
+                tags=dictionary["tags"],
+            )
+            if index.is_fresh(path):
+                return index
+    return write_tag_index(path)
+
+
+def write_tag_index(
+    path, index: TagIndex | None = None, *, text: str | None = None
+) -> TagIndex:
+    """
+    Writes tag index of ``path`` to .<name>.tagindex next to ``path``.
+
+    Makes index from ``text`` when ``index`` is none; reads ``text`` from ``path``
+    when ``text`` is none. Pass ``text`` just written to ``path`` to avoid rereading
+    ``path``.
+    """
+    if text is None:
+        text = path.read_text()
+    if index is None:
+        index = TagIndex.from_text(text)
+    index.stamp(path, text)
+    dictionary = dataclasses.asdict(index)
+    index_path = _get_tag_index_path(path)
+    tmp_path = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(dictionary))
+    os.replace(tmp_path, index_path)
+    return index
+
+
 # BUILD FUNCTIONS
 
 
 def _activate_tags(
-    text: str,
+    text: _Text,
     match: typing.Callable,
     name: str,
     messages: list,
@@ -871,10 +1460,18 @@ def _activate_tags(
     prepend_empty_chord: bool = False,
     undo: bool = False,
 ):
-    assert isinstance(text, str), repr(text)
+    assert isinstance(text, str | TagPipeline), repr(text)
     assert callable(match), repr(match)
     assert isinstance(messages, list), repr(messages)
     assert isinstance(name, str), repr(name)
+    if isinstance(text, TagPipeline):
+        return text.add(
+            match,
+            name,
+            messages,
+            prepend_empty_chord=prepend_empty_chord,
+            undo=undo,
+        )
     if undo:
         text, count, skipped = abjad.deactivate(
             text,
@@ -883,6 +1480,13 @@ def _activate_tags(
         )
     else:
         text, count, skipped = abjad.activate(text, match)
+    new_messages = _get_activation_messages(name, count, skipped, undo=undo)
+    if messages is not None:
+        messages.extend(new_messages)
+    return text
+
+
+def _get_activation_messages(name, count, skipped, *, undo=False):
     if undo:
         adjective = "inactive"
         gerund = "deactivating"
@@ -905,13 +1509,11 @@ def _activate_tags(
             message = f"skipping {skipped} ({adjective}) {name} {tags}"
             new_messages.append(message)
     new_messages = [abjad.string.capitalize_start(_) + " ..." for _ in new_messages]
-    if messages is not None:
-        messages.extend(new_messages)
-    return text
+    return new_messages
 
 
 def _deactivate_tags(
-    text: str,
+    text: _Text,
     match: typing.Callable,
     name: str,
     messages: list,
@@ -929,14 +1531,12 @@ def _deactivate_tags(
 
 
 def color_clefs(
-    text: str, messages: list[str], build: bool, *, undo: bool = False
-) -> str:
+    text: _Text, messages: list[str], build: bool, *, undo: bool = False
+) -> _Text:
     messages.append("Coloring clefs ...")
     name = "clef color"
 
-    def match(tags):
-        tags_ = clef_color_tags(build=build)
-        return bool(set(tags) & set(tags_))
+    match = any_of(*clef_color_tags(build=build))
 
     if not undo:
         text = _activate_tags(text, match, name, messages)
@@ -946,13 +1546,11 @@ def color_clefs(
     return text
 
 
-def color_dynamics(text: str, messages: list[str], *, undo: bool = False) -> str:
+def color_dynamics(text: _Text, messages: list[str], *, undo: bool = False) -> _Text:
     messages.append("Coloring dynamics ...")
     name = "dynamic color"
 
-    def match(tags):
-        tags_ = dynamic_color_tags()
-        return bool(set(tags) & set(tags_))
+    match = any_of(*dynamic_color_tags())
 
     if not undo:
         text = _activate_tags(text, match, name, messages)
@@ -962,13 +1560,11 @@ def color_dynamics(text: str, messages: list[str], *, undo: bool = False) -> str
     return text
 
 
-def color_instruments(text: str, messages: list[str], *, undo: bool = False) -> str:
+def color_instruments(text: _Text, messages: list[str], *, undo: bool = False) -> _Text:
     messages.append("Coloring instruments ...")
     name = "instrument color"
 
-    def match(tags):
-        tags_ = instrument_color_tags()
-        return bool(set(tags) & set(tags_))
+    match = any_of(*instrument_color_tags())
 
     if not undo:
         text = _activate_tags(text, match, name, messages)
@@ -979,14 +1575,12 @@ def color_instruments(text: str, messages: list[str], *, undo: bool = False) ->
 
 
 def color_short_instrument_names(
-    text: str, messages: list[str], *, undo: bool = False
-) -> str:
+    text: _Text, messages: list[str], *, undo: bool = False
+) -> _Text:
     messages.append("Coloring short instrument names ...")
     name = "short instrument name color"
 
-    def match(tags):
-        tags_ = short_instrument_name_color_tags()
-        return bool(set(tags) & set(tags_))
+    match = any_of(*short_instrument_name_color_tags())
 
     if not undo:
         text = _activate_tags(text, match, name, messages)
@@ -996,14 +1590,11 @@ def color_short_instrument_names(
     return text
 
 
-def color_metronome_marks(text: str, messages: list[str], *, undo: bool = False) -> str:
-    def _activate(tags):
-        tags_ = metronome_mark_color_expression_tags()
-        return bool(set(tags) & set(tags_))
-
-    def _deactivate(tags):
-        tags_ = metronome_mark_color_suppression_tags()
-        return bool(set(tags) & set(tags_))
+def color_metronome_marks(
+    text: _Text, messages: list[str], *, undo: bool = False
+) -> _Text:
+    _activate = any_of(*metronome_mark_color_expression_tags())
+    _deactivate = any_of(*metronome_mark_color_suppression_tags())
 
     if undo:
         messages.append("Uncoloring metronome marks ...")
@@ -1026,18 +1617,13 @@ def color_metronome_marks(text: str, messages: list[str], *, undo: bool = False)
 
 
 def color_persistent_indicators(
-    text: str, messages: list[str], build: bool, *, undo: bool = False
-) -> str:
-    assert isinstance(text, str), repr(text)
+    text: _Text, messages: list[str], build: bool, *, undo: bool = False
+) -> _Text:
+    assert isinstance(text, str | TagPipeline), repr(text)
     name = "persistent indicator"
 
-    def _activate(tags):
-        tags_ = persistent_indicator_color_expression_tags(build=build)
-        return bool(set(tags) & set(tags_))
-
-    def _deactivate(tags):
-        tags_ = persistent_indicator_color_suppression_tags()
-        return bool(set(tags) & set(tags_))
+    _activate = any_of(*persistent_indicator_color_expression_tags(build=build))
+    _deactivate = any_of(*persistent_indicator_color_suppression_tags())
 
     if undo:
         messages.append(f"Uncoloring {name}s ...")
@@ -1060,14 +1646,12 @@ def color_persistent_indicators(
 
 
 def color_staff_lines(
-    text: str, messages: list[str], build: bool, *, undo: bool = False
-) -> str:
+    text: _Text, messages: list[str], build: bool, *, undo: bool = False
+) -> _Text:
     messages.append("Coloring staff lines ...")
     name = "staff lines color"
 
-    def match(tags):
-        tags_ = staff_lines_color_tags(build=build)
-        return bool(set(tags) & set(tags_))
+    match = any_of(*staff_lines_color_tags(build=build))
 
     if not undo:
         text = _activate_tags(text, match, name, messages)
@@ -1078,14 +1662,12 @@ def color_staff_lines(
 
 
 def color_time_signatures(
-    text: str, messages: list[str], build: bool, *, undo: bool = False
-) -> str:
+    text: _Text, messages: list[str], build: bool, *, undo: bool = False
+) -> _Text:
     messages.append("Coloring time signatures ...")
     name = "time signature color"
 
-    def match(tags):
-        tags_ = time_signature_color_tags(build=build)
-        return bool(set(tags) & set(tags_))
+    match = any_of(*time_signature_color_tags(build=build))
 
     if not undo:
         text = _activate_tags(text, match, name, messages)
@@ -1096,8 +1678,8 @@ def color_time_signatures(
 
 
 def handle_edition_tags(
-    text: str, messages: list[str], directory_name: str, my_name: str
-) -> str:
+    text: _Text, messages: list[str], directory_name: str, my_name: str
+) -> _Text:
     """
     Handles edition tags.
 
@@ -1123,7 +1705,7 @@ def handle_edition_tags(
         specifically for me.
 
     """
-    assert isinstance(text, str), repr(text)
+    assert isinstance(text, str | TagPipeline), repr(text)
     assert isinstance(directory_name, str), repr(directory_name)
     assert my_name in ("SECTION", "SCORE", "PARTS"), repr(my_name)
     messages.append("Handling edition tags ...")
@@ -1133,42 +1715,26 @@ def handle_edition_tags(
     this_directory = abjad.Tag(f"+{directory_name}")
     not_this_directory = abjad.Tag(f"-{directory_name}")
 
-    def _deactivate(tags):
-        if not_this_edition in tags:
-            return True
-        if not_this_directory in tags:
-            return True
-        for tag in tags:
-            if tag.string.startswith("+"):
-                return True
-        return False
-
+    _deactivate = any_of(not_this_edition, not_this_directory) | prefix("+")
     text = _deactivate_tags(text, _deactivate, "other-edition", messages)
 
-    def _activate(tags):
-        for tag in tags:
-            if tag in [not_this_edition, not_this_directory]:
-                return False
-        for tag in tags:
-            if tag.string.startswith("-"):
-                return True
-        return bool(set(tags) & set([this_edition, this_directory]))
-
+    _activate = none_of(not_this_edition, not_this_directory) & (
+        prefix("-") | any_of(this_edition, this_directory)
+    )
     text = _activate_tags(text, _activate, "this-edition", messages)
     messages.append("")
     return text
 
 
 def handle_fermata_bar_lines(
-    text: str,
+    text: _Text,
     messages: list[str],
     bol_measure_numbers: list | None,
     final_measure_number: int | None,
-) -> str:
+) -> _Text:
     messages.append("Handling fermata bar lines ...")
 
-    def _activate(tags):
-        return bool(set(tags) & set([FERMATA_MEASURE]))
+    _activate = any_of(FERMATA_MEASURE)
 
     # activate fermata measure bar line adjustment tags ...
     text = _activate_tags(text, _activate, "bar line adjustment", messages)
@@ -1177,13 +1743,8 @@ def handle_fermata_bar_lines(
         eol_measure_numbers = [_ - 1 for _ in bol_measure_numbers[1:]]
         if final_measure_number is not None:
             eol_measure_numbers.append(final_measure_number)
-        eol_measure_numbers = [abjad.Tag(f"MEASURE_{_}") for _ in eol_measure_numbers]
-
-        def _deactivate(tags):
-            if FERMATA_MEASURE in tags:
-                if not bool(set(tags) & set(eol_measure_numbers)):
-                    return True
-            return False
+        eol_measure_numbers = [f"MEASURE_{_}" for _ in eol_measure_numbers]
+        _deactivate = all_of(FERMATA_MEASURE) & none_of(*eol_measure_numbers)
 
         text = _deactivate_tags(text, _deactivate, "EOL fermata bar line", messages)
     messages.append("")
@@ -1191,17 +1752,15 @@ def handle_fermata_bar_lines(
 
 
 def handle_mol_tags(
-    text: str,
+    text: _Text,
     messages: list[str],
     bol_measure_numbers: list | None,
     final_measure_number: int | None,
-) -> str:
+) -> _Text:
     messages.append("Handling MOL tags ...")
 
     # activate all middle-of-line tags ...
-    def _activate(tags):
-        tags_ = set([NOT_MOL, ONLY_MOL])
-        return bool(set(tags) & tags_)
+    _activate = any_of(NOT_MOL, ONLY_MOL)
 
     text = _activate_tags(text, _activate, "MOL", messages)
     # ... then deactivate conflicting middle-of-line tags
@@ -1209,18 +1768,10 @@ def handle_mol_tags(
         nonmol_measure_numbers = bol_measure_numbers[:]
         if final_measure_number is not None:
             nonmol_measure_numbers.append(final_measure_number + 1)
-        nonmol_measure_numbers = [
-            abjad.Tag(f"MEASURE_{_}") for _ in nonmol_measure_numbers
-        ]
-
-        def _deactivate(tags):
-            if NOT_MOL in tags:
-                if not bool(set(tags) & set(nonmol_measure_numbers)):
-                    return True
-            if ONLY_MOL in tags:
-                if bool(set(tags) & set(nonmol_measure_numbers)):
-                    return True
-            return False
+        nonmol_measure_numbers = [f"MEASURE_{_}" for _ in nonmol_measure_numbers]
+        _deactivate = (all_of(NOT_MOL) & none_of(*nonmol_measure_numbers)) | (
+            all_of(ONLY_MOL) & any_of(*nonmol_measure_numbers)
+        )
 
         text = _deactivate_tags(text, _deactivate, "conflicting MOL", messages)
     messages.append("")
@@ -1228,41 +1779,29 @@ def handle_mol_tags(
 
 
 def handle_shifted_clefs(
-    text: str, messages: list[str], bol_measure_numbers: list | None
-) -> str:
+    text: _Text, messages: list[str], bol_measure_numbers: list | None
+) -> _Text:
     messages.append("Handling shifted clefs ...")
 
-    def _activate(tags):
-        return SHIFTED_CLEF in tags
+    _activate = all_of(SHIFTED_CLEF)
 
     # set X-extent to false and left-shift measure-initial clefs ...
     text = _activate_tags(text, _activate, "shifted clef", messages)
     # ... then unshift clefs at beginning-of-line
     if bol_measure_numbers:
-        bol_measure_numbers = [abjad.Tag(f"MEASURE_{_}") for _ in bol_measure_numbers]
-
-        def _deactivate(tags):
-            if SHIFTED_CLEF not in tags:
-                return False
-            if any(_ in tags for _ in bol_measure_numbers):
-                return True
-            return False
+        bol_measure_numbers = [f"MEASURE_{_}" for _ in bol_measure_numbers]
+        _deactivate = all_of(SHIFTED_CLEF) & any_of(*bol_measure_numbers)
 
         text = _deactivate_tags(text, _deactivate, "BOL clef", messages)
     messages.append("")
     return text
 
 
-def join_broken_spanners(text: str, messages: list[str]) -> str:
+def join_broken_spanners(text: _Text, messages: list[str]) -> _Text:
     messages.append("Joining broken spanners ...")
 
-    def _activate(tags):
-        tags_ = [SHOW_TO_JOIN_BROKEN_SPANNERS]
-        return bool(set(tags) & set(tags_))
-
-    def _deactivate(tags):
-        tags_ = [HIDE_TO_JOIN_BROKEN_SPANNERS]
-        return bool(set(tags) & set(tags_))
+    _activate = any_of(SHOW_TO_JOIN_BROKEN_SPANNERS)
+    _deactivate = any_of(HIDE_TO_JOIN_BROKEN_SPANNERS)
 
     text = _activate_tags(text, _activate, "broken spanner expression", messages)
     text = _deactivate_tags(text, _deactivate, "broken spanner suppression", messages)
@@ -1270,12 +1809,10 @@ def join_broken_spanners(text: str, messages: list[str]) -> str:
     return text
 
 
-def not_topmost(text: str, messages: list[str]) -> str:
+def not_topmost(text: _Text, messages: list[str]) -> _Text:
     messages.append(f"Deactivating {NOT_TOPMOST.string} ...")
 
-    def _deactivate(tags):
-        tags_ = [NOT_TOPMOST]
-        return bool(set(tags) & set(tags_))
+    _deactivate = any_of(NOT_TOPMOST)
 
     text = _deactivate_tags(text, _deactivate, "not topmost", messages)
     messages.append("")
@@ -1283,17 +1820,12 @@ def not_topmost(text: str, messages: list[str]) -> str:
 
 
 def show_music_annotations(
-    text: str, messages: list[str], *, undo: bool = False
-) -> str:
+    text: _Text, messages: list[str], *, undo: bool = False
+) -> _Text:
     name = "music annotation"
 
-    def match(tags):
-        tags_ = music_annotation_tags()
-        return bool(set(tags) & set(tags_))
-
-    def match_2(tags):
-        tags_ = [INVISIBLE_MUSIC_COMMAND]
-        return bool(set(tags) & set(tags_))
+    match = any_of(*music_annotation_tags())
+    match_2 = any_of(INVISIBLE_MUSIC_COMMAND)
 
     if not undo:
         messages.append(f"Showing {name}s ...")
@@ -1308,14 +1840,14 @@ def show_music_annotations(
 
 
 def show_tag(
-    text: str,
+    text: _Text,
     tag: abjad.Tag | str,
     messages: list[str],
     *,
     match: typing.Callable | None = None,
     prepend_empty_chord: bool = False,
     undo: bool = False,
-) -> str:
+) -> _Text:
     if match is not None:
         assert callable(match)
     if isinstance(tag, str):
@@ -1326,10 +1858,7 @@ def show_tag(
         name = tag.string
 
     if match is None:
-
-        def match(tags):
-            tags_ = [tag]
-            return bool(set(tags) & set(tags_))
+        match = any_of(tag)
 
     if not undo:
         messages.append(f"Showing {name} tags ...")
@@ -0,0 +1,149 @@
+"""
+Timing.
+"""
+
+import contextlib
+import contextvars
+import dataclasses
+import functools
+import time
+
+
+def _iterate_phases(phases):
+    for phase_ in phases:
+        yield phase_
+        yield from _iterate_phases(phase_.phases)
+
+
+@dataclasses.dataclass(slots=True)
+class Phase:
+    name: str
+    start: float = 0.0
+    milliseconds: float = 0.0
+    phases: list["Phase"] = dataclasses.field(default_factory=list)
+
+    def to_dictionary(self):
+        return {
+            "name": self.name,
+            "start": round(self.start, 3),
+            "milliseconds": round(self.milliseconds, 3),
+            "phases": [_.to_dictionary() for _ in self.phases],
+        }
+
+
+@dataclasses.dataclass(slots=True)
+class Timing:
+    """
+    Build profile.
+
+    Records nested phases with millisecond precision. Phase start times are
+    milliseconds since the profile was created.
+    """
+
+    phases: list[Phase] = dataclasses.field(default_factory=list)
+    _origin: float = dataclasses.field(default_factory=time.perf_counter, repr=False)
+    _stack: list[Phase] = dataclasses.field(default_factory=list, repr=False)
+
+    def _get_seconds(self, name):
+        phases = [_ for _ in _iterate_phases(self.phases) if _.name == name]
+        if not phases:
+            return None
+        return int(sum(_.milliseconds for _ in phases) / 1000)
+
+    def _set_seconds(self, name, seconds):
+        self.phases = [_ for _ in self.phases if _.name != name]
+        self.phases.append(Phase(name, milliseconds=1000 * seconds))
+
+    @property
+    def lilypond(self):
+        return self._get_seconds("lilypond")
+
+    @lilypond.setter
+    def lilypond(self, seconds):
+        self._set_seconds("lilypond", seconds)
+
+    @property
+    def make_score(self):
+        return self._get_seconds("make_score")
+
+    @make_score.setter
+    def make_score(self, seconds):
+        self._set_seconds("make_score", seconds)
+
+    @property
+    def postprocess_score(self):
+        return self._get_seconds("postprocess_score")
+
+    @postprocess_score.setter
+    def postprocess_score(self, seconds):
+        self._set_seconds("postprocess_score", seconds)
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """
+        Records ``name`` as phase nested in current phase.
+
+        Makes profile active for ``baca.timing.phase()`` while phase runs.
+        """
+        phase_ = Phase(name, start=1000 * (time.perf_counter() - self._origin))
+        if self._stack:
+            self._stack[-1].phases.append(phase_)
+        else:
+            self.phases.append(phase_)
+        self._stack.append(phase_)
+        token = _TIMING.set(self)
+        start = time.perf_counter()
+        try:
+            yield phase_
+        finally:
+            phase_.milliseconds = 1000 * (time.perf_counter() - start)
+            _TIMING.reset(token)
+            self._stack.pop()
+
+    def record(self, name, milliseconds):
+        """
+        Records already measured phase ``name`` in current phase.
+        """
+        phase_ = Phase(name, milliseconds=milliseconds)
+        if self._stack:
+            phase_.start = self._stack[-1].start
+            self._stack[-1].phases.append(phase_)
+        else:
+            self.phases.append(phase_)
+        return phase_
+
+    def to_list(self):
+        return [_.to_dictionary() for _ in self.phases]
+
+
+_TIMING: contextvars.ContextVar[Timing | None] = contextvars.ContextVar(
+    "_TIMING", default=None
+)
+
+
+def phase(name):
+    """
+    Records ``name`` as phase of active build profile.
+
+    Does nothing when no profile is active.
+    """
+    timing = _TIMING.get()
+    if timing is None:
+        return contextlib.nullcontext()
+    return timing.phase(name)
+
+
+def profiled(function):
+    """
+    Records decorated function as phase of active build profile.
+    """
+
+    @functools.wraps(function)
+    def wrapper(*arguments, **keywords):
+        timing = _TIMING.get()
+        if timing is None:
+            return function(*arguments, **keywords)
+        with timing.phase(function.__qualname__):
+            return function(*arguments, **keywords)
+
+    return wrapper
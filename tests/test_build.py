@@ -0,0 +1,591 @@
+import os
+import pathlib
+import textwrap
+import types
+
+import abjad
+import baca
+import pytest
+
+MUSIC_PY = textwrap.dedent("""\
+    import pathlib
+    import sys
+    import types
+
+    import baca
+
+    section_directory = pathlib.Path(__file__).parent
+    previous_metadata = baca.path.previous_metadata(pathlib.Path(__file__))
+    first_measure_number = previous_metadata.get("final_measure_number", 0) + 1
+    measure_count = int((section_directory / "measure_count").read_text())
+    with (section_directory / "runs").open("a") as pointer:
+        pointer.write(f"{first_measure_number}\\n")
+    metadata = {
+        "first_measure_number": first_measure_number,
+        "final_measure_number": first_measure_number + measure_count - 1,
+    }
+    baca.path.write_metadata_py(section_directory, types.MappingProxyType(metadata))
+    """)
+
+
+def _make_score(tmp_path, monkeypatch, measure_counts):
+    baca_directory = pathlib.Path(baca.__file__).parent.parent
+    monkeypatch.setenv("PYTHONPATH", str(baca_directory))
+    wrapper_directory = tmp_path / "score"
+    (wrapper_directory / ".git").mkdir(parents=True)
+    sections_directory = wrapper_directory / "score" / "sections"
+    for i, measure_count in enumerate(measure_counts):
+        section_directory = sections_directory / f"{i + 1:02d}"
+        section_directory.mkdir(parents=True)
+        (section_directory / "music.py").write_text(MUSIC_PY)
+        (section_directory / "measure_count").write_text(str(measure_count))
+    return sections_directory
+
+
+def _read_runs(section_directory):
+    return (section_directory / "runs").read_text().split()
+
+
+def test_build_01(tmp_path, monkeypatch):
+    """
+    baca.build.build_sections() rebuilds sections until metadata settles.
+    """
+
+    sections_directory = _make_score(tmp_path, monkeypatch, [3, 4, 5])
+    unbuilt = baca.build.build_sections(sections_directory, [], workers=3)
+    assert unbuilt == []
+    section_directories = sorted(sections_directory.iterdir())
+    metadata = baca.path.get_metadata(section_directories[-1])
+    assert metadata["first_measure_number"] == 8
+    assert metadata["final_measure_number"] == 12
+    assert _read_runs(section_directories[-1])[-1] == "8"
+
+
+def test_build_02(tmp_path, monkeypatch):
+    """
+    baca.build.build_sections() does not rebuild sections when metadata is unchanged.
+    """
+
+    sections_directory = _make_score(tmp_path, monkeypatch, [3, 4, 5])
+    baca.build.build_sections(sections_directory, [], workers=1)
+    section_directories = sorted(sections_directory.iterdir())
+    for section_directory in section_directories:
+        (section_directory / "runs").unlink()
+    baca.build.build_sections(sections_directory, [], workers=3)
+    for section_directory in section_directories:
+        assert len(_read_runs(section_directory)) == 1
+
+
+def test_build_03(tmp_path):
+    """
+    baca.path.write_metadata_py() leaves no temporary file behind.
+    """
+
+    directory = pathlib.Path(tmp_path)
+    metadata = types.MappingProxyType({"final_measure_number": 5})
+    baca.path.write_metadata_py(directory, metadata)
+    assert [_.name for _ in directory.iterdir()] == [".metadata"]
+    assert baca.path.get_metadata(directory)["final_measure_number"] == 5
+
+
+def test_build_04(tmp_path, monkeypatch):
+    """
+    baca.build.read_environment() restores cached section build;
+    baca.build.persist_lilypond_file() caches under key computed before build.
+    """
+
+    sections_directory = _make_score(tmp_path, monkeypatch, [3, 4])
+    section_directories = sorted(sections_directory.iterdir())
+    section_directory = section_directories[-1]
+    music_py = section_directory / "music.py"
+    sys_argv = [str(music_py), "--pdf"]
+    arguments = baca.build.arguments(sys_argv)
+    key = baca.build._get_section_cache_key(section_directory, arguments)
+    (section_directory / "music.ly").write_text("% cached\n")
+    baca.build._store_section_cache(section_directory, key)
+    (section_directory / "music.ly").unlink()
+    environment = baca.build.read_environment(str(music_py), sys_argv)
+    assert environment.cached is True
+    assert (section_directory / "music.ly").read_text() == "% cached\n"
+    music_py.write_text(MUSIC_PY + "\n")
+    environment = baca.build.read_environment(str(music_py), sys_argv)
+    assert environment.cached is False
+    assert environment.section_number == section_directory.name
+    metadata = types.MappingProxyType({"final_measure_number": 3})
+    baca.path.write_metadata_py(section_directories[0], metadata)
+    environment.arguments.pdf = False
+    baca.build.persist_lilypond_file(
+        environment.arguments,
+        section_directory,
+        environment.timing,
+        abjad.LilyPondFile(),
+        types.MappingProxyType({}),
+    )
+    cache_directory = baca.build._get_section_cache_directory(section_directory)
+    assert (cache_directory / environment.cache_key).is_dir()
+    key = baca.build._get_section_cache_key(section_directory, environment.arguments)
+    assert not (cache_directory / key).exists()
+
+
+FAKE_LILYPOND = textwrap.dedent("""\
+    #! /usr/bin/env python
+    import pathlib
+    import sys
+    import time
+
+    print("GNU LilyPond 2.24.0")
+    returncode = 0
+    for name in sys.argv[1:]:
+        if name.startswith("-"):
+            continue
+        print(f"Processing `{name}'")
+        print("Parsing...")
+        if "fatal" in pathlib.Path(name).read_text():
+            print(f"{name}:1:1: fatal error: cannot continue", flush=True)
+            time.sleep(60)
+        if "error" in pathlib.Path(name).read_text():
+            print(f"{name}:1:1: error: syntax error")
+            returncode = 1
+            continue
+        print("crescendo too small")
+        print("  \\\\<")
+        print("  c'4")
+        print("Drawing systems...")
+        pathlib.Path(name).with_suffix(".pdf").write_text("")
+    sys.exit(returncode)
+    """)
+
+
+def test_build_05(tmp_path, monkeypatch):
+    """
+    baca.build.run_lilypond_jobs() renders files in one directory in one batch;
+    decides status of each file in batch even when LilyPond exits nonzero.
+    """
+
+    lilypond = tmp_path / "lilypond"
+    lilypond.write_text(FAKE_LILYPOND)
+    lilypond.chmod(0o755)
+    monkeypatch.setattr(baca.build, "_get_lilypond_path", lambda: str(lilypond))
+    (tmp_path / "a.ly").write_text("{ c'4 }")
+    (tmp_path / "b.ly").write_text("{ error }")
+    lines = []
+    results = baca.build.run_lilypond_jobs(
+        [tmp_path / "a.ly", tmp_path / "b.ly"],
+        progress=lambda ly, line: lines.append((ly.name, line)),
+    )
+    assert lines == [("a.ly", "Drawing systems...")]
+    assert [_.status for _ in results] == ["ok", "error"]
+    assert results[0].pdf == tmp_path / "a.pdf"
+    assert results[0].errors == []
+    assert "too small" not in results[0].log.read_text()
+    assert results[1].pdf is None
+    assert results[1].errors == ["b.ly:1:1: error: syntax error\n"]
+
+
+def test_build_06(tmp_path):
+    """
+    baca.path.activate() does not modify files hard-linked into part views.
+    """
+
+    parts_directory = tmp_path / "score" / "builds" / "letter-parts"
+    _sections_directory = parts_directory / "_sections"
+    _sections_directory.mkdir(parents=True)
+    shared = _sections_directory / "01.ly"
+    shared.write_text("    %! +LETTER_PARTS_VIOLIN\n%%% \\staffLines 1\n")
+    part_directory = parts_directory / "violin"
+    part_directory.mkdir()
+    view_directory = baca.build._make_part_sections_view(part_directory)
+    count, skipped, messages = baca.path.activate(
+        part_directory, abjad.Tag("+LETTER_PARTS_VIOLIN")
+    )
+    assert (count, skipped) == (1, 0)
+    assert messages[-1] == "Activating 1 +LETTER_PARTS_VIOLIN tag ..."
+    assert "    \\staffLines 1" in (view_directory / "01.ly").read_text()
+    assert "%%% \\staffLines 1" in shared.read_text()
+
+
+FAKE_XELATEX = textwrap.dedent("""\
+    #! /usr/bin/env python
+    import pathlib
+    import sys
+
+    tex = pathlib.Path(sys.argv[-1])
+    with tex.with_name("passes").open("a") as pointer:
+        pointer.write("pass\\n")
+    tex.with_suffix(".pdf").write_text("")
+    tex.with_suffix(".log").write_text("")
+    tex.with_suffix(".aux").write_text("\\\\relax\\n")
+    """)
+
+
+def test_build_07(tmp_path, monkeypatch):
+    """
+    baca.build.interpret_tex_file() skips unchanged files and stops once .aux
+    converges.
+    """
+
+    wrapper_directory = tmp_path / "score"
+    (wrapper_directory / ".git").mkdir(parents=True)
+    bin_directory = tmp_path / "bin"
+    bin_directory.mkdir()
+    xelatex = bin_directory / "xelatex"
+    xelatex.write_text(FAKE_XELATEX)
+    xelatex.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_directory}:{os.environ['PATH']}")
+    tex = wrapper_directory / "preface.tex"
+    tex.write_text("\\\\includegraphics{cover.pdf}\n")
+    (wrapper_directory / "cover.pdf").write_text("1")
+    passes = wrapper_directory / "passes"
+    baca.build.interpret_tex_file(tex)
+    assert len(passes.read_text().split()) == 2
+    assert not list(wrapper_directory.glob("*.aux"))
+    baca.build.interpret_tex_file(tex)
+    assert len(passes.read_text().split()) == 2
+    (wrapper_directory / "cover.pdf").write_text("2")
+    baca.build.interpret_tex_file(tex)
+    assert len(passes.read_text().split()) == 3
+
+
+def test_build_08(tmp_path):
+    """
+    baca.timing.Timing records nested phases; baca.build.summarize_timing() reports
+    regressions between logged runs.
+    """
+
+    timing = baca.timing.Timing()
+
+    @baca.build.timed("postprocess_score")
+    def postprocess_score():
+        with baca.timing.phase("check_wellformedness"):
+            pass
+        pipeline = baca.tags.TagPipeline("    %! RED\n%%% c'4\n")
+        baca.tags.show_tag(pipeline, abjad.Tag("RED"), []).run()
+
+    postprocess_score(timing=timing)
+    timing.lilypond = 3
+    assert timing.postprocess_score == 0
+    assert timing.lilypond == 3
+    phases = timing.to_list()[0]["phases"]
+    assert [_["name"] for _ in phases] == ["check_wellformedness", "TagPipeline.run"]
+    wrapper_directory = tmp_path / "score"
+    (wrapper_directory / ".git").mkdir(parents=True)
+    section_directory = wrapper_directory / "01"
+    timing_directory = wrapper_directory / "timing"
+    for milliseconds in (1000, 2000):
+        timing.lilypond = milliseconds / 1000
+        baca.build._log_timing(section_directory, timing, str(timing_directory))
+    regressions = baca.build.summarize_timing(timing_directory)
+    assert regressions == [("01", "lilypond", 1000, 2000)]
+
+
+SECTION_LY = textwrap.dedent("""\
+    \\\\version "2.23.0"
+    \\\\score
+    {
+        <<
+            \\\\context Score = "Score"
+            {
+                c'4 % {number}
+            }
+        >>
+    }
+    """)
+
+
+def test_build_09(tmp_path, monkeypatch):
+    """
+    baca.build.collect_section_lys() retrims and retags only changed sections and
+    hand-edited collected files.
+    """
+
+    contents_directory = tmp_path / "score" / "score"
+    (tmp_path / "score" / ".git").mkdir(parents=True)
+    for number in ("01", "02"):
+        section_directory = contents_directory / "sections" / number
+        section_directory.mkdir(parents=True)
+        ly = section_directory / "music.ly"
+        ly.write_text(SECTION_LY.replace("{number}", number))
+    _sections_directory = contents_directory / "builds" / "letter-score" / "_sections"
+    _sections_directory.parent.mkdir(parents=True)
+    baca.build.collect_section_lys(_sections_directory)
+    assert "c'4 % 02" in (_sections_directory / "02.ly").read_text()
+    assert (_sections_directory / ".02.ly.tags").is_file()
+    calls = []
+    monkeypatch.setattr(
+        baca.build,
+        "handle_build_tags",
+        lambda _, *, names=None, project=None: calls.append(names),
+    )
+    baca.build.collect_section_lys(_sections_directory)
+    assert calls == []
+    ly = contents_directory / "sections" / "02" / "music.ly"
+    ly.write_text(SECTION_LY.replace("{number}", "changed"))
+    baca.build.collect_section_lys(_sections_directory)
+    assert calls == [["02.ly"]]
+    assert "c'4 % changed" in (_sections_directory / "02.ly").read_text()
+    target = _sections_directory / "01.ly"
+    target.write_text(target.read_text().replace("% 01", "% edited"))
+    baca.build.collect_section_lys(_sections_directory)
+    assert calls == [["02.ly"], ["01.ly"]]
+    assert "c'4 % 01" in target.read_text()
+
+
+def test_build_10(tmp_path, monkeypatch):
+    """
+    baca.build.run_lilypond_jobs() kills LilyPond on first fatal error and reruns
+    files LilyPond did not reach.
+    """
+
+    wrapper_directory = tmp_path / "score"
+    (wrapper_directory / ".git").mkdir(parents=True)
+    lilypond = tmp_path / "lilypond"
+    lilypond.write_text(FAKE_LILYPOND)
+    lilypond.chmod(0o755)
+    monkeypatch.setattr(baca.build, "_get_lilypond_path", lambda: str(lilypond))
+    ly_paths = [wrapper_directory / _ for _ in ("a.ly", "b.ly", "c.ly")]
+    ly_paths[0].write_text("{ c'4 }")
+    ly_paths[1].write_text("{ fatal }")
+    ly_paths[2].write_text("{ c'4 }")
+    with baca.build.Timer() as timer:
+        results = baca.build.run_lilypond_jobs(ly_paths)
+    assert timer.elapsed_time < 30
+    assert [_.status for _ in results] == ["ok", "error", "ok"]
+    assert results[1].errors == ["b.ly:1:1: fatal error: cannot continue\n"]
+    assert results[2].pdf == wrapper_directory / "c.pdf"
+
+
+def test_build_11(tmp_path):
+    """
+    baca.build.handle_build_tags() gives same files, .tags files and per-file phases
+    in process pool as in one process.
+    """
+
+    contents_directory = tmp_path / "score" / "score"
+    (tmp_path / "score" / ".git").mkdir(parents=True)
+    for number in ("01", "02", "03"):
+        (contents_directory / "sections" / number).mkdir(parents=True)
+    directories = []
+    for workers in (1, 3):
+        build_directory = contents_directory / "builds" / f"{workers}-score"
+        _sections_directory = build_directory / "_sections"
+        _sections_directory.mkdir(parents=True)
+        for number in ("01", "02", "03"):
+            text = "    %! +PARTS\n    c'4\n    %! EOS_STOP_MM_SPANNER\n%%% d'4\n"
+            (_sections_directory / f"{number}.ily").write_text(text)
+        timing = baca.timing.Timing()
+        with timing.phase("collect_section_lys"):
+            baca.build.handle_build_tags(_sections_directory, workers=workers)
+        phases = timing.to_list()[0]["phases"][0]["phases"]
+        names = [
+            _["name"] for _ in phases if _["name"].startswith("handle_build_tags:")
+        ]
+        assert names == [f"handle_build_tags:{_}.ily" for _ in ("01", "02", "03")]
+        directories.append(_sections_directory)
+    for name in ("01.ily", ".01.ily.tags", "03.ily", ".03.ily.tags"):
+        texts = [(_ / name).read_text() for _ in directories]
+        assert texts[0] == texts[1]
+    assert "%%% c'4" in (directories[1] / "01.ily").read_text()
+    assert "    d'4" in (directories[1] / "01.ily").read_text()
+    assert "%%% d'4" in (directories[1] / "03.ily").read_text()
+
+
+def test_build_12(tmp_path):
+    """
+    baca.path.get_metadata() migrates Python .metadata to JSON, round-trips
+    mementos and tuples, and returns copies of cached metadata;
+    baca.path.write_metadata_py() writes tuples of list-typed keys as lists and
+    raises type error on known keys of wrong type.
+    """
+
+    memento = baca.Memento(context="Staff", edition=abjad.Tag("+SCORE"), value=2)
+    metadata = {
+        "persistent_indicators": {"Staff": [memento]},
+        "time_signatures": ["4/4", "3/8"],
+        "value": (-2, 0),
+    }
+    (tmp_path / ".metadata").write_text(repr(metadata))
+    assert repr(dict(baca.path.get_metadata(tmp_path))) == repr(metadata)
+    text = (tmp_path / ".metadata").read_text()
+    assert text.startswith("{\n")
+    assert '"$memento"' in text
+    baca.path.get_metadata(tmp_path)["time_signatures"].append("5/4")
+    metadata_ = baca.path.get_metadata(tmp_path)
+    assert metadata_["time_signatures"] == ["4/4", "3/8"]
+    baca.path._METADATA_CACHE.clear()
+    assert repr(dict(baca.path.get_metadata(tmp_path))) == repr(metadata)
+    metadata = {"bol_measure_numbers": (1, 5), "duration": 90}
+    baca.path.write_metadata_py(tmp_path, types.MappingProxyType(metadata))
+    metadata_ = baca.path.get_metadata(tmp_path)
+    assert metadata_ == {"bol_measure_numbers": [1, 5], "duration": 90}
+    metadata = {"final_measure_number": "7"}
+    with pytest.raises(TypeError, match="final_measure_number must be int"):
+        baca.path.write_metadata_py(tmp_path, types.MappingProxyType(metadata))
+
+
+def test_build_13(tmp_path, monkeypatch):
+    """
+    baca.path.get_manifest() collects section metadata incrementally; page numbers
+    survive metadata rewrites.
+    """
+
+    sections_directory = _make_score(tmp_path, monkeypatch, [3, 4])
+    baca.build.build_sections(sections_directory, [], workers=1)
+    section_directories = sorted(sections_directory.iterdir())
+    manifest = baca.path.get_manifest(sections_directory)
+    assert list(manifest) == ["01", "02"]
+    assert manifest["02"]["first_measure_number"] == 4
+    assert manifest["02"]["final_measure_number"] == 7
+    baca.path.update_manifest(section_directories[0], page_count=2)
+    metadata = dict(baca.path.get_metadata(section_directories[0]))
+    metadata["time_signatures"] = ["4/4", "3/4", "4/4"]
+    baca.path.write_metadata_py(
+        section_directories[0], types.MappingProxyType(metadata)
+    )
+    metadata_path = section_directories[1] / ".metadata"
+    metadata_path.write_text(metadata_path.read_text().replace("7", "8"))
+    manifest = baca.path.get_manifest(sections_directory)
+    assert manifest["01"]["page_count"] == 2
+    assert manifest["01"]["time_signatures"] == ["4/4", "3/4", "4/4"]
+    assert manifest["02"]["final_measure_number"] == 8
+
+
+def test_build_14(tmp_path, monkeypatch):
+    """
+    baca.path.get_score_project() resolves score directories once and rereads
+    section directories only when sections change; previous and next sections skip
+    section directories without music.py.
+    """
+
+    sections_directory = _make_score(tmp_path, monkeypatch, [3, 4])
+    section_directory = sections_directory / "02"
+    project = baca.path.get_score_project(section_directory / "music.py")
+    assert project is baca.path.get_score_project(sections_directory)
+    assert project.wrapper_directory == tmp_path / "score"
+    assert project.sections_directory == sections_directory
+    assert [_.name for _ in project.section_directories] == ["01", "02"]
+    assert project.previous_section(section_directory).name == "01"
+    assert project.next_section(section_directory) is None
+    (sections_directory / "03").mkdir()
+    assert project.next_section(section_directory) is None
+    (sections_directory / "03" / "music.py").write_text("")
+    assert project.next_section(section_directory).name == "03"
+    assert baca.path.trim(section_directory) == "score/sections/02"
+
+
+EXTERN_LY = textwrap.dedent("""\
+    \\version "2.23.0"
+    \\include "stylesheet.ily"
+
+
+    \\score
+    {
+        \\context Score = "Score" %*% Score
+        <<
+            \\context Staff = "Staff" %*% Staff
+            {
+                c'4
+            } %*% Staff
+        >> %*% Score
+    }
+    """)
+
+
+def test_build_15(tmp_path):
+    """
+    baca.path.extern() externalizes nested variables from file or string.
+    """
+
+    for text in (None, EXTERN_LY):
+        music_ly, music_ily = tmp_path / "music.ly", tmp_path / "music.ily"
+        music_ly.write_text("" if text else EXTERN_LY)
+        baca.path.extern(music_ly, music_ily, text=text)
+        lines = music_ly.read_text().splitlines()
+        assert lines[3] == '\\include "music.ily"'
+        assert "    { \\Score }" in lines
+        text_ = music_ily.read_text()
+        assert text_.index("Staff = ") < text_.index("Score = ")
+        assert "    { \\Staff }\n" in text_
+        assert sorted(_.name for _ in tmp_path.iterdir()) == ["music.ily", "music.ly"]
+
+
+def test_build_16(tmp_path, monkeypatch):
+    """
+    baca.build.build_sections() and baca.path.previous_metadata() skip section
+    directories without music.py.
+    """
+
+    sections_directory = _make_score(tmp_path, monkeypatch, [3, 4])
+    (sections_directory / "01a").mkdir()
+    unbuilt = baca.build.build_sections(sections_directory, [], workers=2)
+    assert unbuilt == []
+    metadata = baca.path.get_metadata(sections_directory / "02")
+    assert metadata["first_measure_number"] == 4
+
+
+def test_build_17(tmp_path, monkeypatch):
+    """
+    baca.build.read_environment() does not restore cached section build after score
+    library changes.
+    """
+
+    sections_directory = _make_score(tmp_path, monkeypatch, [3])
+    section_directory = sections_directory / "01"
+    music_py = section_directory / "music.py"
+    sys_argv = [str(music_py), "--pdf"]
+    arguments = baca.build.arguments(sys_argv)
+    library_py = sections_directory.parent / "library.py"
+    library_py.write_text("")
+    (section_directory / "music.ly").write_text("% cached\n")
+    key = baca.build._get_section_cache_key(section_directory, arguments)
+    baca.build._store_section_cache(section_directory, key)
+    library_py.write_text("VALUE = 1\n")
+    environment = baca.build.read_environment(str(music_py), sys_argv)
+    assert environment.cached is False
+
+
+def test_build_18(monkeypatch):
+    """
+    baca.build._build_part_in_worker() captures subprocess output and reports
+    exceptions of one part.
+    """
+
+    def build_part(part_directory, debug_sections, *, sections_collected):
+        print("Building part ...")
+        os.system("echo LilyPond output")
+        if part_directory.name == "viola":
+            raise RuntimeError("viola failed")
+
+    monkeypatch.setattr(baca.build, "build_part", build_part)
+    returncode, output = baca.build._build_part_in_worker(pathlib.Path("violin"), False)
+    assert returncode == 0
+    assert output == "Building part ...\nLilyPond output\n"
+    returncode, output = baca.build._build_part_in_worker(pathlib.Path("viola"), False)
+    assert returncode == 1
+    assert "RuntimeError: viola failed" in output
+
+
+def test_build_19(tmp_path, monkeypatch):
+    """
+    baca.build._persist_lilypond_file() removes LilyPond log of temporary MIDI input
+    after successful run and keeps log as .music.midi.log after failed run.
+    """
+
+    lilypond = tmp_path / "lilypond"
+    lilypond.write_text(FAKE_LILYPOND)
+    lilypond.chmod(0o755)
+    monkeypatch.setattr(baca.build, "_get_lilypond_path", lambda: str(lilypond))
+    # abjad reads LilyPond version when formatting LilyPond files
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+    sections_directory = _make_score(tmp_path, monkeypatch, [1])
+    section_directory = sections_directory / "01"
+    arguments = baca.build.arguments([str(section_directory / "music.py"), "--midi"])
+    for comment, logs in (("% ok", []), ("% error", [".music.midi.log"])):
+        staff = abjad.Staff("c'4")
+        abjad.attach(abjad.LilyPondLiteral(comment), staff[0])
+        score = abjad.Score([staff], name="Score")
+        lilypond_file = abjad.LilyPondFile([score])
+        timing = baca.timing.Timing()
+        baca.build._persist_lilypond_file(
+            arguments, section_directory, timing, lilypond_file
+        )
+        assert sorted(_.name for _ in section_directory.glob("*.log")) == logs
@@ -0,0 +1,277 @@
+import abjad
+import baca
+import pytest
+from baca.enums import enums
+
+
+def _make_score():
+    score = baca.docs.make_empty_score(1, 1)
+    time_signatures = baca.section.wrap([(4, 8), (3, 8)] * 4)
+    baca.section.set_up_score(score, time_signatures(), docs=True)
+    for n in (1, 2):
+        voice = score[f"Music.{n}"]
+        voice.extend(baca.make_even_divisions(time_signatures()))
+        abjad.attach(abjad.Violin(), abjad.select.leaf(voice, 0))
+    baca.pitches(score["Music.1"], "C4 D4 G2 A6 Bb4")
+    for i, pleaf in enumerate(baca.select.pleaves(score["Music.2"])):
+        abjad.attach(enums.NOT_YET_PITCHED, pleaf)
+        if i % 3 == 0:
+            abjad.attach(enums.MOCK, pleaf)
+        if i % 4 == 0:
+            abjad.attach(abjad.RepeatTie(), pleaf)
+        if i % 5 == 0:
+            pleaf.multiplier = (1, 2)
+    abjad.attach(enums.INTERMITTENT, score["Music.2"])
+    return score
+
+
+def test_section_01():
+    """
+    Fused postprocessing stages give same score as stages run one by one.
+    """
+
+    section = baca.section
+    functions = (
+        section._color_not_yet_registered,
+        section._color_mock_pitch,
+        section._set_intermittent_to_staff_position_zero,
+        section._color_not_yet_pitched,
+        section._set_not_yet_pitched_to_staff_position_zero,
+        section._clean_up_repeat_tie_direction,
+        section._clean_up_laissez_vibrer_tie_direction,
+        section._check_doubled_dynamics,
+        section.color_out_of_range_pitches,
+        section._attach_shadow_tie_indicators,
+        section._force_nonnatural_accidentals,
+        section._label_duration_multipliers,
+    )
+    scores = [_make_score(), _make_score()]
+    for function in functions:
+        function(scores[0])
+    stages = []
+    for function in functions:
+        function(scores[1], stages=stages)
+    assert len(section._group_stages(stages)) < len(stages)
+    section._run_stages(scores[1], stages)
+    strings = [abjad.lilypond(_, tags=True) for _ in scores]
+    assert strings[0] == strings[1]
+    assert r"\baca-mock-coloring" in strings[0]
+    assert r"\baca-out-of-range-coloring" in strings[0]
+
+
+def test_section_02():
+    """
+    Fused postprocessing stages raise exception of first failing stage.
+    """
+
+    score = _make_score()
+    leaf = abjad.select.leaf(score["Music.1"], 0)
+    abjad.attach(abjad.Dynamic("p"), leaf)
+    abjad.attach(abjad.Dynamic("f", leak=True), leaf)
+    with pytest.raises(Exception, match="dynamics attached"):
+        baca.section.postprocess_score(score, None, {}, doctest=True)
+    score = _make_score()
+    abjad.detach(enums.INTERMITTENT, score["Music.2"])
+    leaf = abjad.select.leaf(score["Music.2"], 0)
+    abjad.attach(enums.ALREADY_PITCHED, leaf)
+    abjad.attach(abjad.Dynamic("p"), leaf)
+    abjad.attach(abjad.Dynamic("f", leak=True), leaf)
+    with pytest.raises(Exception, match="already pitched"):
+        baca.section.postprocess_score(score, None, {}, doctest=True)
+
+
+def test_section_03():
+    """
+    baca.section.cache_leaves() indexes leaves by measure; rebuild() re-indexes
+    only replaced voices.
+    """
+
+    score = baca.docs.make_empty_score(1, 1)
+    time_signatures = baca.section.wrap([(4, 8), (3, 8), (5, 16)] * 3)
+    baca.section.set_up_score(score, time_signatures(), docs=True)
+    for n in (1, 2):
+        voice = score[f"Music.{n}"]
+        voice.extend(baca.make_even_divisions(time_signatures()))
+    abbreviations = {"A": "Music.1", "B": "Music.2"}
+    cache = baca.section.cache_leaves(score, 9, abbreviations)
+    skips = baca.select.skips(score["Skips"])
+    for n in range(1, 10):
+        timespan = abjad.get.timespan(skips[n - 1])
+        leaves = [
+            _
+            for _ in abjad.select.leaves(score["Music.1"])
+            if timespan.start_offset <= abjad.get.timespan(_).start_offset
+            and abjad.get.timespan(_).start_offset < timespan.stop_offset
+        ]
+        assert cache["A"][n] == leaves
+    leaves = cache["A"][1]
+    score["Music.2"][:] = baca.make_notes(time_signatures())
+    cache.rebuild("B")
+    assert cache["A"][1] is leaves
+    fresh = baca.section.cache_leaves(score, 9, abbreviations)
+    for n in range(1, 10):
+        assert cache["B"][n] == fresh["B"][n]
+        assert cache["A"][n] == fresh["A"][n]
+    assert len(cache["B"][1]) == 1
+
+
+def test_section_04():
+    """
+    baca.section._StateTable gives same indicators as abjad.get.effective().
+    """
+
+    score = _make_score()
+    leaves = abjad.select.leaves(score["Music.1"])
+    abjad.attach(abjad.Clef("bass"), leaves[3])
+    abjad.attach(abjad.Clef("alto"), leaves[3], deactivate=True, tag=abjad.Tag("X"))
+    abjad.attach(abjad.Clef("tenor"), leaves[9], deactivate=True, tag=abjad.Tag("X"))
+    abjad.attach(abjad.Clef("treble"), leaves[12], synthetic_offset=abjad.Offset(1, 16))
+    abjad.attach(abjad.Dynamic("p"), leaves[5])
+    abjad.attach(baca.StaffLines(1), leaves[2])
+    skip = abjad.select.leaf(score["Skips"], 4)
+    abjad.attach(abjad.MetronomeMark(abjad.Duration(1, 4), 90), skip)
+    container = abjad.BeforeGraceContainer("e'16 f'16")
+    abjad.attach(container, leaves[7])
+    abjad.attach(abjad.Clef("percussion"), container[1])
+    container = abjad.on_beat_grace_container("g16 a16", leaves[14:16])
+    abjad.attach(abjad.Dynamic("ff"), container[1])
+    prototypes = (
+        abjad.Clef,
+        abjad.Dynamic,
+        abjad.Instrument,
+        abjad.MetronomeMark,
+        abjad.TimeSignature,
+        baca.StaffLines,
+        (abjad.MetronomeMark, baca.Accelerando),
+    )
+    table = baca.section._StateTable(score)
+    for prototype in prototypes:
+        for leaf in abjad.select.leaves(score):
+            indicator = abjad.get.effective(leaf, prototype)
+            assert table.get(leaf, prototype) is indicator
+
+
+def test_section_05():
+    """
+    baca.section._find_octaves() finds same vertical moments as
+    abjad.iterate_vertical_moments().
+    """
+
+    score = _make_score()
+    abjad.detach(enums.INTERMITTENT, score["Music.2"])
+    baca.pitches(score["Music.2"], "C5 E3 <F4 A5> Bb2")
+    leaves = abjad.select.leaves(score["Music.1"])
+    abjad.attach(abjad.BeforeGraceContainer("c'16 e'16"), leaves[4])
+    abjad.attach(enums.HIDDEN, leaves[6])
+    abjad.attach(enums.ALLOW_OCTAVE, leaves[9])
+    violators = []
+    for vertical_moment in abjad.iterate_vertical_moments(score):
+        pleaves = [
+            _
+            for _ in vertical_moment.leaves
+            if isinstance(_, abjad.Note | abjad.Chord)
+            and not abjad.get.has_indicator(_, enums.HIDDEN)
+        ]
+        pitch_classes = [_.pitch_class for _ in abjad.iterate.pitches(pleaves)]
+        if len(set(pitch_classes)) == len(pitch_classes):
+            continue
+        if any(abjad.get.has_indicator(_, enums.ALLOW_OCTAVE) for _ in pleaves):
+            continue
+        violators.append(pleaves)
+    assert violators
+    assert baca.section._find_octaves(score) == violators
+
+
+def test_section_06():
+    """
+    baca.array.VerticalSliceIndex.moments() gives same offsets and leaves as
+    abjad.iterate_vertical_moments(); index passed in gives same octaves.
+    """
+
+    score = _make_score()
+    leaves = abjad.select.leaves(score["Music.1"])
+    abjad.attach(abjad.BeforeGraceContainer("c'16 e'16"), leaves[4])
+    abjad.attach(abjad.AfterGraceContainer("f'16 g'16"), leaves[8])
+    abjad.on_beat_grace_container("g16 a16", leaves[14:16])
+    index = baca.array.VerticalSliceIndex(score)
+    moments = list(abjad.iterate_vertical_moments(score))
+    slices = list(index.moments())
+    assert [_.start_offset for _ in slices] == [_.offset for _ in moments]
+    for slice_, moment in zip(slices, moments):
+        assert set(slice_.leaves) == set(moment.leaves)
+        assert index.get(moment.offset) is slice_
+    assert baca.section._find_octaves(score, index) == baca.section._find_octaves(score)
+
+
+def test_section_07():
+    """
+    baca.section._check_wellformedness() reports same violators as abjad.wf.
+    """
+
+    score = _make_score()
+    leaves = abjad.select.leaves(score["Music.1"])
+    abjad.attach(abjad.Clef("alto"), leaves[3])
+    abjad.attach(abjad.Clef("bass"), leaves[6], deactivate=True, tag=abjad.Tag("X"))
+    abjad.attach(abjad.Clef("percussion"), leaves[9])
+    abjad.attach(enums.ALLOW_OUT_OF_RANGE, leaves[4])
+    count, message = abjad.wf.tabulate_wellformedness(
+        score, check_out_of_range_pitches=False
+    )
+    assert count
+    with pytest.raises(Exception) as exception:
+        baca.section._check_wellformedness(score)
+    assert str(exception.value) == "\n" + message
+    table = baca.section._StateTable(score)
+    violators = baca.section._check_notes_on_wrong_clef(score, table)
+    assert violators == abjad.wf.check_notes_on_wrong_clef(score)
+    violators = baca.section._check_out_of_range_pitches(score, table)
+    allow_indicators = (enums.ALLOW_OUT_OF_RANGE, enums.HIDDEN)
+    assert violators == abjad.wf.check_out_of_range_pitches(
+        score, allow_indicators=allow_indicators
+    )
+    assert violators[0]
+
+
+def test_section_08():
+    """
+    baca.section.TempoMap sums measure durations in seconds; restarts and
+    fermatas change clock time as they do in clock-time labels; imprecise metronome
+    mark before restart raises missing metronome mark error.
+    """
+
+    global_context = baca.score.make_global_context()
+    score = abjad.Score([global_context], name="Score")
+    time_signatures = baca.section.wrap([(4, 8), (3, 8)] * 5)
+    baca.section.set_up_score(score, time_signatures())
+    skips = baca.select.skips(score["Skips"])
+    abjad.attach(abjad.MetronomeMark(abjad.Duration(1, 4), 60), skips[0])
+    abjad.attach(abjad.MetronomeMark(abjad.Duration(1, 8), 90), skips[4])
+    tempo_map = baca.section.TempoMap(skips)
+    seconds = abjad.Duration(0)
+    for measure_number, skip in enumerate(skips, start=1):
+        assert tempo_map.measure_seconds(measure_number) == seconds
+        offset = abjad.get.timespan(skip).start_offset
+        assert tempo_map.offset_seconds(offset) == seconds
+        seconds += abjad.get.duration(skip, in_seconds=True)
+    assert tempo_map.total_seconds() == seconds
+    assert tempo_map.offset_seconds(abjad.Offset(1, 8)) == abjad.Duration(1, 2)
+    assert tempo_map.get_time_signature(2) == abjad.TimeSignature((3, 8))
+    abjad.attach(baca.enums.CLOCK_TIME_RESTART, skips[6])
+    tempo_map = baca.section.TempoMap(
+        skips, fermata_durations={2: 5}, start_clock_time="1'00''"
+    )
+    assert tempo_map.measure_seconds(1) == 60
+    assert tempo_map.measure_seconds(3) == 60 + 2 + 5
+    assert tempo_map.measure_seconds(7) == 0
+    with pytest.raises(IndexError):
+        tempo_map.measure_seconds(12)
+    score = abjad.Score([baca.score.make_global_context()], name="Score")
+    baca.section.set_up_score(score, baca.section.wrap([(4, 4)] * 4)())
+    skips = baca.select.skips(score["Skips"])
+    abjad.attach(abjad.MetronomeMark(abjad.Duration(1, 4), 60), skips[0])
+    abjad.attach(abjad.MetronomeMark(textual_indication="Lento"), skips[1])
+    abjad.attach(abjad.MetronomeMark(abjad.Duration(1, 4), 60), skips[2])
+    abjad.attach(baca.enums.CLOCK_TIME_RESTART, skips[2])
+    rests = abjad.select.rests(score["Rests"])
+    with pytest.raises(abjad.MissingMetronomeMarkError):
+        baca.section._calculate_clock_times(None, [], 1, None, skips, rests)
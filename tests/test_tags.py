@@ -0,0 +1,223 @@
+import os
+import pathlib
+import random
+import subprocess
+import sys
+
+import abjad
+import baca
+import pytest
+
+TAG_STRINGS = (
+    "+SCORE",
+    "-PARTS",
+    "+PARTS",
+    "-SCORE",
+    "FERMATA_MEASURE:MEASURE_4",
+    "SHIFTED_CLEF:MEASURE_5",
+    "NOT_MOL:MEASURE_8",
+    "ONLY_MOL:MEASURE_9",
+    "SHOW_TO_JOIN_BROKEN_SPANNERS",
+    "HIDE_TO_JOIN_BROKEN_SPANNERS",
+    "EXPLICIT_CLEF_COLOR",
+    "MUSIC_ANNOTATION",
+    "ANCHOR_NOTE",
+    "METRIC_MODULATION_IS_STRIPPED",
+)
+
+
+def _make_text(seed):
+    rng = random.Random(seed)
+    lines = []
+    for i in range(400):
+        for _ in range(rng.choice((0, 1, 1, 2))):
+            lines.append(f"    %! {rng.choice(TAG_STRINGS)}\n")
+        line = rng.choice(
+            (
+                f"    c'{i}\n",
+                f"%%% c'{i}\n",
+                f"    - \\tweak color #red ^ \\markup {i} %@%\n",
+                f"    %@% - \\tweak color #red ^ \\markup {i}\n",
+            )
+        )
+        lines.append(line)
+    return "".join(lines)
+
+
+def _handle_tags(text, messages):
+    bol_measure_numbers = [1, 5, 9]
+    text = baca.tags.handle_edition_tags(text, messages, "_sections", "SCORE")
+    text = baca.tags.handle_fermata_bar_lines(text, messages, bol_measure_numbers, 12)
+    text = baca.tags.handle_shifted_clefs(text, messages, bol_measure_numbers)
+    text = baca.tags.handle_mol_tags(text, messages, bol_measure_numbers, 12)
+    text = baca.tags.color_persistent_indicators(text, messages, True, undo=True)
+    text = baca.tags.show_music_annotations(text, messages, undo=True)
+    text = baca.tags.join_broken_spanners(text, messages)
+    text = baca.tags.show_tag(
+        text, baca.tags.ANCHOR_NOTE, messages, prepend_empty_chord=True, undo=True
+    )
+    text = baca.tags.show_tag(text, baca.tags.ANCHOR_NOTE, messages)
+    text = baca.tags.show_tag(
+        text, baca.tags.METRIC_MODULATION_IS_STRIPPED, messages, undo=True
+    )
+    return text
+
+
+def test_tags_01():
+    """
+    baca.tags.TagPipeline gives same text and messages as sequential passes.
+    """
+
+    for seed in range(8):
+        text = _make_text(seed)
+        messages = []
+        sequential_text = _handle_tags(text, messages)
+        pipeline_messages = []
+        pipeline = baca.tags.TagPipeline(text)
+        pipeline = _handle_tags(pipeline, pipeline_messages)
+        assert isinstance(pipeline, baca.tags.TagPipeline)
+        assert pipeline.run() == sequential_text
+        assert pipeline_messages == messages
+        assert sequential_text != text
+
+
+def test_tags_02():
+    """
+    baca.tags.TagPipeline falls back to sequential passes when a rule changes a line
+    into a tag line.
+    """
+
+    text = "    %! RED\n%%% %! BLUE\n    %! BLUE\n%%% c'4\n"
+    messages = []
+    sequential_text = baca.tags.show_tag(text, abjad.Tag("RED"), messages)
+    sequential_text = baca.tags.show_tag(sequential_text, abjad.Tag("BLUE"), messages)
+    pipeline_messages = []
+    pipeline = baca.tags.TagPipeline(text)
+    pipeline = baca.tags.show_tag(pipeline, abjad.Tag("RED"), pipeline_messages)
+    pipeline = baca.tags.show_tag(pipeline, abjad.Tag("BLUE"), pipeline_messages)
+    assert pipeline.run() == sequential_text
+    assert pipeline_messages == messages
+
+
+def test_tags_03(tmp_path):
+    """
+    baca.path.activate() and baca.path.deactivate() give same text and counts with
+    tag index as abjad.activate() and abjad.deactivate() without; same-size rewrites
+    with unchanged modification time make index stale; index of file unchanged for
+    longer than racy window carries no content hash.
+    """
+
+    path = tmp_path / "music.ly"
+    for seed in range(8):
+        text = _make_text(seed)
+        path.write_text(text)
+        baca.tags.write_tag_index(path)
+        for string in TAG_STRINGS[:6]:
+            tag = abjad.Tag(string)
+            for undo in (False, True):
+                if undo:
+                    text, count, skipped = abjad.deactivate(text, tag)
+                    result = baca.path.deactivate(path, tag)
+                else:
+                    text, count, skipped = abjad.activate(text, tag)
+                    result = baca.path.activate(path, tag)
+                assert result[:2] == (count, skipped)
+                assert path.read_text() == text
+        index = baca.tags.get_tag_index(path)
+        index.digest, index.mtime_ns, index.size = "", 0, 0
+        assert index == baca.tags.TagIndex.from_text(text)
+    path.write_text("    %! RED\n%%% c'4\n")
+    assert baca.path.activate(path, abjad.Tag("RED"))[:2] == (1, 0)
+    assert path.read_text() == "    %! RED\n    c'4\n"
+    path.write_text("    %! RED\n%%% c'4\n%%% d'4\n")
+    baca.tags.write_tag_index(path)
+    stat = path.stat()
+    path.write_text("%%% c'4\n    %! RED\n%%% d'4\n")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert baca.path.activate(path, abjad.Tag("RED"))[:2] == (1, 0)
+    assert path.read_text() == "%%% c'4\n    %! RED\n    d'4\n"
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - 3_600_000_000_000))
+    index = baca.tags.write_tag_index(path)
+    assert index.digest == ""
+    assert index.is_fresh(path)
+    path.write_text("%%% c'4\n    %! RED\n    d'4\n    e'4\n")
+    assert not index.is_fresh(path)
+
+
+def test_tags_04():
+    """
+    baca.tags.TagQuery gives same results as predicates on tag strings, also for
+    tags interned after query construction.
+    """
+
+    query = baca.tags.any_of("+SCORE", "+PARTS") & ~baca.tags.prefix("-")
+    query |= baca.tags.all_of("RED", "BLUE") & baca.tags.none_of("GREEN")
+    strings = ["+SCORE", "+PARTS", "-SCORE", "RED", "BLUE", "GREEN", "-NEW_TAG"]
+    generator = random.Random(0)
+    for _ in range(500):
+        tags = [
+            abjad.Tag(_) for _ in generator.sample(strings, generator.randint(0, 4))
+        ]
+        strings_ = [_.string for _ in tags]
+        result = (
+            any(_ in ("+SCORE", "+PARTS") for _ in strings_)
+            and not any(_.startswith("-") for _ in strings_)
+        ) or ("RED" in strings_ and "BLUE" in strings_ and "GREEN" not in strings_)
+        assert query(tags) is result
+
+
+def test_tags_05(tmp_path):
+    """
+    baca.tags.TagPipeline.from_path() streams same text and messages as sequential
+    passes; failed run leaves file and no temporary file behind.
+    """
+
+    def show_red_and_blue(text, messages):
+        text = baca.tags.show_tag(text, abjad.Tag("RED"), messages)
+        return baca.tags.show_tag(text, abjad.Tag("BLUE"), messages)
+
+    path = tmp_path / "music.ly"
+    pairs = [(_make_text(_), _handle_tags) for _ in range(4)]
+    pairs.append(("    %! RED\n%%% %! BLUE\n    %! BLUE\n%%% c'4\n", show_red_and_blue))
+    for text, handle_tags in pairs:
+        messages = []
+        sequential_text = handle_tags(text, messages)
+        path.write_text(text)
+        pipeline_messages = []
+        pipeline = baca.tags.TagPipeline.from_path(path)
+        pipeline = handle_tags(pipeline, pipeline_messages)
+        assert pipeline.run() is None
+        assert path.read_text() == sequential_text
+        assert pipeline_messages == messages
+
+    def match(tags):
+        raise Exception("crash")
+
+    pipeline = baca.tags.TagPipeline.from_path(path)
+    pipeline = baca.tags.show_tag(pipeline, "crash", [], match=match)
+    with pytest.raises(Exception):
+        pipeline.run()
+    assert path.read_text() == sequential_text
+    assert [_.name for _ in tmp_path.iterdir()] == ["music.ly"]
+
+
+def test_tags_06(tmp_path):
+    """
+    baca.tags.TagPipeline.from_path() falls back to one pass per rule under
+    python -O.
+    """
+
+    path = tmp_path / "music.ly"
+    path.write_text("    %! RED\n%%% %! BLUE\n    %! BLUE\n%%% c'4\n")
+    script = (
+        "import pathlib, abjad, baca\n"
+        f"pipeline = baca.tags.TagPipeline.from_path(pathlib.Path({str(path)!r}))\n"
+        "pipeline = baca.tags.show_tag(pipeline, abjad.Tag('RED'), [])\n"
+        "pipeline = baca.tags.show_tag(pipeline, abjad.Tag('BLUE'), [])\n"
+        "pipeline.run()\n"
+    )
+    baca_directory = pathlib.Path(baca.__file__).parent.parent
+    environment = dict(os.environ, PYTHONPATH=str(baca_directory))
+    subprocess.run([sys.executable, "-O", "-c", script], check=True, env=environment)
+    assert path.read_text() == "    %! RED\n    %! BLUE\n    %! BLUE\n    c'4\n"